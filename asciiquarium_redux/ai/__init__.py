@@ -2,16 +2,20 @@
 
 This package implements a tiny, dependency-free Utility AI and steering
 behaviors used to provide more lifelike fish movement. It is entirely
-optional and enabled via configuration/CLI flags. All randomness flows
-through Python's built-in random module so runs are reproducible when a
-seed is provided.
+optional and enabled via configuration/CLI flags. Each brain draws from its
+own ``random.Random``, seeded from its fish's stream (see ``util.rng``), so
+runs are reproducible when a seed is provided regardless of update order.
 
 Public modules:
  - vector: Minimal 2D vector operations
  - noise: Leaky integrator noise used for smooth wander
- - steering: Seek/flee/align/cohere/separate/avoid/wander primitives
+ - steering: Seek/flee/align/cohere/separate/avoid/wander primitives, plus
+   allocation-free scalar ``*_xy`` kernels used on the hot path
  - utility: Softmax-based action selection
  - brain: FishBrain that orchestrates sensing → action → steering
+ - world: Per-frame WorldSnapshot (flake grid, predators, fish index) for sensing
+ - parallel: Optional worker-process pool that runs brains over shared memory
+ - bench: Per-brain steering microbenchmark (``python -m asciiquarium_redux.ai.bench``)
 """
 
 from .vector import Vec2
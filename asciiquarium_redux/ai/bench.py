@@ -0,0 +1,135 @@
+"""Microbenchmark for per-brain steering cost.
+
+Run with ``python -m asciiquarium_redux.ai.bench [--neighbors N] [--number N]``.
+
+Compares the Vec2 steering primitives (one allocation per intermediate result)
+with the scalar ``*_xy`` kernels used by FishBrain, on the same flocking
+workload: align + cohere + separate + avoid + compose for a single brain.
+It also reports the full ``FishBrain.update`` cost against a synthetic sense.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+from typing import Iterable, List, Tuple
+
+from .brain import FishBrain
+from .steering import (
+    SteeringConfig,
+    align,
+    cohere,
+    separate,
+    avoid,
+    compose_velocity,
+    align_xy,
+    cohere_xy,
+    separate_xy,
+    avoid_xy,
+    compose_velocity_xy,
+)
+from .vector import Vec2
+
+
+class _SyntheticSense:
+    """Fixed world used to time FishBrain.update in isolation."""
+
+    def __init__(self, neighbors: List[Tuple[int, Vec2, Vec2]], obstacles: List[Vec2]):
+        self._neighbors = neighbors
+        self._obstacles = obstacles
+
+    def nearest_food(self, fish_id: int) -> Tuple[Vec2, float]:
+        return (Vec2(0.0, 0.0), float("inf"))
+
+    def predator_vector(self, fish_id: int) -> Tuple[Vec2, float]:
+        return (Vec2(0.0, 0.0), float("inf"))
+
+    def nearest_prey(self, fish_id: int) -> Tuple[Vec2, float]:
+        return (Vec2(0.0, 0.0), float("inf"))
+
+    def neighbors(self, fish_id: int, radius_cells: float) -> Iterable[Tuple[int, Vec2, Vec2]]:
+        return self._neighbors
+
+    def obstacles(self, fish_id: int, radius_cells: float) -> Iterable[Vec2]:
+        return self._obstacles
+
+    def shelters(self) -> Iterable[Vec2]:
+        return ()
+
+    def bounds(self) -> Tuple[int, int]:
+        return (120, 40)
+
+    def size_of(self, fish_id: int) -> int:
+        return 3
+
+    def species_of(self, fish_id: int) -> int:
+        return 0
+
+
+def _world(n: int, seed: int = 1) -> Tuple[List[Tuple[int, Vec2, Vec2]], List[Vec2]]:
+    rng = random.Random(seed)
+    neigh = [
+        (i, Vec2(rng.uniform(-3.0, 3.0), rng.uniform(-3.0, 3.0)), Vec2(rng.uniform(-2.0, 2.0), rng.uniform(-0.5, 0.5)))
+        for i in range(1, n + 1)
+    ]
+    obstacles = [Vec2(rng.uniform(-3.0, 3.0), rng.uniform(-3.0, 3.0)) for _ in range(3)]
+    return neigh, obstacles
+
+
+def _flock_vec2(pos: Vec2, vel: Vec2, neigh, obstacles, cfg: SteeringConfig) -> Vec2:
+    neigh_pos = [p for _, p, _ in neigh]
+    neigh_vel = [v for _, _, v in neigh]
+    return compose_velocity(
+        vel,
+        [
+            (align(vel, neigh_vel), cfg.align_weight),
+            (cohere(pos, neigh_pos), cfg.cohere_weight),
+            (separate(pos, neigh_pos, cfg.separation_radius), cfg.separate_weight),
+            (avoid(pos, obstacles, cfg.obstacle_radius), cfg.avoid_weight),
+        ],
+        cfg.max_speed,
+        cfg.max_force,
+    )
+
+
+def _flock_xy(pos: Vec2, vel: Vec2, neigh, obstacles, cfg: SteeringConfig) -> Vec2:
+    px, py = pos.x, pos.y
+    ax, ay = align_xy(v for _, _, v in neigh)
+    cx, cy = cohere_xy(px, py, (p for _, p, _ in neigh))
+    sx, sy = separate_xy(px, py, (p for _, p, _ in neigh), cfg.separation_radius)
+    ox, oy = avoid_xy(px, py, obstacles, cfg.obstacle_radius)
+    fx = ax * cfg.align_weight + cx * cfg.cohere_weight + sx * cfg.separate_weight + ox * cfg.avoid_weight
+    fy = ay * cfg.align_weight + cy * cfg.cohere_weight + sy * cfg.separate_weight + oy * cfg.avoid_weight
+    return Vec2(*compose_velocity_xy(vel.x, vel.y, fx, fy, cfg.max_speed, cfg.max_force))
+
+
+def run(neighbors: int = 8, number: int = 20000) -> None:
+    cfg = SteeringConfig()
+    neigh, obstacles = _world(neighbors)
+    pos, vel = Vec2(0.0, 0.0), Vec2(1.0, 0.1)
+    a = _flock_vec2(pos, vel, neigh, obstacles, cfg)
+    b = _flock_xy(pos, vel, neigh, obstacles, cfg)
+    if abs(a.x - b.x) > 1e-9 or abs(a.y - b.y) > 1e-9:
+        raise SystemExit(f"kernel mismatch: {a} != {b}")
+    t_vec = min(timeit.repeat(lambda: _flock_vec2(pos, vel, neigh, obstacles, cfg), number=number, repeat=3))
+    t_xy = min(timeit.repeat(lambda: _flock_xy(pos, vel, neigh, obstacles, cfg), number=number, repeat=3))
+    brain = FishBrain(fish_id=0, rng=random.Random(0), sense=_SyntheticSense(neigh, obstacles), config=cfg)
+    t_brain = min(timeit.repeat(lambda: brain.update(0.05, pos, vel), number=number, repeat=3))
+    us = 1e6 / number
+    print(f"neighbors={neighbors} number={number}")
+    print(f"  steering (Vec2)    {t_vec * us:8.2f} us/brain")
+    print(f"  steering (scalar)  {t_xy * us:8.2f} us/brain  ({t_vec / max(t_xy, 1e-12):.2f}x)")
+    print(f"  FishBrain.update   {t_brain * us:8.2f} us/brain")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Per-brain steering microbenchmark")
+    parser.add_argument("--neighbors", type=int, default=8)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args(argv)
+    run(args.neighbors, args.number)
+
+
+if __name__ == "__main__":
+    main()
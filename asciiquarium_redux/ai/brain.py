@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, Tuple, Optional, Protocol
+from math import hypot
+from typing import Any, Dict, Iterable, Tuple, Optional, Protocol
 import random as _random
 from .vector import Vec2
 from .noise import LeakyNoise
 from .steering import (
     SteeringConfig,
-    seek,
-    align as st_align,
-    cohere as st_cohere,
-    separate as st_separate,
-    avoid as st_avoid,
-    wander as st_wander,
-    compose_velocity,
+    seek_xy,
+    align_xy,
+    cohere_xy,
+    separate_xy,
+    avoid_xy,
+    wander_xy,
+    compose_velocity_xy,
 )
 from .utility import UtilitySelector
 
@@ -28,6 +29,9 @@ class WorldSense(Protocol):
     def shelters(self) -> Iterable[Vec2]: ...
     def size_of(self, fish_id: int) -> int: ...
     def species_of(self, fish_id: int) -> int: ...
+    # Optional cheap cues used by the re-plan scheduler (looked up with getattr)
+    # def food_epoch(self) -> int: ...
+    # def predator_near(self, x: float, y: float, radius_cells: float) -> bool: ...
 
 
 @dataclass
@@ -66,12 +70,46 @@ class FishBrain:
     last_action: Optional[str] = None
     # Cooldown timer controlling how often AI may request a turn
     turn_cooldown: float = 0.0
+    # Re-plan scheduling: full sense/select/steer runs every `replan_frames` updates.
+    # `replan_phase` staggers brains so only ~1/K of them plan on any given frame.
+    replan_frames: int = 1
+    replan_phase: int = 0
+    urgent_radius: float = 8.0
+    _replan_in: int = field(init=False, default=0)
+    _phase_delay: int = field(init=False, default=0)
+    _force: Tuple[float, float] = field(init=False, default=(0.0, 0.0))
+    _food_epoch: int = field(init=False, default=-1)
 
     def __post_init__(self) -> None:
         a = max(1e-3, min(5.0, float(self.wander_tau)))
         # Convert tau to alpha approximately: alpha = dt/tau; we apply per-tick externally, so keep as fraction
         self._noise = LeakyNoise(self.rng, alpha=1.0 / a)
         self._selector = UtilitySelector(self.rng, temperature=self.util_temp)
+        # First plan happens immediately; later plans land on this brain's phase slot
+        self._replan_in = 0
+        self._phase_delay = int(self.replan_phase) % max(1, int(self.replan_frames))
+
+    def _needs_replan(self, pos: Vec2) -> bool:
+        """Return True when this update must run a full plan.
+
+        Plans are due every `replan_frames` updates; new food or a predator
+        within `urgent_radius` trigger one immediately.
+        """
+        k = max(1, int(self.replan_frames))
+        due = self._replan_in <= 0
+        self._replan_in -= 1
+        if k <= 1 or due:
+            return True
+        try:
+            epoch_fn = getattr(self.sense, "food_epoch", None)
+            if epoch_fn is not None and int(epoch_fn()) != self._food_epoch:
+                return True
+            near_fn = getattr(self.sense, "predator_near", None)
+            if near_fn is not None and near_fn(pos.x, pos.y, self.urgent_radius):
+                return True
+        except Exception:
+            pass
+        return False
 
     def update(
         self,
@@ -79,6 +117,41 @@ class FishBrain:
         pos: Vec2,
         vel: Vec2,
     ) -> Vec2:
+        if self._needs_replan(pos):
+            k = max(1, int(self.replan_frames))
+            # After the first plan, wait out the stagger slot once so brains spread evenly
+            self._replan_in = k - 1 + self._phase_delay
+            self._phase_delay = 0
+            try:
+                epoch_fn = getattr(self.sense, "food_epoch", None)
+                if epoch_fn is not None:
+                    self._food_epoch = int(epoch_fn())
+            except Exception:
+                pass
+            self._force, eaten = self._plan(dt, pos, vel)
+        else:
+            # Between plans reuse the cached steering force and last_action
+            eaten = 0.0
+        fx, fy = self._force
+        # Integrate force into velocity (clamped)
+        # Slightly reduce max force to smooth movements
+        nvx, nvy = compose_velocity_xy(
+            vel.x,
+            vel.y,
+            fx,
+            fy,
+            self.config.max_speed * 0.9,
+            self.config.max_force * 0.85,
+        )
+        # Update hunger dynamics
+        self.hunger = max(0.0, min(1.0, self.hunger + 0.03 * dt - eaten * 0.5))
+        return Vec2(nvx, nvy)
+
+    def _plan(self, dt: float, pos: Vec2, vel: Vec2) -> Tuple[Tuple[float, float], float]:
+        """Sense, select an action and accumulate its steering force.
+
+        Returns the force and whether food was eaten (1.0) during this plan.
+        """
         # Sense
         dir_food, dist_food = self.sense.nearest_food(self.fish_id)
         dir_pred, dist_pred = self.sense.predator_vector(self.fish_id)
@@ -102,7 +175,6 @@ class FishBrain:
         # Distance normalization relative to tank size so food is attractive from most of the tank
         try:
             bw, bh = self.sense.bounds()
-            from math import hypot
             diag = max(1.0, hypot(float(bw), float(bh)))
         except Exception:
             diag = 100.0
@@ -152,27 +224,40 @@ class FishBrain:
         action, _ = self._selector.softmax_choice(utilities)
         # remember last action for external policies
         self.last_action = action
-        # Compose steering
-        components: list[tuple[Vec2, float]] = []
+        # Compose steering: forces are accumulated as scalars, Vec2 only at the edges
+        px, py = pos.x, pos.y
+        max_speed = self.config.max_speed
+        fx = fy = 0.0
         if action == "EAT" and dist_food < float("inf"):
-            components.append((dir_food * self.eat_gain, 1.0))
+            g = self.eat_gain
+            fx += dir_food.x * g
+            fy += dir_food.y * g
         elif action == "HIDE" and dist_pred < float("inf"):
             # Prefer steering toward a shelter roughly aligned with escaping from the predator
             best_target: Optional[Vec2] = None
             best_dot = -1.0
             if shelters:
-                away = dir_pred.normalized()
+                al = hypot(dir_pred.x, dir_pred.y)
+                ax, ay = (dir_pred.x / al, dir_pred.y / al) if al > 1e-6 else (0.0, 0.0)
                 for s in shelters:
-                    to_s = (s - pos).normalized()
-                    d = max(-1.0, min(1.0, to_s.dot(away)))
+                    tx = s.x - px
+                    ty = s.y - py
+                    tl = hypot(tx, ty)
+                    d = (tx * ax + ty * ay) / tl if tl > 1e-6 else 0.0
+                    d = max(-1.0, min(1.0, d))
                     if d > best_dot:
                         best_dot = d
                         best_target = s
             if best_target is not None:
-                components.append((seek(pos, best_target, self.config.max_speed), self.hide_gain))
+                sx, sy = seek_xy(px, py, best_target.x, best_target.y, max_speed)
+                fx += sx * self.hide_gain
+                fy += sy * self.hide_gain
             else:
-                components.append((dir_pred * self.hide_gain, 1.0))
-            components.append((st_avoid(pos, obstacles, self.config.obstacle_radius), 0.7))
+                fx += dir_pred.x * self.hide_gain
+                fy += dir_pred.y * self.hide_gain
+            ox, oy = avoid_xy(px, py, obstacles, self.config.obstacle_radius)
+            fx += ox * 0.7
+            fy += oy * 0.7
         elif action == "FLOCK":
             # Only flock with same-species neighbors if we can identify them
             if my_species != -1:
@@ -186,11 +271,22 @@ class FishBrain:
                 neigh_use = filtered
             else:
                 neigh_use = neigh
-            neigh_pos = [p for _, p, _ in neigh_use]
-            neigh_vel = [v for _, _, v in neigh_use]
-            components.append((st_align(vel, neigh_vel), self.flock_alignment))
-            components.append((st_cohere(pos, neigh_pos), self.flock_cohesion))
-            components.append((st_separate(pos, neigh_pos, self.config.separation_radius), self.flock_separation))
+            if neigh_use:
+                w = self.flock_alignment
+                if w != 0.0:
+                    ax, ay = align_xy(v for _, _, v in neigh_use)
+                    fx += ax * w
+                    fy += ay * w
+                w = self.flock_cohesion
+                if w != 0.0:
+                    cx, cy = cohere_xy(px, py, (p for _, p, _ in neigh_use))
+                    fx += cx * w
+                    fy += cy * w
+                w = self.flock_separation
+                if w != 0.0:
+                    sx, sy = separate_xy(px, py, (p for _, p, _ in neigh_use), self.config.separation_radius)
+                    fx += sx * w
+                    fy += sy * w
         elif action == "CHASE":
             # Seek a similarly-sized neighbor (playful chase)
             try:
@@ -216,37 +312,87 @@ class FishBrain:
                     ns = my_sz
                 # Similar size within +-1 row
                 if abs(ns - my_sz) <= 1:
-                    d2 = (p.x - pos.x) ** 2 + (p.y - pos.y) ** 2
+                    d2 = (p.x - px) ** 2 + (p.y - py) ** 2
                     if d2 < best_d2:
                         best_d2 = d2
                         peer_pos = p
             if peer_pos is not None:
-                components.append((seek(pos, peer_pos, self.config.max_speed), self.chase_gain))
+                sx, sy = seek_xy(px, py, peer_pos.x, peer_pos.y, max_speed)
+                fx += sx * self.chase_gain
+                fy += sy * self.chase_gain
             else:
                 # Fallback to explore if no peer found
-                w = st_wander(self._noise.step(), self.config.max_speed)
-                components.append((w, 0.5))
+                wx, wy = wander_xy(self._noise.step(), max_speed)
+                fx += wx * 0.5
+                fy += wy * 0.5
         elif action == "IDLE":
             # Apply a small braking force to linger around current spot
-            components.append((Vec2(-vel.x, -vel.y), 0.6))
+            fx -= vel.x * 0.6
+            fy -= vel.y * 0.6
             # Add tiny wander to avoid perfect stillness
-            components.append((st_wander(self._noise.step(), self.config.max_speed), 0.1))
+            wx, wy = wander_xy(self._noise.step(), max_speed)
+            fx += wx * 0.1
+            fy += wy * 0.1
         elif action == "EXPLORE":
-            w = st_wander(self._noise.step(), self.config.max_speed * 0.7)
-            components.append((w, 0.5))
+            wx, wy = wander_xy(self._noise.step(), max_speed * 0.7)
+            fx += wx * 0.5
+            fy += wy * 0.5
         # Baselines always on
-        neigh_pos = [p for _, p, _ in neigh]
-        components.append((st_separate(pos, neigh_pos, self.config.separation_radius), self.baseline_separation))
-        components.append((st_avoid(pos, obstacles, self.config.obstacle_radius), self.baseline_avoid))
-        # Integrate force into velocity (clamped)
-        # Slightly reduce max force to smooth movements
-        new_vel = compose_velocity(
-            vel,
-            components,
-            self.config.max_speed * 0.9,
-            self.config.max_force * 0.85,
-        )
-        # Update hunger dynamics
+        if neigh and self.baseline_separation != 0.0:
+            sx, sy = separate_xy(px, py, (p for _, p, _ in neigh), self.config.separation_radius)
+            fx += sx * self.baseline_separation
+            fy += sy * self.baseline_separation
+        if obstacles and self.baseline_avoid != 0.0:
+            ox, oy = avoid_xy(px, py, obstacles, self.config.obstacle_radius)
+            fx += ox * self.baseline_avoid
+            fy += oy * self.baseline_avoid
         eaten = 1.0 if (action == "EAT" and dist_food < 1.2) else 0.0
-        self.hunger = max(0.0, min(1.0, self.hunger + 0.03 * dt - eaten * 0.5))
-        return new_vel
+        return (fx, fy), eaten
+
+
+def _float_setting(settings: Any, name: str, default: float) -> float:
+    try:
+        return float(getattr(settings, name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def brain_params(settings: Any) -> Dict[str, Any]:
+    """Brain and steering parameters from settings, as plain data.
+
+    Kept separate from ``build_brain`` so the parallel AI stage can ship the
+    same parameters to its worker processes.
+    """
+    g = _float_setting
+    return {
+        "steering": {
+            "separation_radius": g(settings, "ai_separation_radius", 3.0),
+            "obstacle_radius": g(settings, "ai_obstacle_radius", 3.0),
+            "align_weight": g(settings, "ai_flock_alignment", 0.8),
+            "cohere_weight": g(settings, "ai_flock_cohesion", 0.5),
+            "separate_weight": g(settings, "ai_flock_separation", 1.2),
+            "avoid_weight": g(settings, "ai_baseline_avoid", 0.9),
+            "wander_weight": g(settings, "ai_explore_gain", 0.6),
+        },
+        "brain": {
+            "util_temp": g(settings, "ai_action_temperature", 0.6),
+            "wander_tau": g(settings, "ai_wander_tau", 1.2),
+            "eat_gain": g(settings, "ai_eat_gain", 1.2),
+            "hide_gain": g(settings, "ai_hide_gain", 1.5),
+            "flock_alignment": g(settings, "ai_flock_alignment", 0.8),
+            "flock_cohesion": g(settings, "ai_flock_cohesion", 0.5),
+            "flock_separation": g(settings, "ai_flock_separation", 1.2),
+            "baseline_separation": g(settings, "ai_baseline_separation", 0.6),
+            "baseline_avoid": g(settings, "ai_baseline_avoid", 0.9),
+            "replan_frames": max(1, int(getattr(settings, "ai_replan_frames", 1))),
+            "urgent_radius": g(settings, "ai_urgent_radius", 8.0),
+        },
+    }
+
+
+def build_brain(fish_id: int, rng: _random.Random, sense: WorldSense, max_speed: float, params: Dict[str, Any]) -> FishBrain:
+    """Construct a FishBrain for a fish with the given top speed."""
+    cfg = SteeringConfig(max_speed=max_speed, max_force=max_speed, **params["steering"])
+    # Stagger re-planning with a random phase so plans spread over frames
+    phase = rng.randrange(1 << 16)
+    return FishBrain(fish_id=fish_id, rng=rng, sense=sense, config=cfg, replan_phase=phase, **params["brain"])
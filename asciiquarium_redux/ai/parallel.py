@@ -0,0 +1,507 @@
+"""Process-pool AI stage: run fish brains in worker processes.
+
+With ``ai_workers > 0`` the app hands brain updates to a pool of spawned
+worker processes instead of calling ``FishBrain.update`` per fish on the
+render thread. Each frame:
+
+1. The main process packs fish kinematics (position, velocity, size,
+   species, hunger) and the world cues brains sense (active flakes, shark
+   positions, shelters, obstacles, tank bounds, food epoch) into a
+   ``multiprocessing.shared_memory`` block of doubles.
+2. Every worker reads the block, refreshes a ``_SharedSense`` (a grid over
+   fish positions for neighbours and prey, a ``WorldSnapshot`` for flakes and
+   predators) and updates the brains it owns. Fish are partitioned by key, so
+   a brain and its RNG, noise and re-plan schedule stay in one worker for the
+   fish's whole life.
+3. Workers write velocity, action and hunger into an output block, and the
+   main process copies them onto each fish's ``RemoteBrain`` proxy.
+
+``AIBehaviorEngine`` and the eating code only see the proxy, which has the
+same ``update``/``hunger``/``last_action``/``turn_cooldown`` surface as a
+``FishBrain``. Brains sense the world as it was at the start of the frame, not
+with the positions of fish that happened to update earlier in it.
+
+Any failure (a worker dying, a timeout, shared memory unavailable) logs a
+warning, shuts the pool down and clears the proxies, so fish fall back to
+local brains on the next frame.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import random
+from array import array
+from dataclasses import dataclass
+from math import hypot
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .brain import build_brain
+from .vector import Vec2
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    from ..app import AsciiQuarium
+
+logger = logging.getLogger(__name__)
+
+ACTIONS = ("EAT", "HIDE", "FLOCK", "CHASE", "IDLE", "EXPLORE")
+_ACTION_CODE = {a: float(i) for i, a in enumerate(ACTIONS)}
+
+# Input block: header, then one row per fish, then point lists (x, y pairs)
+HEADER = 10  # n_fish, n_flakes, n_preds, n_shelters, n_obstacles, dt, bounds w, bounds h, food epoch, unused
+FISH_COLS = 11  # key, x, y, vx, vy, size, species, prey_ok, max_speed, seed, hunger
+OUT_COLS = 4  # vx, vy, action code (-1 = none), hunger
+# Seconds to wait for all workers before giving up on the pool; the first
+# step also covers spawning the interpreters and importing the package
+STEP_TIMEOUT = 2.0
+START_TIMEOUT = 30.0
+
+
+@dataclass
+class RemoteBrain:
+    """Main-process stand-in for a brain that lives in a worker.
+
+    ``update`` returns the velocity the worker computed for this frame.
+    ``hunger`` round-trips through the worker each frame, so eating on the
+    main side still lowers it; ``turn_cooldown`` is only used by the turn
+    policy on the main side and never leaves this process.
+    """
+
+    key: int
+    seed: int
+    epoch: int
+    hunger: float = 0.0
+    last_action: Optional[str] = None
+    turn_cooldown: float = 0.0
+    hunt_threshold: float = 0.8
+    fish_id: int = 0
+    _vel: Optional[Tuple[float, float]] = None
+
+    def update(self, dt: float, pos: Vec2, vel: Vec2) -> Vec2:
+        if self._vel is None:
+            return vel
+        return Vec2(self._vel[0], self._vel[1])
+
+
+class _Point:
+    __slots__ = ("x", "y", "active")
+
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+        self.active = True
+
+
+def _attach(name: str) -> "SharedMemory":
+    """Attach to an existing block without taking part in its cleanup."""
+    from multiprocessing import shared_memory
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before 3.13 attaching also registers the block, but spawned workers
+        # share the parent's resource tracker, so the parent's unlink covers it
+        return shared_memory.SharedMemory(name=name)
+
+
+class _SharedSense:
+    """WorldSense over one frame's packed input, keyed by fish key."""
+
+    def __init__(self, cell: float) -> None:
+        self.cell = max(1.0, float(cell))
+        self.index: Dict[int, int] = {}
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.vxs: List[float] = []
+        self.vys: List[float] = []
+        self.sizes: List[int] = []
+        self.species: List[int] = []
+        self.prey_ok: List[bool] = []
+        self.keys: List[int] = []
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        self._grid_bounds = (0, 0, 0, 0)
+        self._bounds = (120, 40)
+        self._shelters: List[Vec2] = []
+        self._obstacles: List[Vec2] = []
+        self._epoch = 0
+        self.world: Any = None
+
+    def load(self, data: List[float]) -> int:
+        """Refresh from a packed input block; return the fish count."""
+        from .world import WorldSnapshot
+
+        n, nf, np_, ns, no = (int(v) for v in data[0:5])
+        self._bounds = (int(data[6]), int(data[7]))
+        self._epoch = int(data[8])
+        rows = data[HEADER:HEADER + n * FISH_COLS]
+        self.keys = [int(k) for k in rows[0::FISH_COLS]]
+        self.xs = rows[1::FISH_COLS]
+        self.ys = rows[2::FISH_COLS]
+        self.vxs = rows[3::FISH_COLS]
+        self.vys = rows[4::FISH_COLS]
+        self.sizes = [int(s) for s in rows[5::FISH_COLS]]
+        self.species = [int(s) for s in rows[6::FISH_COLS]]
+        self.prey_ok = [p > 0.5 for p in rows[7::FISH_COLS]]
+        self.index = {k: i for i, k in enumerate(self.keys)}
+        c = self.cell
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for i in range(n):
+            grid.setdefault((int(self.xs[i] // c), int(self.ys[i] // c)), []).append(i)
+        self._grid = grid
+        if grid:
+            gxs = [k[0] for k in grid]
+            gys = [k[1] for k in grid]
+            self._grid_bounds = (min(gxs), min(gys), max(gxs), max(gys))
+        off = HEADER + n * FISH_COLS
+        pts = data[off:off + 2 * (nf + np_ + ns + no)]
+        flakes = [_Point(pts[j], pts[j + 1]) for j in range(0, 2 * nf, 2)]
+        off = 2 * nf
+        preds = [(pts[j], pts[j + 1]) for j in range(off, off + 2 * np_, 2)]
+        off += 2 * np_
+        self._shelters = [Vec2(pts[j], pts[j + 1]) for j in range(off, off + 2 * ns, 2)]
+        off += 2 * ns
+        self._obstacles = [Vec2(pts[j], pts[j + 1]) for j in range(off, off + 2 * no, 2)]
+        self.world = WorldSnapshot.build([], flakes, preds)
+        return n
+
+    # --- WorldSense ---
+    def bounds(self) -> Tuple[int, int]:
+        return self._bounds
+
+    def shelters(self) -> Iterable[Vec2]:
+        return self._shelters
+
+    def obstacles(self, fish_id: int, radius_cells: float) -> Iterable[Vec2]:
+        return self._obstacles
+
+    def food_epoch(self) -> int:
+        return self._epoch
+
+    def size_of(self, fish_id: int) -> int:
+        i = self.index.get(fish_id)
+        return self.sizes[i] if i is not None else 3
+
+    def species_of(self, fish_id: int) -> int:
+        i = self.index.get(fish_id)
+        return self.species[i] if i is not None else -1
+
+    def predator_near(self, x: float, y: float, radius_cells: float) -> bool:
+        _, d = self.world.nearest_predator(x, y)
+        return d <= float(radius_cells)
+
+    def nearest_food(self, fish_id: int) -> Tuple[Vec2, float]:
+        i = self.index.get(fish_id)
+        if i is None:
+            return (Vec2(0.0, 0.0), float("inf"))
+        fx, fy = self.xs[i], self.ys[i]
+        flake, d = self.world.nearest_flake(fx, fy)
+        if flake is None or d <= 1e-6:
+            return (Vec2(0.0, 0.0), d)
+        return (Vec2((flake.x - fx) / d, (flake.y - fy) / d), d)
+
+    def predator_vector(self, fish_id: int) -> Tuple[Vec2, float]:
+        i = self.index.get(fish_id)
+        if i is None:
+            return (Vec2(0.0, 0.0), float("inf"))
+        fx, fy = self.xs[i], self.ys[i]
+        pred, d = self.world.nearest_predator(fx, fy)
+        if pred is None or d <= 1e-6:
+            return (Vec2(0.0, 0.0), d)
+        return (Vec2((fx - pred[0]) / d, (fy - pred[1]) / d), d)
+
+    def neighbors(self, fish_id: int, radius_cells: float) -> List[Tuple[int, Vec2, Vec2]]:
+        me = self.index.get(fish_id)
+        if me is None:
+            return []
+        mx, my = self.xs[me], self.ys[me]
+        r = float(radius_cells)
+        r2 = r * r
+        c = self.cell
+        reach = int(r // c) + 1
+        gx, gy = int(mx // c), int(my // c)
+        out = []
+        for cx in range(gx - reach, gx + reach + 1):
+            for cy in range(gy - reach, gy + reach + 1):
+                for j in self._grid.get((cx, cy), ()):
+                    if j == me:
+                        continue
+                    dx = self.xs[j] - mx
+                    dy = self.ys[j] - my
+                    if dx * dx + dy * dy <= r2:
+                        out.append((self.keys[j], Vec2(self.xs[j], self.ys[j]), Vec2(self.vxs[j], self.vys[j])))
+        return out
+
+    def nearest_prey(self, fish_id: int) -> Tuple[Vec2, float]:
+        """Closest strictly smaller fish, found by expanding rings of grid cells."""
+        me = self.index.get(fish_id)
+        if me is None or not self._grid:
+            return (Vec2(0.0, 0.0), float("inf"))
+        mx, my = self.xs[me], self.ys[me]
+        my_h = self.sizes[me]
+        c = self.cell
+        gx, gy = int(mx // c), int(my // c)
+        lo_x, lo_y, hi_x, hi_y = self._grid_bounds
+        max_r = max(abs(gx - lo_x), abs(gx - hi_x), abs(gy - lo_y), abs(gy - hi_y))
+        best = -1
+        best_d = float("inf")
+        r = 0
+        while r <= max_r:
+            for cx in range(gx - r, gx + r + 1):
+                for cy in (range(gy - r, gy + r + 1) if cx in (gx - r, gx + r) else (gy - r, gy + r)):
+                    for j in self._grid.get((cx, cy), ()):
+                        if j == me or self.sizes[j] >= my_h or not self.prey_ok[j]:
+                            continue
+                        d = hypot(self.xs[j] - mx, self.ys[j] - my)
+                        if d < best_d:
+                            best_d = d
+                            best = j
+            if best >= 0 and best_d <= r * c:
+                break
+            r += 1
+        if best < 0:
+            return (Vec2(0.0, 0.0), float("inf"))
+        if best_d <= 1e-6:
+            return (Vec2(0.0, 0.0), best_d)
+        return (Vec2((self.xs[best] - mx) / best_d, (self.ys[best] - my) / best_d), best_d)
+
+
+def _worker_main(conn: Any, index: int, workers: int, params: Dict[str, Any]) -> None:
+    """Worker loop: own the brains whose key falls in this worker's partition."""
+    brains: Dict[int, Any] = {}
+    sense = _SharedSense(params["steering"].get("separation_radius", 3.0))
+    blocks: Dict[str, "SharedMemory"] = {}
+
+    def block(name: str) -> "SharedMemory":
+        shm = blocks.get(name)
+        if shm is None:
+            shm = blocks[name] = _attach(name)
+        return shm
+
+    try:
+        while True:
+            msg = conn.recv()
+            kind = msg[0]
+            if kind == "stop":
+                return
+            if kind == "params":
+                params = msg[1]
+                sense.cell = max(1.0, float(params["steering"].get("separation_radius", 3.0)))
+                brains.clear()
+                continue
+            _, in_name, out_name, count = msg
+            # Blocks are replaced when they grow; drop handles to the old ones
+            for stale in [k for k in blocks if k not in (in_name, out_name)]:
+                blocks.pop(stale).close()
+            in_mv = block(in_name).buf.cast("d")
+            out_mv = block(out_name).buf.cast("d")
+            try:
+                data = in_mv[:count].tolist()
+                n = sense.load(data)
+                dt = data[5]
+                seen = set()
+                for i in range(n):
+                    key = sense.keys[i]
+                    if key % workers != index:
+                        continue
+                    seen.add(key)
+                    row = HEADER + i * FISH_COLS
+                    brain = brains.get(key)
+                    if brain is None:
+                        brain = brains[key] = build_brain(
+                            key, random.Random(int(data[row + 9])), sense, data[row + 8], params
+                        )
+                    brain.hunger = data[row + 10]
+                    vel = brain.update(dt, Vec2(sense.xs[i], sense.ys[i]), Vec2(sense.vxs[i], sense.vys[i]))
+                    action = _ACTION_CODE.get(brain.last_action, -1.0)  # type: ignore[arg-type]
+                    o = i * OUT_COLS
+                    out_mv[o:o + OUT_COLS] = array("d", (vel.x, vel.y, action, brain.hunger))
+                for key in [k for k in brains if k not in seen]:
+                    del brains[key]
+            finally:
+                in_mv.release()
+                out_mv.release()
+            conn.send(("done", n))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        for shm in blocks.values():
+            try:
+                shm.close()
+            except Exception:
+                pass
+
+
+class ParallelBrains:
+    """Pool of worker processes that update fish brains each frame."""
+
+    def __init__(self, workers: int, params: Dict[str, Any]) -> None:
+        from multiprocessing import shared_memory
+
+        self.workers = max(1, int(workers))
+        self.params = params
+        # Random rather than counted: proxies restored from a snapshot taken in
+        # another process must not match this pool's brains by accident
+        self.epoch = int.from_bytes(os.urandom(6), "big")
+        self.disabled = False
+        self._started = False
+        self._keys = itertools.count(1)
+        self._shm = shared_memory
+        self._in: Optional["SharedMemory"] = None
+        self._out: Optional["SharedMemory"] = None
+        ctx = mp.get_context("spawn")
+        self._conns: List[Any] = []
+        self._procs: List[Any] = []
+        try:
+            for i in range(self.workers):
+                parent, child = ctx.Pipe()
+                p = ctx.Process(
+                    target=_worker_main, args=(child, i, self.workers, params), name=f"aq-ai-{i}", daemon=True
+                )
+                p.start()
+                child.close()
+                self._conns.append(parent)
+                self._procs.append(p)
+        except Exception:
+            self.close()
+            raise
+        atexit.register(self.close)
+
+    def _ensure(self, current: Optional["SharedMemory"], nbytes: int) -> "SharedMemory":
+        if current is not None and current.size >= nbytes:
+            return current
+        size = max(4096, nbytes * 2)
+        shm = self._shm.SharedMemory(create=True, size=size)
+        if current is not None:
+            current.close()
+            current.unlink()
+        return shm
+
+    def set_params(self, params: Dict[str, Any]) -> None:
+        """Ship new brain parameters; workers rebuild their brains from them."""
+        self.params = params
+        for conn in self._conns:
+            conn.send(("params", params))
+
+    def step(self, app: "AsciiQuarium", dt: float) -> None:
+        """Update every fish's brain in the workers; call before fish update."""
+        if self.disabled:
+            return
+        try:
+            self._step(app, dt)
+        except Exception as e:
+            logger.warning("Parallel AI stage failed, falling back to in-process brains: %s", e)
+            self.close()
+            for f in app.fish:
+                if isinstance(getattr(f, "_brain", None), RemoteBrain):
+                    f._brain = None
+
+    def _step(self, app: "AsciiQuarium", dt: float) -> None:
+        fish = app.fish
+        proxies: List[RemoteBrain] = []
+        rows = array("d")
+        for f in fish:
+            brain = f._brain
+            if not isinstance(brain, RemoteBrain) or brain.epoch != self.epoch:
+                hunger = float(getattr(brain, "hunger", 0.0)) if brain is not None else 0.0
+                brain = f._brain = RemoteBrain(
+                    key=next(self._keys),
+                    seed=(f.rng or random).getrandbits(30),
+                    epoch=self.epoch,
+                    hunger=hunger,
+                    fish_id=id(f),
+                )
+            proxies.append(brain)
+            cname = f.__class__.__name__.lower()
+            rows.extend((
+                brain.key,
+                float(f.x),
+                float(f.y),
+                float(f.vx),
+                float(f.vy),
+                int(getattr(f, "height", len(f.frames))),
+                int(getattr(f, "species_id", -1)),
+                0.0 if ("big" in cname or "special" in cname) else 1.0,
+                max(f.speed_min, f.speed_max),
+                brain.seed,
+                brain.hunger,
+            ))
+        snap = app.world_sense
+        flakes = [(float(s.x), float(s.y)) for s in snap.flakes if getattr(s, "active", True)]
+        preds = list(snap.predators)
+        shelters = [(p.x, p.y) for p in app.shelters()]
+        obstacles = [(p.x, p.y) for p in app.obstacles(0, 0.0)]
+        bw, bh = app.bounds()
+        buf = array("d", (len(fish), len(flakes), len(preds), len(shelters), len(obstacles), dt, bw, bh, app.food_epoch(), 0.0))
+        buf.extend(rows)
+        for pts in (flakes, preds, shelters, obstacles):
+            for x, y in pts:
+                buf.append(x)
+                buf.append(y)
+        count = len(buf)
+        self._in = self._ensure(self._in, count * buf.itemsize)
+        self._out = self._ensure(self._out, max(1, len(fish)) * OUT_COLS * buf.itemsize)
+        mv = self._in.buf.cast("d")
+        try:
+            mv[:count] = buf
+        finally:
+            mv.release()
+        msg = ("step", self._in.name, self._out.name, count)
+        for conn in self._conns:
+            conn.send(msg)
+        timeout = STEP_TIMEOUT if self._started else START_TIMEOUT
+        for conn in self._conns:
+            if not conn.poll(timeout):
+                raise TimeoutError(f"AI worker did not answer within {timeout:.1f}s")
+            conn.recv()
+        self._started = True
+        mv = self._out.buf.cast("d")
+        try:
+            out = mv[: len(fish) * OUT_COLS].tolist()
+        finally:
+            mv.release()
+        for i, brain in enumerate(proxies):
+            o = i * OUT_COLS
+            brain._vel = (out[o], out[o + 1])
+            code = int(out[o + 2])
+            brain.last_action = ACTIONS[code] if 0 <= code < len(ACTIONS) else None
+            brain.hunger = out[o + 3]
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory blocks."""
+        self.disabled = True
+        for conn in self._conns:
+            try:
+                conn.send(("stop",))
+            except Exception:
+                pass
+        for p in self._procs:
+            try:
+                p.join(timeout=1.0)
+                if p.is_alive():
+                    p.terminate()
+            except Exception:
+                pass
+        for conn in self._conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._conns = []
+        self._procs = []
+        for shm in (self._in, self._out):
+            if shm is not None:
+                try:
+                    shm.close()
+                    shm.unlink()
+                except Exception:
+                    pass
+        self._in = self._out = None
+        try:
+            atexit.unregister(self.close)
+        except Exception:
+            pass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from math import cos, hypot, sin
 from typing import Iterable, Tuple
 from .vector import Vec2
 
@@ -97,3 +98,106 @@ def compose_velocity(
     force = force.clamp_length(max_force)
     new_v = base_vel + force
     return new_v.clamp_length(max_speed)
+
+
+# ---------------------------------------------------------------------------
+# Scalar kernels
+#
+# The functions above build a new Vec2 for every intermediate result, which adds
+# up when dozens of brains run every frame. The ``*_xy`` variants below compute
+# the same quantities on plain floats and return ``(x, y)`` tuples so callers can
+# accumulate forces in locals. Point inputs only need ``.x``/``.y`` attributes,
+# so Vec2 values coming from the sense hooks are read in place without copies.
+# ---------------------------------------------------------------------------
+
+XY = Tuple[float, float]
+
+
+def _norm_scaled(x: float, y: float, k: float) -> XY:
+    """Return ``(x, y).normalized() * k`` without allocating a vector."""
+    length = hypot(x, y)
+    if length <= 1e-6:
+        return 0.0, 0.0
+    return x / length * k, y / length * k
+
+
+def _clamped(x: float, y: float, max_len: float) -> XY:
+    length = hypot(x, y)
+    if length <= max_len or length == 0:
+        return x, y
+    k = max_len / length
+    return x * k, y * k
+
+
+def seek_xy(px: float, py: float, tx: float, ty: float, max_speed: float) -> XY:
+    return _norm_scaled(tx - px, ty - py, max_speed)
+
+
+def flee_xy(px: float, py: float, tx: float, ty: float, max_speed: float) -> XY:
+    return _norm_scaled(px - tx, py - ty, max_speed)
+
+
+def align_xy(neighbor_vels: Iterable[Vec2]) -> XY:
+    count = 0
+    sx = sy = 0.0
+    for v in neighbor_vels:
+        sx += v.x
+        sy += v.y
+        count += 1
+    if count == 0:
+        return 0.0, 0.0
+    inv = 1.0 / count
+    return sx * inv, sy * inv
+
+
+def cohere_xy(px: float, py: float, neighbor_positions: Iterable[Vec2]) -> XY:
+    count = 0
+    sx = sy = 0.0
+    for p in neighbor_positions:
+        sx += p.x
+        sy += p.y
+        count += 1
+    if count == 0:
+        return 0.0, 0.0
+    inv = 1.0 / count
+    return sx * inv - px, sy * inv - py
+
+
+def separate_xy(px: float, py: float, neighbor_positions: Iterable[Vec2], sep_radius: float) -> XY:
+    sx = sy = 0.0
+    for p in neighbor_positions:
+        dx = px - p.x
+        dy = py - p.y
+        length = hypot(dx, dy)
+        d = max(1e-6, length)
+        if d < sep_radius and length > 1e-6:
+            k = sep_radius - d
+            sx += dx / length * k
+            sy += dy / length * k
+    return sx, sy
+
+
+# Obstacle avoidance uses the same falloff as separation
+avoid_xy = separate_xy
+
+
+def wander_xy(noise_val: float, max_speed: float) -> XY:
+    angle = noise_val * 3.14159
+    return _norm_scaled(sin(angle), 0.35 * cos(angle), max_speed)
+
+
+def compose_velocity_xy(
+    vx: float,
+    vy: float,
+    fx: float,
+    fy: float,
+    max_speed: float,
+    max_force: float,
+) -> XY:
+    """Clamp an accumulated force, add it to ``(vx, vy)`` and clamp the result.
+
+    Scalar counterpart of :func:`compose_velocity`; the weighted sum of the
+    steering components is expected to be accumulated by the caller.
+    """
+    fx, fy = _clamped(fx, fy, max_force)
+    return _clamped(vx + fx, vy + fy, max_speed)
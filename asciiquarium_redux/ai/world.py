@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from math import hypot
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class WorldSnapshot:
+    """Per-frame view of the things fish sense: food, predators and each other.
+
+    Built once per frame by the app before fish update, so the per-fish sensing
+    hooks avoid rescanning entity lists with dynamic type checks. Flakes are
+    bucketed into a coarse uniform grid for nearest queries and into an exact
+    integer-cell map for mouth contact tests. Flake objects are kept by
+    reference so flakes eaten earlier in the same frame are skipped.
+    """
+
+    cell: float = 8.0
+    fish_by_id: Dict[int, Any] = field(default_factory=dict)
+    flakes: List[Any] = field(default_factory=list)
+    predators: List[Tuple[float, float]] = field(default_factory=list)
+    _grid: Dict[Tuple[int, int], List[Any]] = field(default_factory=dict)
+    _cells: Dict[Tuple[int, int], List[Any]] = field(default_factory=dict)
+    _grid_bounds: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    @classmethod
+    def build(cls, fish: List[Any], flakes: List[Any], predators: List[Tuple[float, float]], cell: float = 8.0) -> "WorldSnapshot":
+        snap = cls(cell=max(1.0, float(cell)))
+        snap.fish_by_id = {id(f): f for f in fish}
+        snap.flakes = flakes
+        snap.predators = predators
+        c = snap.cell
+        lo_x = lo_y = hi_x = hi_y = 0
+        for i, s in enumerate(flakes):
+            x, y = float(s.x), float(s.y)
+            gx, gy = int(x // c), int(y // c)
+            snap._grid.setdefault((gx, gy), []).append(s)
+            snap._cells.setdefault((int(x), int(y)), []).append(s)
+            if i == 0:
+                lo_x, hi_x, lo_y, hi_y = gx, gx, gy, gy
+            else:
+                lo_x, hi_x = min(lo_x, gx), max(hi_x, gx)
+                lo_y, hi_y = min(lo_y, gy), max(hi_y, gy)
+        snap._grid_bounds = (lo_x, lo_y, hi_x, hi_y)
+        return snap
+
+    def nearest_flake(self, x: float, y: float) -> Tuple[Optional[Any], float]:
+        """Return the closest active flake to (x, y) and its distance (inf if none)."""
+        if not self._grid:
+            return None, float("inf")
+        c = self.cell
+        gx, gy = int(x // c), int(y // c)
+        best: Optional[Any] = None
+        best_d = float("inf")
+        # Expand square rings of cells until no unvisited ring can hold a closer flake
+        lo_x, lo_y, hi_x, hi_y = self._grid_bounds
+        max_r = max(abs(gx - lo_x), abs(gx - hi_x), abs(gy - lo_y), abs(gy - hi_y))
+        r = 0
+        while r <= max_r:
+            for cx in range(gx - r, gx + r + 1):
+                for cy in (range(gy - r, gy + r + 1) if cx in (gx - r, gx + r) else (gy - r, gy + r)):
+                    bucket = self._grid.get((cx, cy))
+                    if not bucket:
+                        continue
+                    for s in bucket:
+                        if not getattr(s, "active", True):
+                            continue
+                        d = hypot(float(s.x) - x, float(s.y) - y)
+                        if d < best_d:
+                            best_d = d
+                            best = s
+            if best is not None and best_d <= r * c:
+                break
+            r += 1
+        return best, best_d
+
+    def flake_at(self, x: int, y: int, reach: int = 1) -> Optional[Any]:
+        """Return an active flake whose cell is within `reach` columns of (x, y) on row y."""
+        if not self._cells:
+            return None
+        for dx in range(-reach, reach + 1):
+            bucket = self._cells.get((x + dx, y))
+            if bucket:
+                for s in bucket:
+                    if getattr(s, "active", True):
+                        return s
+        return None
+
+    def nearest_predator(self, x: float, y: float) -> Tuple[Optional[Tuple[float, float]], float]:
+        best: Optional[Tuple[float, float]] = None
+        best_d = float("inf")
+        for p in self.predators:
+            d = hypot(p[0] - x, p[1] - y)
+            if d < best_d:
+                best_d = d
+                best = p
+        return best, best_d
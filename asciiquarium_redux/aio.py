@@ -0,0 +1,165 @@
+"""asyncio runner for the terminal backend.
+
+``run_asyncio`` drives the same per-frame step as the blocking ``app.run``
+loop, but from coroutines on one event loop, so other in-process features
+(remote control, metrics export, streaming) can run alongside the tank as
+ordinary coroutines instead of threads:
+
+* an input task polls the Screen a few times per frame into a queue, so
+  keystrokes are picked up promptly while the frame task waits;
+* the frame task sleeps until the pacer's absolute deadline with
+  ``asyncio.sleep``, then drains input, steps the simulation and flushes;
+* ``FrameClock`` lets any coroutine ``await clock.next_frame()`` (or
+  ``async for`` over it) to run right after each flush, leaving the rest of
+  the frame budget to the loop's other tasks.
+
+Services are ``async def service(runner)`` callables passed to
+``run_asyncio``; they start once and survive terminal resizes. An exception in
+a service is logged and does not stop the tank.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Iterable, List, Optional
+
+from .app import TerminalSession, _enter_session, _frame_step
+from .util.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+Service = Callable[["AsyncRunner"], Awaitable[None]]
+
+
+class FrameClock:
+    """Awaitable frame ticks, paced by the session's FramePacer."""
+
+    def __init__(self) -> None:
+        self.frame_no = 0
+        self._waiters: List["asyncio.Future[int]"] = []
+
+    async def next_frame(self) -> int:
+        """Wait until the next frame has been flushed; returns its frame number."""
+        fut: "asyncio.Future[int]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        return await fut
+
+    def __aiter__(self) -> "FrameClock":
+        return self
+
+    async def __anext__(self) -> int:
+        return await self.next_frame()
+
+    def _publish(self, frame_no: int) -> None:
+        self.frame_no = frame_no
+        waiters, self._waiters = self._waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(frame_no)
+
+
+class _QueuedInput:
+    """``get_event`` view over events collected by the input task."""
+
+    def __init__(self) -> None:
+        self.events: Deque[Any] = deque()
+
+    def get_event(self) -> Any:
+        return self.events.popleft() if self.events else None
+
+
+class AsyncRunner:
+    """Run a TerminalSession on an asyncio loop, with attachable services."""
+
+    def __init__(self, settings: Settings, session: Optional[TerminalSession] = None, polls_per_frame: int = 4) -> None:
+        self.settings = settings
+        self.session = session if session is not None else TerminalSession()
+        self.frames = FrameClock()
+        self.polls_per_frame = max(1, int(polls_per_frame))
+        self._input = _QueuedInput()
+        self._stop = False
+
+    @property
+    def app(self) -> Any:
+        return self.session.app
+
+    def stop(self) -> None:
+        """Ask the frame loop to exit after the current frame."""
+        self._stop = True
+
+    async def _poll_input(self, screen: Any) -> None:
+        while True:
+            while True:
+                event = screen.get_event()
+                if event is None:
+                    break
+                self._input.events.append(event)
+            await asyncio.sleep(1.0 / max(1, self.settings.fps) / self.polls_per_frame)
+
+    async def run_screen(self, screen: Any) -> None:
+        """Run frames on ``screen`` until quit; raises ResizeScreenError on resize."""
+        session = self.session
+        _enter_session(session, screen, self.settings)
+        poller = None
+        if session.replayer is None:
+            # Poll through the buffer so a pipelined one can serialise input with its writes
+            poller = asyncio.create_task(self._poll_input(session.db))
+        try:
+            while not self._stop:
+                pacer = session.timing_state["pacer"] if session.timing_state else None
+                if pacer is not None:
+                    pacer.set_fps(self.settings.fps)
+                    delay = pacer.remaining()
+                    # Always yield once so services get a turn even when behind schedule
+                    await asyncio.sleep(delay)
+                    pacer.frame_started()
+                else:
+                    await asyncio.sleep(1.0 / max(1, self.settings.fps))
+                if _frame_step(session, screen, self.settings, source=self._input):
+                    return
+                self.frames._publish(int(session.timing_state["frame_no"]))
+        finally:
+            if poller is not None:
+                poller.cancel()
+            session.sync_output()
+            if not session.resizing:
+                session.close(screen)
+
+
+async def _guard(service: Service, runner: AsyncRunner) -> None:
+    try:
+        await service(runner)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning("Service %r stopped: %s", getattr(service, "__name__", service), e)
+
+
+async def run_async(settings: Settings, services: Iterable[Service] = ()) -> None:
+    """Open the terminal and run the tank plus ``services`` on the running loop."""
+    from asciimatics.screen import Screen as _RealScreen  # type: ignore
+    from asciimatics.exceptions import ResizeScreenError  # type: ignore
+
+    runner = AsyncRunner(settings)
+    tasks = [asyncio.create_task(_guard(svc, runner)) for svc in services]
+    try:
+        while True:
+            screen = _RealScreen.open()
+            try:
+                await runner.run_screen(screen)
+                break
+            except ResizeScreenError:
+                continue
+            finally:
+                screen.close()
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_asyncio(settings: Settings, services: Iterable[Service] = ()) -> None:
+    """Blocking entry point: run ``run_async`` on a fresh event loop."""
+    asyncio.run(run_async(settings, services))
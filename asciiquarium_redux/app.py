@@ -50,19 +50,25 @@ from __future__ import annotations
 import random
 import time
 import logging
-from typing import List, Dict, Tuple, Any, TYPE_CHECKING, cast
+from dataclasses import dataclass
+from typing import Callable, List, Dict, Optional, Tuple, Any, TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from .screen_compat import Screen
 else:
     from .screen_compat import Screen
 
-from .util import sprite_size, draw_sprite, draw_sprite_masked_with_bg
-from .util.buffer import DoubleBufferedScreen
+from .util import View, sprite_size, draw_sprite, draw_sprite_masked_with_bg
+from .util.buffer import DoubleBufferedScreen, PipelinedScreen
+from .util.pacer import FramePacer
+from .util.paging import ScenePager
+from .util.rng import RandomStreams
 from .entities.environment import WATER_SEGMENTS, CASTLE, CASTLE_MASK, waterline_row, CHEST_CLOSED
 from .util.settings import Settings
-from .entities.core import Seaweed, Bubble, Splat, Fish, random_fish_frames
-from .entities.base import Actor
+from .entities.core import Seaweed, Bubble, Splat, Fish, random_fish_frames, draw_seaweed
+from .entities.core.bubble import BUBBLE_GLYPHS
+from .entities.registry import EntityRegistry
+from .entities.collision import CollisionService
 from .entities.specials import (
     FishHook,
     spawn_shark,
@@ -89,9 +95,9 @@ from .constants import (
     SEAWEED_HEIGHT_MAX,
     SEAWEED_PHASE_MAX,
     FISH_DENSITY_AREA_DIVISOR,
-    SEAWEED_ANIMATION_STEP,
     FISH_MINIMUM_COUNT,
     MAX_DELTA_TIME,
+    INPUT_EVENTS_PER_FRAME_MAX,
 )
 
 # Default post-overlay frames for an "old TV turning off" effect
@@ -158,7 +164,7 @@ class AsciiQuarium:
     _mouse_buttons: int
     _last_mouse_event_time: float
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, clock: Optional[Callable[[], float]] = None) -> None:
         """Initialize the aquarium with the given settings.
 
         Sets up the core entity collections and initializes timing/state variables.
@@ -166,18 +172,28 @@ class AsciiQuarium:
 
         Args:
             settings: Configuration object with all simulation parameters
+            clock: Optional wall-clock source (defaults to time.time); record/replay
+                injects a virtual clock so time-based UI is reproducible
 
         Note:
             After initialization, call rebuild(screen) to populate the aquarium
             with entities before starting the animation loop.
         """
         self.settings: Settings = settings
+        self.clock: Callable[[], float] = clock if clock is not None else time.time
+        # Per-entity and per-subsystem random streams derived from settings.seed
+        self.rng: RandomStreams = RandomStreams(getattr(settings, "seed", None))
         self.seaweed: List[Seaweed] = []
         self.fish: List[Fish] = []
         self.bubbles: List[Bubble] = []
         self.splats: List[Splat] = []
-        self.specials: List[Actor] = []
-        self.decor: List[Actor] = []  # persistent background actors (e.g., treasure chest)
+        # Specials and decor are typed registries: ordered like lists, indexed by entity type
+        self.specials: EntityRegistry = EntityRegistry()
+        self.decor: EntityRegistry = EntityRegistry()  # persistent background actors (e.g., treasure chest)
+        # Broadphase over fish bounding boxes shared by sharks, hooks and predation
+        self.collisions: CollisionService = CollisionService()
+        # Worker pool for brain updates when ai_workers > 0 (created on first use)
+        self.ai_pool: Any = None
         self._paused: bool = False
         self._special_timer: float = random.uniform(
             self.settings.spawn_start_delay_min, self.settings.spawn_start_delay_max
@@ -187,12 +203,16 @@ class AsciiQuarium:
         self._time: float = 0.0
         self._last_spawn: Dict[str, float] = {}
         self._global_cooldown_until: float = 0.0
+        # Frame pacer of the hosting loop (terminal/Tk), if any; source of frame timing stats
+        self.pacer: Optional[Any] = None
+        # Chunk pager for wide scenes (scene mode with scene_chunk_cols set), built by rebuild()
+        self.scene_pager: Optional[ScenePager] = None
         # Track mouse button state for debounce
         self._mouse_buttons: int = 0
         self._last_mouse_event_time: float = 0.0
 
         if bool(getattr(self.settings, "start_screen", True)):
-            self._start_overlay_until = time.time() + 7.0
+            self._start_overlay_until = self.clock() + 7.0
 
 
     def rebuild(self, screen: Screen) -> None:
@@ -234,11 +254,97 @@ class AsciiQuarium:
         except Exception:
             pass
 
+        self.scene_pager = None
+        chunk_cols = int(getattr(self.settings, "scene_chunk_cols", 0) or 0)
+        if chunk_cols > 0 and not bool(getattr(self.settings, "fish_tank", True)):
+            self.scene_pager = ScenePager(chunk_cols, int(getattr(self.settings, "scene_width", screen.width)))
+
         self._clear_entities()
+        if self.scene_pager is not None:
+            # Only the chunks around the view are populated; the rest are generated on first visit
+            self._initialize_decor(screen)
+            self.scene_pager.update(self, screen)
+            return
         self._initialize_seaweed(screen)
         self._initialize_decor(screen)
         self._initialize_fish(screen)
 
+    def resize(self, screen: Screen, old_width: int, old_height: int) -> None:
+        """Fit the existing tank to a new screen size without rebuilding.
+
+        Horizontal positions scale with the scene width. Fish, bubbles and splats
+        keep their relative depth below the waterline, while bottom-anchored
+        entities (seaweed, decor and specials in the lower half) move with the
+        sea floor. Populations are then topped up or trimmed to the new size.
+
+        Args:
+            screen: Screen interface with the new dimensions
+            old_width: Screen width the entities were laid out for
+            old_height: Screen height the entities were laid out for
+        """
+        new_w, new_h = int(screen.width), int(screen.height)
+        if (new_w, new_h) == (int(old_width), int(old_height)):
+            return
+        settings = self.settings
+        old_scene_w = max(1, int(getattr(settings, "scene_width", old_width)))
+        try:
+            castle_w, _castle_h = sprite_size(CASTLE)
+        except Exception:
+            castle_w = 30
+        if not bool(getattr(settings, "fish_tank", True)):
+            factor = max(1, int(getattr(settings, "scene_width_factor", 5)))
+            scene_w = max(new_w, new_w * factor)
+        else:
+            scene_w = new_w
+        kx = scene_w / old_scene_w
+        max_off = max(0, scene_w - new_w)
+        settings.scene_width = int(scene_w)
+        settings.scene_offset = max(0, min(max_off, int(round(int(getattr(settings, "scene_offset", 0)) * kx))))
+        if bool(getattr(settings, "fish_tank", True)):
+            settings.castle_scene_x = max(0, new_w - castle_w - 2)
+        else:
+            castle_x = int(round(int(getattr(settings, "castle_scene_x", 0)) * kx))
+            settings.castle_scene_x = max(0, min(scene_w - castle_w - 2, castle_x))
+
+        water_top = int(getattr(settings, "waterline_top", 5))
+        ky = (new_h - water_top) / max(1, int(old_height) - water_top)
+        dy = new_h - int(old_height)
+
+        def _scale(v: Any, k: float) -> Any:
+            return int(round(v * k)) if isinstance(v, int) else v * k
+
+        def _depth(y: Any) -> Any:
+            if y < water_top:
+                return y
+            return _scale(y - water_top, ky) + water_top
+
+        for f in self.fish:
+            # Fish move in scene coordinates; x/y are only the last drawn position
+            f.scene_x = _scale(f.scene_x, kx)
+            f.scene_y = max(float(water_top), min(float(new_h - f.height - 1), float(_depth(f.scene_y))))
+        for group in (self.bubbles, self.splats):
+            for e in group:
+                try:
+                    e.x = _scale(e.x, kx)
+                    e.y = _depth(e.y)
+                except Exception:
+                    pass
+        for sw in self.seaweed:
+            sw.x = max(1, min(scene_w - 3, int(round(sw.x * kx))))
+            sw.base_y = new_h - 2
+        for group in (self.decor, self.specials):
+            for e in group:
+                try:
+                    e.x = _scale(e.x, kx)
+                    if e.y > int(old_height) // 2:
+                        e.y = e.y + dy
+                except Exception:
+                    pass
+        self.collisions = CollisionService()
+        if self.scene_pager is not None:
+            self.scene_pager.rebase(scene_w, settings.scene_offset, new_w)
+        self.adjust_populations(screen)
+
     def _clear_entities(self) -> None:
         """Clear all entity collections and reset timing state."""
         self.seaweed.clear()
@@ -247,6 +353,7 @@ class AsciiQuarium:
         self.splats.clear()
         self.specials.clear()
         self.decor.clear()
+        self.collisions = CollisionService()
         self._special_timer = random.uniform(self.settings.spawn_start_delay_min, self.settings.spawn_start_delay_max)
         self._seaweed_tick = 0.0
 
@@ -472,6 +579,9 @@ class AsciiQuarium:
             setattr(self.settings, "scene_offset", cur_off)
         except Exception:
             pass
+        # Page scene chunks in/out around the view (also while paused, so panning shows content)
+        if self.scene_pager is not None and not bool(getattr(self.settings, "fish_tank", True)):
+            self.scene_pager.update(self, screen)
 
         if not self._paused:
             self._update_all_entities(dt, screen)
@@ -499,15 +609,24 @@ class AsciiQuarium:
         # Update decorative entities (treasure chest, etc.)
         self._update_decor_entities(dt, screen)
 
+        # Snapshot food/predator/fish lookups once per frame before fish sense the world
+        self._build_world_snapshot()
+        self.collisions.rebuild(self.fish)
+        self._step_ai_pool(dt)
+
         # Update fish entities
         for fish in self.fish:
             fish.update(dt, screen, self)
+        # Fish have moved; re-bucket before sharks and hooks query them
+        self.collisions.rebuild(self.fish)
 
         # Update and filter bubbles with collision detection
         self._update_bubble_entities(dt, screen)
 
         # Update special entities and filter inactive ones
         self._update_special_entities(dt, screen)
+        # Drop fish eaten or landed this frame in a single pass
+        self.collisions.flush_retired(self.fish)
 
         # Update splat effects and filter inactive ones
         self._update_splat_entities(dt, screen)
@@ -580,7 +699,7 @@ class AsciiQuarium:
         """
         for special_actor in list(self.specials):
             special_actor.update(dt, screen, self)
-        self.specials = [special_actor for special_actor in self.specials if getattr(special_actor, "active", True)]
+        self.specials.retire_inactive()
 
     def _update_splat_entities(self, dt: float, screen: Screen) -> None:
         """Update splat effects and filter inactive ones.
@@ -643,7 +762,7 @@ class AsciiQuarium:
         def _center_x(wi: int, s: str) -> int:
             return max(0, (wi - len(s)) // 2)
 
-        now = time.time()
+        now = self.clock()
         # Phase 1: timer-active (draw full overlay)
         if until > 0.0 and now < until:
             art_h = len(title_lines)
@@ -733,14 +852,16 @@ class AsciiQuarium:
                         pass
 
 
+        # Entities stay in scene coordinates; one view per frame maps them to the screen
+        view = View(int(getattr(self.settings, "scene_offset", 0)), 0)
         # Draw entities in correct z-order: seaweed → decor → fish → castle → bubbles → specials → splats
-        self._render_seaweed(screen, mono)
-        self._render_decor(screen, mono)
-        self._render_fish(screen, mono)
+        self._render_seaweed(screen, mono, view)
+        self._render_decor(screen, mono, view)
+        self._render_fish(screen, mono, view)
         self._render_castle(screen)
         self._render_bubbles(screen, mono)
-        self._render_specials(screen, mono)
-        self._render_splats(screen, mono)
+        self._render_specials(screen, mono, view)
+        self._render_splats(screen, mono, view)
 
         if self._show_help:
             self._draw_help(screen)
@@ -771,11 +892,7 @@ class AsciiQuarium:
         # Provide a simple local neighborhood search for AI flocking/chase.
         from .ai.vector import Vec2
         radius2 = float(radius_cells) * float(radius_cells)
-        me = None
-        for f in self.fish:
-            if id(f) == fish_id:
-                me = f
-                break
+        me = self._fish_by_id(fish_id)
         if me is None:
             return []
         mx, my = float(me.x), float(me.y)
@@ -789,80 +906,112 @@ class AsciiQuarium:
                 out.append((id(other), Vec2(float(other.x), float(other.y)), Vec2(float(other.vx), float(other.vy))))
         return out
 
-    def species_of(self, fish_id: int) -> int:
+    def _build_world_snapshot(self) -> None:
+        """Collect flakes, predators and a fish-id index for this frame's sensing."""
+        from .entities.specials import FishFoodFlake, Shark  # type: ignore
+        from .ai.world import WorldSnapshot
+        flakes = self.specials.active_of_type(FishFoodFlake)
+        preds = [(float(getattr(s, "x", 0.0)), float(getattr(s, "y", 0.0))) for s in self.specials.active_of_type(Shark)]
+        if len(flakes) > getattr(self, "_ai_flake_count", 0):
+            self._ai_food_epoch = getattr(self, "_ai_food_epoch", 0) + 1
+        self._ai_flake_count = len(flakes)
+        self.world_sense = WorldSnapshot.build(self.fish, flakes, preds)
+
+    def _step_ai_pool(self, dt: float) -> None:
+        """Run this frame's brain updates in the worker pool, if one is configured."""
+        want = int(getattr(self.settings, "ai_workers", 0)) if getattr(self.settings, "ai_enabled", False) else 0
+        pool = self.ai_pool
+        if pool is not None and pool.workers != want:
+            self.close_ai_pool()
+            pool = None
+        if want <= 0:
+            return
+        from .ai.brain import brain_params
+        params = brain_params(self.settings)
+        if pool is None:
+            if getattr(self, "_ai_pool_failed", None) == want:
+                return
+            try:
+                from .ai.parallel import ParallelBrains
+                pool = self.ai_pool = ParallelBrains(want, params)
+            except Exception as e:
+                logging.warning("Could not start %d AI workers, using in-process brains: %s", want, e)
+                # Remember the failure so the start is not retried every frame
+                self._ai_pool_failed = want
+                return
+        if pool.disabled:
+            return
+        if params != pool.params:
+            pool.set_params(params)
+        pool.step(self, dt)
+
+    def close_ai_pool(self) -> None:
+        """Stop AI worker processes; fish go back to in-process brains."""
+        pool, self.ai_pool = self.ai_pool, None
+        if pool is not None:
+            from .ai.parallel import RemoteBrain
+            pool.close()
+            for f in self.fish:
+                if isinstance(getattr(f, "_brain", None), RemoteBrain):
+                    f._brain = None
+
+    def _fish_by_id(self, fish_id: int):
+        """Resolve a fish from the frame snapshot, falling back to a scan for late arrivals."""
+        snap = getattr(self, "world_sense", None)
+        if snap is not None:
+            f = snap.fish_by_id.get(fish_id)
+            if f is not None:
+                return f
         for f in self.fish:
             if id(f) == fish_id:
-                return int(getattr(f, "species_id", -1))
-        return -1
+                return f
+        return None
+
+    def food_epoch(self) -> int:
+        """Counter bumped whenever new food appears; brains re-plan when it changes."""
+        return int(getattr(self, "_ai_food_epoch", 0))
+
+    def predator_near(self, x: float, y: float, radius_cells: float) -> bool:
+        snap = getattr(self, "world_sense", None)
+        if snap is None:
+            return False
+        _, d = snap.nearest_predator(x, y)
+        return d <= float(radius_cells)
+
+    def species_of(self, fish_id: int) -> int:
+        f = self._fish_by_id(fish_id)
+        return int(getattr(f, "species_id", -1)) if f is not None else -1
 
     def nearest_food(self, fish_id: int):
-        # If fish food flakes are present, steer toward the closest flake roughly.
+        # If fish food flakes are present, steer toward the closest flake.
         # Return (direction unit vector, distance). If none, distance=inf.
-        from math import hypot
         from .ai.vector import Vec2
-        from .entities.specials import FishFoodFlake  # type: ignore
-        # Find the fish object by id
-        fx: float | None = None
-        fy: float | None = None
-        for f in self.fish:
-            if id(f) == fish_id:
-                # Use scene coordinates to decouple from panning
-                fx = float(getattr(f, "scene_x", f.x))
-                fy = float(getattr(f, "scene_y", f.y))
-                break
-        if fx is None or fy is None:
-            return (Vec2(0.0, 0.0), float("inf"))
-        # Scan specials for fish food flakes positions (cheap linear scan)
-        targets: list[tuple[float, float]] = []
-        for s in self.specials:
-            # Only consider actual fish food flakes that are active
-            if isinstance(s, FishFoodFlake) and getattr(s, "active", True):
-                targets.append((float(getattr(s, "x", 0.0)), float(getattr(s, "y", 0.0))))
-        if not targets:
+        f = self._fish_by_id(fish_id)
+        snap = getattr(self, "world_sense", None)
+        if f is None or snap is None:
             return (Vec2(0.0, 0.0), float("inf"))
-        # Pick nearest
-        tx, ty, best_d = fx, fy, float("inf")
-        for (x, y) in targets:
-            d = hypot(x - fx, y - fy)
-            if d < best_d:
-                best_d = d
-                tx, ty = x, y
-        if best_d == float("inf") or best_d <= 1e-6:
+        # Use scene coordinates to decouple from panning
+        fx = float(getattr(f, "scene_x", f.x))
+        fy = float(getattr(f, "scene_y", f.y))
+        flake, best_d = snap.nearest_flake(fx, fy)
+        if flake is None or best_d <= 1e-6:
             return (Vec2(0.0, 0.0), best_d)
-        dir_vec = Vec2((tx - fx) / best_d, (ty - fy) / best_d)
-        return (dir_vec, best_d)
+        return (Vec2((float(flake.x) - fx) / best_d, (float(flake.y) - fy) / best_d), best_d)
 
     def predator_vector(self, fish_id: int):
         # Consider shark positions as predators; flee away from the closest teeth point approximated by entity x,y.
-        from math import hypot
         from .ai.vector import Vec2
-        fx: float | None = None
-        fy: float | None = None
-        for f in self.fish:
-            if id(f) == fish_id:
-                fx = float(getattr(f, "scene_x", f.x))
-                fy = float(getattr(f, "scene_y", f.y))
-                break
-        if fx is None or fy is None:
-            return (Vec2(0.0, 0.0), float("inf"))
-        preds: list[tuple[float, float]] = []
-        for s in self.specials:
-            # Sharks have attributes x,y and update like other actors
-            if s.__class__.__name__.lower() == "shark" and getattr(s, "active", True):
-                preds.append((float(getattr(s, "x", 0.0)), float(getattr(s, "y", 0.0))))
-        if not preds:
+        f = self._fish_by_id(fish_id)
+        snap = getattr(self, "world_sense", None)
+        if f is None or snap is None:
             return (Vec2(0.0, 0.0), float("inf"))
-        # Find nearest predator and return normalized away-vector
-        tx, ty, best_d = fx, fy, float("inf")
-        for (x, y) in preds:
-            d = hypot(x - fx, y - fy)
-            if d < best_d:
-                best_d = d
-                tx, ty = x, y
-        if best_d == float("inf") or best_d <= 1e-6:
+        fx = float(getattr(f, "scene_x", f.x))
+        fy = float(getattr(f, "scene_y", f.y))
+        pred, best_d = snap.nearest_predator(fx, fy)
+        if pred is None or best_d <= 1e-6:
             return (Vec2(0.0, 0.0), best_d)
-        dir_away = Vec2((fx - tx) / best_d, (fy - ty) / best_d)
-        return (dir_away, best_d)
+        # Normalized away-vector from the nearest predator
+        return (Vec2((fx - pred[0]) / best_d, (fy - pred[1]) / best_d), best_d)
 
     def nearest_prey(self, fish_id: int):
         """Find the closest smaller fish to the given fish, if any.
@@ -873,11 +1022,7 @@ class AsciiQuarium:
         from math import hypot
         from .ai.vector import Vec2
         # Locate self and get size
-        me = None
-        for f in self.fish:
-            if id(f) == fish_id:
-                me = f
-                break
+        me = self._fish_by_id(fish_id)
         if me is None:
             return (Vec2(0.0, 0.0), float("inf"))
         mx, my = float(me.x), float(me.y)
@@ -919,98 +1064,61 @@ class AsciiQuarium:
         # Chest bottom-left-ish if present
         try:
             from .entities.specials import TreasureChest  # type: ignore
-            for d in self.decor:
-                if isinstance(d, TreasureChest):
-                    pts.append(Vec2(float(d.x + 2), float(d.y)))
+            for d in self.decor.of_type(TreasureChest):
+                pts.append(Vec2(float(d.x + 2), float(d.y)))
         except Exception:
             pass
         return pts
 
     def size_of(self, fish_id: int) -> int:
-        for f in self.fish:
-            if id(f) == fish_id:
-                return int(getattr(f, "height", len(f.frames)))
-        return 3
+        f = self._fish_by_id(fish_id)
+        return int(getattr(f, "height", len(f.frames))) if f is not None else 3
 
-    def _render_seaweed(self, screen: Screen, mono: bool) -> None:
+    def _render_seaweed(self, screen: Screen, mono: bool, view: View) -> None:
         """Render seaweed entities with animation.
 
         Args:
             screen: Screen interface for rendering
             mono: Whether to use monochrome rendering mode
+            view: Scene -> screen transform for this frame
         """
-        off = int(getattr(self.settings, "scene_offset", 0))
-        for seaweed in self.seaweed:
-            animation_tick: int = int(self._seaweed_tick / SEAWEED_ANIMATION_STEP)
-            # Temporarily map scene -> screen for drawing
-            orig_x = getattr(seaweed, "x", 0)
-            try:
-                draw_x = int(orig_x) - off
-                # Cull if entirely off-screen horizontally (seaweed width is 2)
-                if draw_x + 2 < 0 or draw_x >= screen.width:
-                    continue
-                seaweed.x = draw_x
-                seaweed.draw(screen, animation_tick, mono)
-            finally:
-                # Restore original scene x
-                try:
-                    seaweed.x = orig_x
-                except Exception:
-                    pass
+        # One pass in scene coordinates; the offset maps scene -> screen and culls
+        draw_seaweed(screen, self.seaweed, view.dx, mono)
 
-    def _render_decor(self, screen: Screen, mono: bool) -> None:
-        """Render decorative entities with backwards compatibility.
+    def _render_decor(self, screen: Screen, mono: bool, view: View) -> None:
+        """Render decorative entities.
 
         Args:
             screen: Screen interface for rendering
             mono: Whether to use monochrome rendering mode
+            view: Scene -> screen transform for this frame
         """
-        off = int(getattr(self.settings, "scene_offset", 0))
         for decoration in self.decor:
-            # Many decor have an x attribute; map if present to support scene panning
-            has_x = hasattr(decoration, "x")
-            orig_x = getattr(decoration, "x", 0)
-            if has_x:
-                try:
-                    setattr(decoration, "x", int(orig_x) - off)
-                except Exception:
-                    has_x = False
-            try:
-                decoration.draw(screen, mono)  # type: ignore[call-arg]
-            except TypeError:
-                decoration.draw(screen)
-            finally:
-                if has_x:
-                    try:
-                        setattr(decoration, "x", orig_x)
-                    except Exception:
-                        pass
+            decoration.draw(screen, mono, view)  # type: ignore[call-arg]
 
-    def _render_fish(self, screen: Screen, mono: bool) -> None:
+    def _render_fish(self, screen: Screen, mono: bool, view: View) -> None:
         """Render fish entities with proper z-order sorting.
 
         Args:
             screen: Screen interface for rendering
             mono: Whether to use monochrome rendering mode
+            view: Scene -> screen transform for this frame
         """
         # Draw fish back-to-front by z to mimic Perl's fish_start..fish_end layering
         fish_to_draw: List[Fish] = sorted(self.fish, key=lambda fish: getattr(fish, 'z', 0))
-        off = int(getattr(self.settings, "scene_offset", 0))
+        min_x, min_y, max_x, max_y = view.bounds(screen)
         for fish in fish_to_draw:
-            try:
-                sx = int(getattr(fish, 'scene_x', fish.x)) - off
-                sy = int(getattr(fish, 'scene_y', fish.y))
-                fish.x = sx
-                fish.y = sy
-            except Exception:
-                pass
-            # Cull horizontally off-screen
-            if fish.x + fish.width < 0 or fish.x >= screen.width:
+            x = int(fish.scene_x)
+            y = int(fish.scene_y)
+            # Bounding-box cull before any sprite work; width (a scan of the frame) goes last
+            sx = x - view.dx
+            sy = y - view.dy
+            if sx > max_x or sy > max_y or sy + fish.height <= min_y or sx + fish.width <= min_x:
                 continue
             if mono:
-                draw_sprite(screen, fish.frames, int(fish.x), int(fish.y), Screen.COLOUR_WHITE)
+                draw_sprite(screen, fish.frames, x, y, Screen.COLOUR_WHITE, view)
             else:
-                fish.draw(screen)
+                fish.draw(screen, view)
 
     def _render_castle(self, screen: Screen) -> None:
         """Render castle decoration if enabled.
@@ -1028,66 +1136,43 @@ class AsciiQuarium:
             screen: Screen interface for rendering
             mono: Whether to use monochrome rendering mode
         """
+        # Glyph flicker draws from its own stream so rendering never shifts the simulation
+        rng = self.rng.stream("render")
         for bubble in self.bubbles:
             if mono:
                 if 0 <= bubble.y < screen.height:
-                    bubble_char: str = random.choice([".", "o", "O"])
+                    bubble_char: str = rng.choice(BUBBLE_GLYPHS)
                     screen.print_at(bubble_char, bubble.x, bubble.y, colour=Screen.COLOUR_WHITE)
             else:
-                bubble.draw(screen)
+                bubble.draw(screen, rng)
 
-    def _render_specials(self, screen: Screen, mono: bool) -> None:
-        """Render special entities with backwards compatibility.
+    def _render_specials(self, screen: Screen, mono: bool, view: View) -> None:
+        """Render special entities.
 
         Args:
             screen: Screen interface for rendering
             mono: Whether to use monochrome rendering mode
+            view: Scene -> screen transform for this frame
         """
-        off = int(getattr(self.settings, "scene_offset", 0))
+        # All specials, including FishHook, are scene-space; sprite draws cull by bbox
         for special_actor in list(self.specials):
-            # All specials, including FishHook, are treated as scene-space now
-            has_x = hasattr(special_actor, "x")
-            orig_x = getattr(special_actor, "x", 0)
-            if has_x:
-                try:
-                    setattr(special_actor, "x", int(orig_x) - off)
-                except Exception:
-                    has_x = False
-            try:
-                special_actor.draw(screen, mono)  # type: ignore[call-arg]
-            except TypeError:
-                special_actor.draw(screen)
-            finally:
-                if has_x:
-                    try:
-                        setattr(special_actor, "x", orig_x)
-                    except Exception:
-                        pass
+            special_actor.draw(screen, mono, view)  # type: ignore[call-arg]
 
-    def _render_splats(self, screen: Screen, mono: bool) -> None:
+    def _render_splats(self, screen: Screen, mono: bool, view: View) -> None:
         """Render splat effects on top of all other entities.
 
         Args:
             screen: Screen interface for rendering
             mono: Whether to use monochrome rendering mode
+            view: Scene -> screen transform for this frame
         """
-        off = int(getattr(self.settings, "scene_offset", 0))
         for splat in self.splats:
             try:
-                # Determine scene->screen mapping only for scene-space splats
                 if getattr(splat, "coord_space", "scene") == "scene":
-                    sx = int(getattr(splat, "x", 0)) - off
-                    sy = int(getattr(splat, "y", 0))
-                    # Cull if outside current view
-                    if sx < -8 or sx >= screen.width + 8 or sy < -4 or sy >= screen.height + 4:
+                    # Splat frames are drawn centred on (x, y) within a 9x5 box
+                    if not view.visible(screen, int(splat.x) - 4, int(splat.y) - 2, 9, 5):
                         continue
-                    # Temporarily remap for draw
-                    ox = splat.x
-                    try:
-                        splat.x = sx
-                        splat.draw(screen, mono)
-                    finally:
-                        splat.x = ox
+                    splat.draw(screen, mono, view)
                 else:
                     # Screen-space splats (if any) draw directly
                     splat.draw(screen, mono)
@@ -1123,7 +1208,7 @@ class AsciiQuarium:
         weighted_choices: List[Tuple[float, str, Any]] = []
         current_time: float = self._time
         # Detect existing fishhook so we can avoid selecting it while active
-        hook_active: bool = any(isinstance(special, FishHook) and special.active for special in self.specials)
+        hook_active: bool = self.specials.has_active(FishHook)
         for entity_name, spawn_function in choices:
             if entity_name == "fishhook" and hook_active:
                 continue
@@ -1197,6 +1282,11 @@ class AsciiQuarium:
             "  Left-click: drop fishhook to clicked spot",
             "  h/?: toggle this help",
         ]
+        if self.pacer is not None:
+            try:
+                lines.insert(3, f"frame: {self.pacer.summary()}")
+            except Exception:
+                pass
         # In scene mode, include a one-line scene summary (width/offset/factor)
         try:
             if not bool(getattr(self.settings, "fish_tank", True)):
@@ -1217,7 +1307,17 @@ class AsciiQuarium:
 
     # --- Live population management helpers ---
     def _compute_target_counts(self, screen: Screen) -> tuple[int, int]:
-        """Return (fish_count, seaweed_count) desired for current settings and screen size."""
+        """Return (fish_count, seaweed_count) desired for current settings and screen size.
+
+        With scene paging this is the share of the active window, not the whole scene.
+        """
+        fish_count, seaweed_count = self._scene_target_counts(screen)
+        if self.scene_pager is not None:
+            return self.scene_pager.share(fish_count, FISH_MINIMUM_COUNT), self.scene_pager.share(seaweed_count)
+        return fish_count, seaweed_count
+
+    def _scene_target_counts(self, screen: Screen) -> tuple[int, int]:
+        """Return (fish_count, seaweed_count) for the whole scene (or screen in tank mode)."""
         # Scale by scene width in scene mode
         try:
             scene_w = int(getattr(self.settings, "scene_width", screen.width))
@@ -1361,8 +1461,8 @@ class AsciiQuarium:
         # In scene mode, distribute initial spawns across the whole scene; in tank mode, spawn just off-screen
         try:
             if not bool(getattr(self.settings, "fish_tank", True)):
-                scene_w = int(getattr(self.settings, "scene_width", screen.width))
-                fish_x = random.randint(0, max(0, scene_w - fish_width))
+                lo, hi = self._spawn_x_range(screen)
+                fish_x = random.randint(lo, max(lo, hi - fish_width))
             else:
                 fish_x = (-fish_width - 1 if direction > 0 else screen.width + 1)
         except Exception:
@@ -1413,6 +1513,7 @@ class AsciiQuarium:
             water_rows=len(WATER_SEGMENTS),
         )
         setattr(fish, 'solid_fish', bool(getattr(self.settings, 'solid_fish', True)))
+        fish.rng = self.rng.spawn("fish")
         return fish
 
     def _preferred_band_for_height(self, fish_height: int) -> tuple[float, float]:
@@ -1481,14 +1582,12 @@ class AsciiQuarium:
 
     def _make_one_seaweed(self, screen: Screen) -> Seaweed:
         seaweed_height = random.randint(SEAWEED_HEIGHT_MIN, SEAWEED_HEIGHT_MAX)
-        # Spawn across the whole scene if fish tank is disabled
-        try:
-            scene_w = int(getattr(self.settings, "scene_width", screen.width))
-        except Exception:
-            scene_w = screen.width
-        seaweed_x = random.randint(1, max(1, scene_w - 3))
+        # Spawn across the whole scene if fish tank is disabled (the live part of it when paging)
+        lo, hi = self._spawn_x_range(screen)
+        seaweed_x = random.randint(max(1, lo), max(1, hi - 3))
         base_y = screen.height - 2
         seaweed = Seaweed(x=seaweed_x, base_y=base_y, height=seaweed_height, phase=random.randint(0, SEAWEED_PHASE_MAX))
+        seaweed.rng = self.rng.spawn("seaweed")
         # Apply configured lifecycle ranges (and initialize current params within those ranges)
         seaweed.sway_min = self.settings.seaweed_sway_min
         seaweed.sway_max = self.settings.seaweed_sway_max
@@ -1508,6 +1607,15 @@ class AsciiQuarium:
         seaweed.shrink_rate = random.uniform(seaweed.shrink_rate_min_cfg, seaweed.shrink_rate_max_cfg)
         return seaweed
 
+    def _spawn_x_range(self, screen: Screen) -> tuple[int, int]:
+        """Scene columns [lo, hi) where new fish and seaweed may be placed."""
+        if self.scene_pager is not None:
+            return self.scene_pager.active_range()
+        try:
+            return 0, int(getattr(self.settings, "scene_width", screen.width))
+        except Exception:
+            return 0, screen.width
+
     def adjust_populations(self, screen: Screen):
         """Incrementally add/remove fish and seaweed to match target counts without a full rebuild."""
         target_fish_count, target_seaweed_count = self._compute_target_counts(screen)
@@ -1529,7 +1637,57 @@ class AsciiQuarium:
             del self.fish[target_fish_count:]
 
 
-def run(screen: Screen, settings: Settings):
+@dataclass
+class TerminalSession:
+    """Run-loop state that outlives a Screen, so terminal resizes keep the tank.
+
+    asciimatics can only pick up a new terminal size by re-opening the Screen.
+    ``runner.run_with_resize`` passes the same session back into ``run`` each
+    time, and ``run`` re-attaches the existing app instead of building a new one.
+    """
+
+    app: Optional[AsciiQuarium] = None
+    db: Optional[DoubleBufferedScreen] = None
+    timing_state: Optional[dict] = None
+    recorder: Any = None
+    replayer: Any = None
+    clock: Any = None
+    snapshotter: Any = None
+    watcher: Any = None
+    control: Any = None
+    memwatch: Any = None
+    # Set when the loop exits for a resize, so logs stay open for the next Screen
+    resizing: bool = False
+
+    def close(self, screen: Optional[Screen] = None) -> None:
+        """Flush the final snapshot and close logs and the control socket."""
+        if self.control is not None:
+            self.control.close()
+            self.control = None
+        if self.memwatch is not None:
+            self.memwatch.close(self.app)
+            self.memwatch = None
+        if self.app is not None:
+            self.app.close_ai_pool()
+        if self.snapshotter is not None:
+            self.snapshotter.close(self.app, screen)
+            self.snapshotter = None
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+        if self.replayer is not None:
+            self.replayer.close()
+            self.replayer = None
+        if isinstance(self.db, PipelinedScreen):
+            self.db.close()
+
+    def sync_output(self) -> None:
+        """Let a pipelined output thread finish writing before the Screen goes away."""
+        if isinstance(self.db, PipelinedScreen):
+            self.db.sync()
+
+
+def run(screen: Screen, settings: Settings, session: Optional[TerminalSession] = None):
     """Main game loop for the ASCII art aquarium simulation.
 
     This function manages the complete game execution including initialization,
@@ -1539,50 +1697,265 @@ def run(screen: Screen, settings: Settings):
     Args:
         screen: Screen interface for rendering and input
         settings: Configuration object with all simulation parameters
+        session: Optional state kept across resizes; when it already holds an
+            app, that app is fitted to the new screen instead of rebuilt
     """
-    app, db, timing_state = _initialize_game_state(screen, settings)
-    while True:
-        timing_state = _update_frame_timing(timing_state, settings)
+    if session is None:
+        session = TerminalSession()
+    _enter_session(session, screen, settings)
+    try:
+        while True:
+            if _frame_step(session, screen, settings):
+                return
+            _manage_frame_rate(session.timing_state, settings)
+    finally:
+        session.sync_output()
+        if not session.resizing:
+            session.close(screen)
+
+
+def _enter_session(session: TerminalSession, screen: Screen, settings: Settings) -> None:
+    """Start a new session or re-attach an existing one to ``screen``."""
+    session.resizing = False
+    if session.app is None:
+        _start_session(session, screen, settings)
+    else:
+        _reattach_session(session, screen)
 
-        # Process input events and handle special cases
-        event = screen.get_event()
-        if _handle_keyboard_events(event, app, screen):
-            return  # User requested quit
 
-        _handle_mouse_events(event, app, screen, settings, timing_state["now"])
+def _frame_step(session: TerminalSession, screen: Screen, settings: Settings, source: Any = None) -> bool:
+    """Run one frame: input, config reload, simulation step and flush (no pacing).
+
+    Args:
+        session: Live session (app, buffers, logs)
+        screen: Screen the session draws on; input and resize checks go
+            through ``session.db``, which forwards them to it
+        settings: Configuration object with all simulation parameters
+        source: Optional object with ``get_event()`` to drain input from
+            instead of ``session.db`` (e.g. a queue filled by a polling task)
+
+    Returns:
+        True when the run should end (quit key or replay log exhausted)
 
-        # Handle screen resize
-        if screen.has_resized():
-            from asciimatics.exceptions import ResizeScreenError  # type: ignore
-            raise ResizeScreenError("Screen resized")
+    Raises:
+        ResizeScreenError: When the terminal was resized; ``session.resizing`` is set
+    """
+    app, db, timing_state = session.app, session.db, session.timing_state
+    assert app is not None and db is not None and timing_state is not None
+    recorder, replayer, clock = session.recorder, session.replayer, session.clock
+    timing_state = _update_frame_timing(timing_state, settings)
+    session.timing_state = timing_state
+
+    # Process input events and handle special cases
+    if replayer is not None:
+        frame = replayer.next_frame()
+        if frame is None:
+            return True  # Log exhausted
+        timing_state["dt"], events = frame
+    else:
+        # Read through the buffer: a pipelined one serialises input with its output thread
+        events = _drain_events(source if source is not None else db)
+    if recorder is not None:
+        recorder.record(timing_state["frame_no"], timing_state["dt"], events)
+    now = timing_state["now"]
+    if clock is not None:
+        # Virtual time advances by exactly the logged dt in both record and replay
+        now = clock.advance(timing_state["dt"])
+
+    if _dispatch_events(events, app, screen, settings, now):
+        return True  # User requested quit
+    if session.control is not None:
+        session.control.process(app, screen)
+
+    if session.watcher is not None:
+        _apply_config_reload(session.watcher, app, screen, settings, timing_state)
+
+    # Handle screen resize (a replay keeps its recorded geometry); the
+    # caller re-opens the Screen and hands the session back to us
+    if replayer is None and db.has_resized():
+        from asciimatics.exceptions import ResizeScreenError  # type: ignore
+        if recorder is not None:
+            # Replays run at the recorded geometry, so the log ends where the size changed
+            logging.warning("Terminal resized; recording stopped at frame %d", timing_state["frame_no"])
+            recorder.close()
+            session.recorder = None
+        session.resizing = True
+        raise ResizeScreenError("Screen resized")
+
+    # Render frame
+    _render_frame(app, db, timing_state)
+    if session.snapshotter is not None:
+        session.snapshotter.tick(app, screen, timing_state["now"])
+    if session.memwatch is not None:
+        session.memwatch.tick(app, timing_state["now"])
+    return False
 
-        # Render frame and manage timing
-        _render_frame(app, db, timing_state)
-        _manage_frame_rate(timing_state, settings)
 
+def _start_session(session: TerminalSession, screen: Screen, settings: Settings) -> None:
+    """Open logs, build (or resume) the app and start optional watchers."""
+    recorder, replayer, clock = _open_input_log(screen, settings)
+    app, db, timing_state = _initialize_game_state(screen, settings, clock)
+    session.app, session.db, session.timing_state = app, db, timing_state
+    session.recorder, session.replayer, session.clock = recorder, replayer, clock
+    if getattr(settings, "resume_path", None) and replayer is None:
+        from .util.snapshot import PeriodicSnapshotter
+
+        session.snapshotter = PeriodicSnapshotter(str(settings.resume_path), float(getattr(settings, "snapshot_interval", 30.0)))
+    session.memwatch = _open_memory_monitor(settings)
+    # Config edits and remote commands would make a recorded or replayed run diverge, so only live runs get them
+    if recorder is None and replayer is None:
+        session.watcher = _open_config_watcher(settings)
+        session.control = _open_control_server(settings)
+
+
+def _reattach_session(session: TerminalSession, screen: Screen) -> None:
+    """Point an existing session at a re-opened Screen and fit the tank to it."""
+    assert session.app is not None and session.db is not None
+    old_w, old_h = session.db.width, session.db.height
+    session.db.rebind(screen)
+    session.app.resize(screen, old_w, old_h)
+
+
+def _open_input_log(screen: Screen, settings: Settings):
+    """Open the record/replay log requested in settings, seeding the RNG to match.
+
+    Returns:
+        Tuple of (recorder or None, replayer or None, VirtualClock or None)
+    """
+    replay_path = getattr(settings, "replay_path", None)
+    record_path = getattr(settings, "record_path", None)
+    if not replay_path and not record_path:
+        return None, None, None
+    from .util.replay import InputRecorder, InputReplayer, VirtualClock
+
+    if replay_path:
+        replayer = InputReplayer(str(replay_path))
+        header = replayer.header
+        seed = header.get("seed")
+        if seed is not None:
+            settings.seed = int(seed)
+            random.seed(settings.seed)
+        if (header.get("width"), header.get("height")) != (screen.width, screen.height):
+            logging.warning(
+                "Replaying a %sx%s log on a %sx%s screen; results may diverge",
+                header.get("width"), header.get("height"), screen.width, screen.height,
+            )
+        return None, replayer, VirtualClock(float(header.get("start", 0.0)))
+
+    # Recording needs a known seed so the log can be replayed exactly
+    if settings.seed is None:
+        settings.seed = random.randrange(1 << 31)
+    random.seed(settings.seed)
+    start = time.time()
+    recorder = InputRecorder(
+        str(record_path),
+        {"seed": settings.seed, "width": screen.width, "height": screen.height, "fps": settings.fps, "start": start},
+    )
+    return recorder, None, VirtualClock(start)
+
+
+def _open_control_server(settings: Settings):
+    """Return a ControlServer on the configured address, or None when disabled/unavailable."""
+    address = getattr(settings, "control_socket", None)
+    if not address:
+        return None
+    from .util.control import ControlServer
+
+    try:
+        return ControlServer(str(address))
+    except Exception as e:
+        logging.warning("Control socket %s unavailable: %s", address, e)
+        return None
+
+
+def _open_memory_monitor(settings: Settings):
+    """Return a MemoryMonitor writing to the configured log, or None when disabled/unavailable."""
+    path = getattr(settings, "memory_log", None)
+    if not path:
+        return None
+    from .util.memwatch import MemoryMonitor
+
+    try:
+        return MemoryMonitor(
+            str(path),
+            float(getattr(settings, "memory_interval", 60.0)),
+            int(getattr(settings, "memory_growth_kb", 16384)),
+        )
+    except Exception as e:
+        logging.warning("Memory monitor disabled: %s", e)
+        return None
 
-def _initialize_game_state(screen: Screen, settings: Settings) -> tuple[AsciiQuarium, DoubleBufferedScreen, dict]:
+
+def _open_config_watcher(settings: Settings):
+    """Return a ConfigWatcher for the loaded config file, or None when disabled/absent."""
+    path = getattr(settings, "config_path", None)
+    if not path or not getattr(settings, "config_reload", True):
+        return None
+    from .util.config_watch import ConfigWatcher
+
+    try:
+        return ConfigWatcher(str(path))
+    except Exception as e:
+        logging.warning("Config reload disabled: %s", e)
+        return None
+
+
+def _apply_config_reload(watcher, app: AsciiQuarium, screen: Screen, settings: Settings, timing_state: dict) -> None:
+    """Apply any edits to the config file since the last poll.
+
+    Args:
+        watcher: ConfigWatcher for the active config file
+        app: AsciiQuarium instance to update
+        screen: Screen interface for population changes
+        settings: Live configuration object
+        timing_state: Timing information; target frame time follows fps changes
+    """
+    from .util.config_watch import apply_settings_changes
+
+    changes = watcher.poll(timing_state["now"], settings)
+    if not changes:
+        return
+    if apply_settings_changes(app, screen, changes):
+        app.rebuild(screen)
+    timing_state["target_dt"] = 1.0 / max(1, settings.fps)
+
+
+def _initialize_game_state(screen: Screen, settings: Settings, clock: Optional[Callable[[], float]] = None) -> tuple[AsciiQuarium, DoubleBufferedScreen, dict]:
     """Initialize the game application and screen buffers.
 
     Args:
         screen: Screen interface for rendering
         settings: Configuration object
+        clock: Optional clock injected into the app (record/replay)
 
     Returns:
         Tuple of (app, double_buffer, timing_state)
     """
-    app = AsciiQuarium(settings)
-    # Wrap the screen with a double buffer to reduce flicker
-    db = DoubleBufferedScreen(screen)
-    app.rebuild(screen)
+    app = AsciiQuarium(settings, clock=clock)
+    # Wrap the screen with a double buffer to reduce flicker; pipelined output
+    # writes each frame on a background thread while the next one is simulated
+    if getattr(settings, "pipelined_output", False):
+        db: DoubleBufferedScreen = PipelinedScreen(screen)
+    else:
+        db = DoubleBufferedScreen(screen)
+    resume_path = getattr(settings, "resume_path", None)
+    resumed = False
+    if resume_path and not getattr(settings, "replay_path", None):
+        from .util.snapshot import restore
+
+        resumed = restore(app, screen, str(resume_path))
+    if not resumed:
+        app.rebuild(screen)
 
     timing_state = {
         "last": time.time(),
         "frame_no": 0,
         "target_dt": 1.0 / max(1, settings.fps),
         "now": time.time(),
-        "dt": 0.0
+        "dt": 0.0,
+        "pacer": FramePacer(settings.fps, spin=float(getattr(settings, "spin_ms", 0.0)) / 1000.0),
     }
+    app.pacer = timing_state["pacer"]
 
     return app, db, timing_state
 
@@ -1608,6 +1981,87 @@ def _update_frame_timing(timing_state: dict, settings: Settings) -> dict:
     }
 
 
+def _drain_events(screen: Screen, limit: int = INPUT_EVENTS_PER_FRAME_MAX) -> list:
+    """Collect up to ``limit`` queued input events, coalescing mouse motion.
+
+    Consecutive mouse events with the same button state only move the pointer,
+    so just the latest motion of each run is kept; the event where the buttons
+    change is always kept (with its coordinates) so click handling still sees
+    every press and release. Events beyond the cap stay queued for the next
+    frame.
+
+    Args:
+        screen: Screen interface to read events from
+
+    Returns:
+        List of events in arrival order
+    """
+    from asciimatics.event import MouseEvent  # type: ignore
+
+    events: list = []
+    # Whether events[-1] is a pure pointer move that a later move may replace
+    last_is_motion = False
+    buttons = None
+    for _ in range(max(1, int(limit))):
+        event = screen.get_event()
+        if event is None:
+            break
+        if not isinstance(event, MouseEvent):
+            events.append(event)
+            last_is_motion = False
+            continue
+        is_motion = event.buttons == buttons
+        buttons = event.buttons
+        if is_motion and last_is_motion:
+            events[-1] = event
+        else:
+            events.append(event)
+        last_is_motion = is_motion
+    return events
+
+
+def _dispatch_events(events: list, app: AsciiQuarium, screen: Screen, settings: Settings, now: float) -> bool:
+    """Handle one frame's worth of input events.
+
+    Arrow-key pans are summed and applied as a single offset change after the
+    other events, so a held key repeating faster than the frame rate moves the
+    view once per frame by the accumulated amount.
+
+    Returns:
+        True if quit was requested, False otherwise
+    """
+    from asciimatics.event import KeyboardEvent  # type: ignore
+
+    try:
+        from asciimatics.screen import Screen as _TermScreen  # type: ignore
+        pan_keys = {_TermScreen.KEY_LEFT: -1, _TermScreen.KEY_RIGHT: 1}
+    except Exception:
+        pan_keys = {}
+    pan_steps = 0
+    for event in events or [None]:
+        if isinstance(event, KeyboardEvent) and event.key_code in pan_keys:
+            pan_steps += pan_keys[event.key_code]
+        elif _handle_keyboard_events(event, app, screen):
+            return True
+        _handle_mouse_events(event, app, screen, settings, now)
+    if pan_steps:
+        _pan_scene(app, screen, pan_steps)
+    return False
+
+
+def _pan_scene(app: AsciiQuarium, screen: Screen, steps: int) -> None:
+    """Move the scene view by ``steps`` pan steps (negative pans left), clamped to the scene."""
+    try:
+        frac = float(getattr(app.settings, "scene_pan_step_fraction", 0.2))
+        step = max(1, int(screen.width * max(0.01, min(1.0, frac))))
+        off = int(getattr(app.settings, "scene_offset", 0))
+        scene_w = int(getattr(app.settings, "scene_width", screen.width))
+        max_off = max(0, scene_w - screen.width)
+        setattr(app.settings, "scene_offset", int(max(0, min(max_off, off + steps * step))))
+    except Exception:
+        pass
+
+
 def _handle_keyboard_events(event, app: AsciiQuarium, screen: Screen) -> bool:
     """Process keyboard input events.
 
@@ -1645,16 +2099,7 @@ def _handle_keyboard_events(event, app: AsciiQuarium, screen: Screen) -> bool:
         try:
             from asciimatics.screen import Screen as _TermScreen  # type: ignore
             if key in (_TermScreen.KEY_LEFT, _TermScreen.KEY_RIGHT):
-                frac = float(getattr(app.settings, "scene_pan_step_fraction", 0.2))
-                step = max(1, int(screen.width * max(0.01, min(1.0, frac))))
-                off = int(getattr(app.settings, "scene_offset", 0))
-                scene_w = int(getattr(app.settings, "scene_width", screen.width))
-                max_off = max(0, scene_w - screen.width)
-                if key == _TermScreen.KEY_LEFT:
-                    off = max(0, off - step)
-                else:
-                    off = min(max_off, off + step)
-                setattr(app.settings, "scene_offset", int(off))
+                _pan_scene(app, screen, -1 if key == _TermScreen.KEY_LEFT else 1)
         except Exception:
             pass
 
@@ -1684,7 +2129,7 @@ def _handle_fishhook_toggle(app: AsciiQuarium, screen: Screen) -> None:
         app: AsciiQuarium instance to modify
         screen: Screen interface for spawning
     """
-    active_hooks = [special for special in app.specials if isinstance(special, FishHook) and special.active]
+    active_hooks = app.specials.active_of_type(FishHook)
     if active_hooks:
         # Retract existing hook on space
         for hook in active_hooks:
@@ -1722,7 +2167,7 @@ def _handle_mouse_events(event, app: AsciiQuarium, screen: Screen, settings: Set
                 if action == "feed":
                     app.specials.extend(spawn_fish_food_at(screen, app, click_x))
                 else:
-                    active_hooks = [special for special in app.specials if isinstance(special, FishHook) and special.active]
+                    active_hooks = app.specials.active_of_type(FishHook)
                     if active_hooks:
                         # Retract existing hook on click
                         for hook in active_hooks:
@@ -1760,6 +2205,12 @@ def _manage_frame_rate(timing_state: dict, settings: Settings) -> None:
         timing_state: Timing information for calculations
         settings: Configuration object for FPS target
     """
+    pacer = timing_state.get("pacer")
+    if pacer is not None:
+        # Follows live fps changes (config reload); deadlines are absolute, so no drift
+        pacer.set_fps(settings.fps)
+        pacer.wait()
+        return
     elapsed = time.time() - timing_state["now"]
     sleep_for = max(0.0, timing_state["target_dt"] - elapsed)
     time.sleep(sleep_for)
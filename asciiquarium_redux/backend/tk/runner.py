@@ -143,7 +143,34 @@ def run_tk(settings) -> None:
 
     last = time.time()
     frame_no = 0
-    target_dt = 1.0 / max(1, settings.fps)
+    from ...util.pacer import FramePacer
+    pacer = FramePacer(settings.fps)
+    app.pacer = pacer
+    control = None
+    if getattr(settings, "control_socket", None):
+        try:
+            from ...util.control import ControlServer
+            control = ControlServer(str(settings.control_socket))
+        except Exception as e:
+            print(f"Control socket unavailable: {e}")
+    memwatch = None
+    if getattr(settings, "memory_log", None):
+        try:
+            from ...util.memwatch import MemoryMonitor
+            memwatch = MemoryMonitor(
+                str(settings.memory_log),
+                float(getattr(settings, "memory_interval", 60.0)),
+                int(getattr(settings, "memory_growth_kb", 16384)),
+            )
+        except Exception as e:
+            print(f"Memory monitor disabled: {e}")
+    watcher = None
+    if getattr(settings, "config_path", None) and getattr(settings, "config_reload", True):
+        try:
+            from ...util.config_watch import ConfigWatcher
+            watcher = ConfigWatcher(str(settings.config_path))
+        except Exception as e:
+            print(f"Config reload disabled: {e}")
 
     resize_job: str | None = None
 
@@ -193,13 +220,14 @@ def run_tk(settings) -> None:
         new_cols = max(1, w // cell_w)
         new_rows = max(1, h // cell_h)
         if new_cols != ctx.cols or new_rows != ctx.rows:
+            old_cols, old_rows = ctx.cols, ctx.rows
             ctx.resize(new_cols, new_rows)
             # Snap canvas to exact grid size to keep alignment crisp
             cw = new_cols * cell_w
             ch = new_rows * cell_h
             if cw != w or ch != h:
                 canvas.config(width=cw, height=ch)
-            app.rebuild(screen)  # type: ignore[arg-type]
+            app.resize(screen, old_cols, old_rows)  # type: ignore[arg-type]
 
     # Listen to canvas size changes (layout or user resize)
     canvas.bind("<Configure>", lambda _e: _schedule_resize())
@@ -208,6 +236,7 @@ def run_tk(settings) -> None:
 
     def tick() -> None:
         nonlocal last, frame_no
+        pacer.frame_started()
         now = time.time()
         dt = min(0.1, now - last)
         last = now
@@ -268,7 +297,7 @@ def run_tk(settings) -> None:
                             print(f"Screenshot failed: {e} / {e2}")
                 if k == " ":
                     from ...entities.specials import FishHook, spawn_fishhook
-                    hooks = [a for a in app.specials if isinstance(a, FishHook) and a.active]
+                    hooks = app.specials.active_of_type(FishHook)
                     if hooks:
                         for h in hooks:
                             if hasattr(h, "retract_now"):
@@ -304,13 +333,25 @@ def run_tk(settings) -> None:
                             app.specials.extend(spawn_fish_food_at(screen, app, click_x))  # type: ignore[arg-type]
                         else:
                             from ...entities.specials import FishHook, spawn_fishhook_to
-                            hooks = [a for a in app.specials if isinstance(a, FishHook) and a.active]
+                            hooks = app.specials.active_of_type(FishHook)
                             if hooks:
                                 for h in hooks:
                                     if hasattr(h, "retract_now"):
                                         h.retract_now()
                             else:
                                 app.specials.extend(spawn_fishhook_to(screen, app, click_x, click_y))  # type: ignore[arg-type]
+        if control is not None:
+            control.process(app, screen)
+        if watcher is not None:
+            try:
+                changes = watcher.poll(now, settings)
+                if changes:
+                    from ...util.config_watch import apply_settings_changes
+                    if apply_settings_changes(app, screen, changes):
+                        app.rebuild(screen)  # type: ignore[arg-type]
+                    pacer.set_fps(settings.fps)
+            except Exception as e:
+                print(f"Config reload failed: {e}")
         try:
             ctx.clear()
             app.update(dt, cast(Screen, screen), frame_no)
@@ -322,11 +363,11 @@ def run_tk(settings) -> None:
             finally:
                 return
         frame_no += 1
+        if memwatch is not None:
+            memwatch.tick(app, now, {"tk_text_ids": len(getattr(ctx, "_text_ids", ()))})
 
-        # Schedule next frame
-        elapsed = time.time() - now
-        delay_ms = max(0, int((target_dt - elapsed) * 1000))
-        root.after(delay_ms, tick)
+        # Schedule next frame against the pacer's absolute deadline
+        root.after(pacer.delay_ms(), tick)
 
     def _activate() -> None:
         try:
@@ -346,3 +387,8 @@ def run_tk(settings) -> None:
     except KeyboardInterrupt:
         # If SIGINT arrives outside our tick, exit quietly.
         pass
+    finally:
+        if control is not None:
+            control.close()
+        if memwatch is not None:
+            memwatch.close(app)
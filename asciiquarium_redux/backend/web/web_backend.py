@@ -164,9 +164,9 @@ class WebApp:
                     self.settings.chest_enabled = new_val  # type: ignore[attr-defined]
                     if self.app is not None and self.screen is not None:
                         if not new_val:
-                            self.app.decor = [d for d in self.app.decor if not isinstance(d, TreasureChest)]
+                            self.app.decor.retire_where(lambda d: isinstance(d, TreasureChest))
                         else:
-                            if not any(isinstance(d, TreasureChest) for d in self.app.decor):
+                            if not self.app.decor.count_of_type(TreasureChest):
                                 try:
                                     self.app.decor.extend(spawn_treasure_chest(self.screen, self.app))  # type: ignore[arg-type]
                                 except Exception as e:
@@ -326,12 +326,11 @@ class WebApp:
                                     except Exception:
                                         pass
                         if dst == "chest_burst_seconds" and self.app is not None:
-                            for d in getattr(self.app, "decor", []):
-                                if isinstance(d, TreasureChest):
-                                    try:
-                                        d.burst_period = float(new_val)
-                                    except Exception:
-                                        pass
+                            for d in self.app.decor.of_type(TreasureChest):
+                                try:
+                                    d.burst_period = float(new_val)
+                                except Exception:
+                                    pass
                 except Exception:
                     pass
         return needs_rebuild
@@ -487,7 +486,7 @@ class WebApp:
             return
         if k == " ":
             # Space: toggle hook (retract if present, else spawn)
-            hooks = [a for a in self.app.specials if isinstance(a, FishHook) and a.active]
+            hooks = self.app.specials.active_of_type(FishHook)
             if hooks:
                 for h in hooks:
                     if hasattr(h, "retract_now"):
@@ -518,7 +517,7 @@ class WebApp:
                 except Exception:
                     pass
             else:
-                hooks = [a for a in self.app.specials if isinstance(a, FishHook) and a.active]
+                hooks = self.app.specials.active_of_type(FishHook)
                 if hooks:
                     for h in hooks:
                         if hasattr(h, "retract_now"):
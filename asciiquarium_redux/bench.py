@@ -0,0 +1,335 @@
+"""Micro-benchmarks for the hot drawing, buffer and AI helpers, with baselines.
+
+Run with ``python -m asciiquarium_redux.bench [run|save|compare]``:
+
+* ``run`` times every case (or those matching ``-k``) and prints ns/op;
+* ``save`` also writes the results to the baseline file
+  (``benchmarks/baseline.json`` in a source checkout, or ``--baseline``);
+* ``compare`` times the cases and flags any that got slower than the baseline
+  by more than ``--tolerance`` (default 15%); the exit status is 1 if any did.
+  A baseline recorded on another interpreter (implementation or major.minor
+  version) is not compared at all: ``compare`` exits with status 2 instead.
+
+Timings use ``timeit`` with an auto-ranged loop count and take the best of
+``--repeat`` runs. Each result is also stored as a *score*: its time divided
+by a fixed pure-Python calibration loop timed in the same process. Scores are
+what ``compare`` checks (``--raw`` compares ns instead), so a baseline saved on
+one machine stays usable on another with a different clock speed. Still,
+refresh the baseline with ``save`` when the workload of a case changes.
+Scores do not carry across interpreter versions, whose relative speed differs
+per operation, so save a fresh baseline after changing the Python version.
+
+Workloads use the real sprites: the fish from ``fish_assets``, the shark and the
+castle, drawn into a 160x45 ``DoubleBufferedScreen``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .ai.bench import _SyntheticSense, _world
+from .ai.brain import FishBrain
+from .ai.steering import SteeringConfig, align, avoid, cohere, compose_velocity, separate
+from .ai.vector import Vec2
+from .backend.web.web_screen import WebScreen
+from .entities.core.fish_assets import FISH_LEFT_MASKS, FISH_RIGHT, FISH_RIGHT_MASKS
+from .entities.environment import CASTLE, CASTLE_MASK, WATER_SEGMENTS, waterline_row
+from .screen_compat import Screen
+from .util import draw_sprite, draw_sprite_masked, draw_sprite_masked_with_bg, randomize_colour_mask
+from .util.buffer import DoubleBufferedScreen
+from .util.settings import Settings
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent.parent / "benchmarks" / "baseline.json"
+DEFAULT_TOLERANCE = 0.15
+# Exit status when the baseline was recorded on a different interpreter
+EXIT_INTERPRETER_MISMATCH = 2
+WIDTH, HEIGHT = 160, 45
+
+Case = Callable[[], Callable[[], Any]]
+
+
+class _Sink:
+    """Screen that discards output (stands in for the terminal)."""
+
+    def __init__(self, width: int = WIDTH, height: int = HEIGHT) -> None:
+        self.width = width
+        self.height = height
+
+    def print_at(self, text: str, x: int, y: int, colour: Optional[int] = None, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def refresh(self) -> None:
+        pass
+
+
+def _buffer() -> DoubleBufferedScreen:
+    return DoubleBufferedScreen(_Sink())  # type: ignore[arg-type]
+
+
+def _shark() -> Tuple[List[str], List[str]]:
+    from .entities.specials.shark import Shark
+
+    shark = Shark(_Sink(), SimpleNamespace(settings=Settings()))  # type: ignore[arg-type]
+    return shark.img_right, shark.mask_right
+
+
+def _school(n: int = 24, seed: int = 1) -> List[Tuple[List[str], List[str], int, int]]:
+    """``n`` fish sprites (with coloured masks) spread over the screen."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        i = rng.randrange(len(FISH_RIGHT))
+        mask = randomize_colour_mask(FISH_RIGHT_MASKS[i], rng)
+        out.append((FISH_RIGHT[i], mask, rng.randrange(-10, WIDTH), rng.randrange(6, HEIGHT - 6)))
+    return out
+
+
+# --- cases: each returns the callable to time (one op per call) ---
+
+def case_draw_sprite() -> Callable[[], Any]:
+    db = _buffer()
+    img, _mask = _shark()
+    return lambda: draw_sprite(db, img, 40, 12, Screen.COLOUR_CYAN)
+
+
+def case_draw_sprite_masked() -> Callable[[], Any]:
+    db = _buffer()
+    school = _school()
+    castle_x = WIDTH - 34
+
+    def op() -> None:
+        for lines, mask, x, y in school:
+            draw_sprite_masked(db, lines, mask, x, y, Screen.COLOUR_WHITE)
+        draw_sprite_masked(db, CASTLE, CASTLE_MASK, castle_x, HEIGHT - len(CASTLE), Screen.COLOUR_WHITE)
+
+    return op
+
+
+def case_draw_sprite_masked_with_bg() -> Callable[[], Any]:
+    db = _buffer()
+    school = _school()
+
+    def op() -> None:
+        for lines, mask, x, y in school:
+            draw_sprite_masked_with_bg(db, lines, mask, x, y, Screen.COLOUR_WHITE, Screen.COLOUR_BLACK)
+
+    return op
+
+
+def case_randomize_colour_mask() -> Callable[[], Any]:
+    rng = random.Random(1)
+    masks = FISH_RIGHT_MASKS + FISH_LEFT_MASKS
+
+    def op() -> None:
+        for mask in masks:
+            randomize_colour_mask(mask, rng)
+
+    return op
+
+
+def case_waterline_row() -> Callable[[], Any]:
+    rows = range(len(WATER_SEGMENTS))
+
+    def op() -> None:
+        for i in rows:
+            waterline_row(i, WIDTH)
+
+    return op
+
+
+def case_buffer_flush() -> Callable[[], Any]:
+    # Two scenes with the school shifted by a column; each flush diffs one against the other
+    frames = []
+    for dx in (0, 1):
+        db = _buffer()
+        for lines, mask, x, y in _school():
+            draw_sprite_masked(db, lines, mask, x + dx, y, Screen.COLOUR_WHITE)
+        frames.append(db._back)
+    db = _buffer()
+    state = {"i": 0}
+
+    def op() -> None:
+        state["i"] ^= 1
+        db._back = frames[state["i"]]
+        db.flush()
+
+    return op
+
+
+def case_web_flush_batches() -> Callable[[], Any]:
+    ws = WebScreen(WIDTH, HEIGHT)
+    for lines, mask, x, y in _school():
+        draw_sprite_masked(ws, lines, mask, x, y, Screen.COLOUR_WHITE)  # type: ignore[arg-type]
+    for i in range(len(WATER_SEGMENTS)):
+        ws.print_at(waterline_row(i, WIDTH), 0, 5 + i, Screen.COLOUR_CYAN)
+    return ws.flush_batches
+
+
+def case_fish_brain_update() -> Callable[[], Any]:
+    cfg = SteeringConfig()
+    neigh, obstacles = _world(8)
+    brain = FishBrain(fish_id=0, rng=random.Random(0), sense=_SyntheticSense(neigh, obstacles), config=cfg)
+    pos, vel = Vec2(0.0, 0.0), Vec2(1.0, 0.1)
+    return lambda: brain.update(0.05, pos, vel)
+
+
+def case_compose_velocity() -> Callable[[], Any]:
+    cfg = SteeringConfig()
+    neigh, obstacles = _world(8)
+    pos, vel = Vec2(0.0, 0.0), Vec2(1.0, 0.1)
+    neigh_pos = [p for _, p, _ in neigh]
+    components = [
+        (align(vel, [v for _, _, v in neigh]), cfg.align_weight),
+        (cohere(pos, neigh_pos), cfg.cohere_weight),
+        (separate(pos, neigh_pos, cfg.separation_radius), cfg.separate_weight),
+        (avoid(pos, obstacles, cfg.obstacle_radius), cfg.avoid_weight),
+    ]
+    return lambda: compose_velocity(vel, components, cfg.max_speed, cfg.max_force)
+
+
+CASES: Dict[str, Case] = {
+    "draw_sprite.shark": case_draw_sprite,
+    "draw_sprite_masked.school+castle": case_draw_sprite_masked,
+    "draw_sprite_masked_with_bg.school": case_draw_sprite_masked_with_bg,
+    "randomize_colour_mask.all_fish": case_randomize_colour_mask,
+    "waterline_row.all_rows": case_waterline_row,
+    "DoubleBufferedScreen.flush": case_buffer_flush,
+    "WebScreen.flush_batches": case_web_flush_batches,
+    "FishBrain.update": case_fish_brain_update,
+    "steering.compose_velocity": case_compose_velocity,
+}
+
+
+# --- timing ---
+
+def _calibration_op() -> int:
+    # Fixed mix of the interpreter work the cases do: loops, tuples, str ops, dict lookups
+    d = {"a": 1, "b": 2}
+    total = 0
+    for i in range(200):
+        t = (str(i), i)
+        total += len(t[0]) + d.get("a" if i & 1 else "b", 0)
+    return total
+
+
+def time_op(op: Callable[[], Any], repeat: int = 5) -> float:
+    """Best-of-``repeat`` time per call of ``op`` in nanoseconds."""
+    timer = timeit.Timer(op)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=max(1, repeat), number=number))
+    return best * 1e9 / number
+
+
+def run(pattern: Optional[str] = None, repeat: int = 5) -> Dict[str, Any]:
+    """Time the selected cases; returns a baseline-shaped dict."""
+    calib = time_op(_calibration_op, repeat)
+    results: Dict[str, Dict[str, float]] = {}
+    for name, case in CASES.items():
+        if pattern and not re.search(pattern, name):
+            continue
+        ns = time_op(case(), repeat)
+        results[name] = {"ns": round(ns, 1), "score": round(ns / calib, 4)}
+    return {
+        "python": platform.python_version(),
+        "python_minor": _python_minor(platform.python_version()),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "calibration_ns": round(calib, 1),
+        "results": results,
+    }
+
+
+def _python_minor(version: str) -> str:
+    return ".".join(str(version).split(".")[:2])
+
+
+def _interpreter(result: Dict[str, Any]) -> str:
+    """Implementation and major.minor version a result was recorded on, e.g. "CPython 3.13"."""
+    minor = result.get("python_minor") or _python_minor(result.get("python", "?"))
+    return f"{result.get('implementation', 'CPython')} {minor}"
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE, raw: bool = False) -> List[str]:
+    """Print a comparison table; returns the names of cases that regressed."""
+    key = "ns" if raw else "score"
+    base_results = baseline.get("results", {})
+    regressions: List[str] = []
+    print(f"{'case':40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, cur in current["results"].items():
+        base = base_results.get(name)
+        if base is None or not base.get(key):
+            print(f"{name:40} {'-':>12} {cur[key]:>12} {'new':>8}")
+            continue
+        change = cur[key] / base[key] - 1.0
+        flag = ""
+        if change > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -tolerance:
+            flag = "  faster"
+        print(f"{name:40} {base[key]:>12} {cur[key]:>12} {change:>+7.1%}{flag}")
+    return regressions
+
+
+def _print(result: Dict[str, Any]) -> None:
+    print(f"Python {result['python']} ({result['implementation']}, {result['machine']}); calibration {result['calibration_ns']} ns")
+    for name, r in result["results"].items():
+        print(f"  {name:40} {r['ns']:>12.1f} ns/op  score {r['score']}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for hot drawing, buffer and AI helpers")
+    parser.add_argument("command", nargs="?", choices=["run", "save", "compare"], default="run")
+    parser.add_argument("-k", dest="pattern", help="only cases whose name matches this regex")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown (0.15 = 15%%)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--raw", action="store_true", help="compare ns/op instead of calibrated scores")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and not args.baseline.exists():
+        raise SystemExit(f"no baseline at {args.baseline}; create one with 'save'")
+    here = _interpreter({"python": platform.python_version(), "implementation": platform.python_implementation()})
+    baseline: Optional[Dict[str, Any]] = None
+    if args.command != "run" and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if args.command == "compare" and baseline is not None and _interpreter(baseline) != here:
+        print(f"baseline {args.baseline} is from {_interpreter(baseline)}, this is {here}; skipping comparison")
+        print("save a baseline with this interpreter to compare against it")
+        sys.exit(EXIT_INTERPRETER_MISMATCH)
+    result = run(args.pattern, args.repeat)
+    if args.command == "run":
+        _print(result)
+    elif args.command == "save":
+        _print(result)
+        if args.pattern and baseline is not None and _interpreter(baseline) == here:
+            # Partial run: update only the selected cases
+            merged = baseline
+            merged.setdefault("results", {}).update(result["results"])
+            merged.update({k: v for k, v in result.items() if k != "results"})
+            result = merged
+        elif args.pattern and baseline is not None:
+            print(f"baseline was from {_interpreter(baseline)}; replacing it with only the selected cases")
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"saved baseline to {args.baseline}")
+    else:
+        assert baseline is not None
+        regressions = compare(result, baseline, args.tolerance, args.raw)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
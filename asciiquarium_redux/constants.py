@@ -12,6 +12,7 @@ the application, organized by functional category for better maintainability.
 # Movement multipliers and timing
 MOVEMENT_MULTIPLIER = 20.0          # Standard dt multiplier for entity movement
 MAX_DELTA_TIME = 0.1                # Maximum allowed delta time per frame
+INPUT_EVENTS_PER_FRAME_MAX = 64     # Input events drained from the queue per frame
 
 # Fish movement physics
 FISH_DEFAULT_SPEED_MIN = 0.6        # Minimum fish swimming speed
@@ -43,6 +44,7 @@ FISH_TURN_SHRINK_DURATION = 0.35    # Seconds for fish shrinking phase during tu
 FISH_TURN_EXPAND_DURATION = 0.35    # Seconds for fish expanding phase during turn
 FISH_TURN_COOLDOWN_MIN = 4.0        # Minimum time before fish can turn again
 FISH_TURN_COOLDOWN_MAX = 10.0       # Maximum time before fish can turn again
+FISH_TURN_FRAME_CACHE_SIZE = 64     # Max (sprite, mask) pairs with precomputed turn frames
 
 # Fishhook timing
 FISHHOOK_IMPACT_PAUSE_DURATION = 0.35   # Pause after hook impact to show splat
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ..screen_compat import Screen
-from ..util import draw_sprite, draw_sprite_masked_with_bg, draw_sprite_masked
+from ..util import View, draw_sprite, draw_sprite_masked_with_bg, draw_sprite_masked
 
 if TYPE_CHECKING:
     from ..protocols import ScreenProtocol, AsciiQuariumProtocol
@@ -88,7 +88,7 @@ class Actor:
         """
         ...
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional[View] = None) -> None:
         """Render entity visual representation to the screen.
 
         Called once per frame after update() to draw the entity's current
@@ -97,6 +97,8 @@ class Actor:
         Args:
             screen: Screen abstraction for rendering operations
             mono: Whether to use monochrome rendering (no colors)
+            view: Scene -> screen transform; positions stay in scene coordinates
+                and are mapped by the draw helpers (None = identity)
 
         Implementation Notes:
             - Must respect screen boundaries and handle clipping
@@ -116,6 +118,7 @@ class Actor:
             py: int,
             primary_colour: int,
             background_colour: int = Screen.COLOUR_BLACK,
+            view: Optional[View] = None,
     ):
         """Identify the proper render method and draw sprite.
 
@@ -131,13 +134,17 @@ class Actor:
             py: Y coordinate for the top-left corner of the sprite
             primary_colour: Primary colour of the sprite
             background_colour: Background colour for masked sprites
+            view: Scene -> screen transform passed down to the draw helpers
 
         Implementation Notes:
             - Should be called from draw() on the child class after appropriate
                 variables have been set up
+            - Sprites whose bounding box misses the view are skipped up front
         """
+        if view is not None and not view.visible(screen, px, py, max(map(len, img), default=0), len(img)):
+            return
         if app.settings.color == "mono":
-            draw_sprite(screen, img, px, py, Screen.COLOUR_WHITE)
+            draw_sprite(screen, img, px, py, Screen.COLOUR_WHITE, view)
         else:
             if app.settings.solid_fish:
                 draw_sprite_masked_with_bg(
@@ -147,7 +154,8 @@ class Actor:
                     px,
                     py,
                     primary_colour,
-                    background_colour
+                    background_colour,
+                    view,
                 )
             else:
                 draw_sprite_masked(
@@ -156,7 +164,8 @@ class Actor:
                     img_mask,
                     px,
                     py,
-                    primary_colour
+                    primary_colour,
+                    view,
                 )
 
     @property
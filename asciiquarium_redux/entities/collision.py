@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class CollisionService:
+    """Per-frame broadphase over fish bounding boxes.
+
+    Fish are bucketed into a coarse uniform grid by their (scene-space) bounding
+    boxes. Queries gather candidates from the few cells a point or rect touches
+    and confirm them against the live fish position, so entries stay correct if
+    a fish moved slightly since the last rebuild (``margin`` widens the cell
+    lookup to cover that drift).
+
+    Removals are deferred: ``retire`` tombstones a fish so later queries in the
+    same frame ignore it, and ``flush_retired`` drops all tombstoned fish from
+    the population in one pass instead of O(N) ``list.remove`` calls mid-loop.
+    """
+
+    def __init__(self, cell_w: int = 16, cell_h: int = 8, margin: int = 2) -> None:
+        self.cell_w = max(1, int(cell_w))
+        self.cell_h = max(1, int(cell_h))
+        self.margin = max(0, int(margin))
+        self._grid: Dict[Tuple[int, int], List[Any]] = {}
+        # Tombstones keyed by id; values keep the fish alive so ids cannot be reused before flush
+        self._retired: Dict[int, Any] = {}
+        # Ad hoc services (see collisions_for) have no end-of-frame flush, so they remove at once
+        self._population: Optional[List[Any]] = None
+
+    def rebuild(self, fish: Iterable[Any]) -> None:
+        """Re-bucket all fish at their current positions."""
+        grid: Dict[Tuple[int, int], List[Any]] = {}
+        cw, ch = self.cell_w, self.cell_h
+        retired = self._retired
+        for f in fish:
+            if retired and id(f) in retired:
+                continue
+            x0, y0 = int(f.x), int(f.y)
+            x1, y1 = x0 + max(1, int(f.width)) - 1, y0 + max(1, int(f.height)) - 1
+            for cx in range(x0 // cw, x1 // cw + 1):
+                for cy in range(y0 // ch, y1 // ch + 1):
+                    bucket = grid.get((cx, cy))
+                    if bucket is None:
+                        grid[(cx, cy)] = [f]
+                    else:
+                        bucket.append(f)
+        self._grid = grid
+
+    def candidates(self, x0: int, y0: int, x1: int, y1: int) -> List[Any]:
+        """Broadphase: fish bucketed in cells overlapping [x0, x1] x [y0, y1] (inclusive)."""
+        if not self._grid:
+            return []
+        m = self.margin
+        cw, ch = self.cell_w, self.cell_h
+        out: List[Any] = []
+        seen: Set[int] = set()
+        retired = self._retired
+        for cx in range((x0 - m) // cw, (x1 + m) // cw + 1):
+            for cy in range((y0 - m) // ch, (y1 + m) // ch + 1):
+                bucket = self._grid.get((cx, cy))
+                if not bucket:
+                    continue
+                for f in bucket:
+                    k = id(f)
+                    if k in seen or k in retired:
+                        continue
+                    seen.add(k)
+                    out.append(f)
+        return out
+
+    def query_point(self, x: int, y: int, where: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        """Fish whose bounding box contains the cell (x, y)."""
+        hits: List[Any] = []
+        for f in self.candidates(x, y, x, y):
+            fx, fy = int(f.x), int(f.y)
+            if fx <= x < fx + f.width and fy <= y < fy + f.height:
+                if where is None or where(f):
+                    hits.append(f)
+        return hits
+
+    def query_rect(self, x: int, y: int, w: int, h: int, where: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        """Fish whose bounding box overlaps the rect at (x, y) of size w x h."""
+        hits: List[Any] = []
+        for f in self.candidates(x, y, x + max(1, w) - 1, y + max(1, h) - 1):
+            fx, fy = int(f.x), int(f.y)
+            if x < fx + f.width and fx < x + w and y < fy + f.height and fy < y + h:
+                if where is None or where(f):
+                    hits.append(f)
+        return hits
+
+    # --- deferred removal ---
+    def retire(self, fish: Any) -> None:
+        self._retired[id(fish)] = fish
+        if self._population is not None:
+            try:
+                self._population.remove(fish)
+            except ValueError:
+                pass
+
+    def is_retired(self, fish: Any) -> bool:
+        return id(fish) in self._retired
+
+    def flush_retired(self, population: List[Any]) -> int:
+        """Remove tombstoned fish from ``population`` in place; return how many were dropped."""
+        if not self._retired:
+            return 0
+        retired = self._retired
+        before = len(population)
+        population[:] = [f for f in population if id(f) not in retired]
+        self._retired = {}
+        return before - len(population)
+
+
+def collisions_for(app: Any) -> CollisionService:
+    """Return the app's collision service, or a one-off one built from ``app.fish``."""
+    svc = getattr(app, "collisions", None)
+    if svc is None:
+        svc = CollisionService()
+        svc.rebuild(getattr(app, "fish", []))
+        svc._population = getattr(app, "fish", None)
+    return svc
@@ -5,7 +5,7 @@ from .fish_assets import (
     FISH_LEFT_MASKS,
     random_fish_frames,
 )
-from .seaweed import Seaweed
+from .seaweed import Seaweed, draw_seaweed
 from .bubble import Bubble
 from .splat import Splat
 from .fish import Fish
@@ -18,6 +18,7 @@ __all__ = [
     "FISH_LEFT_MASKS",
     "random_fish_frames",
     "Seaweed",
+    "draw_seaweed",
     "Bubble",
     "Splat",
     "Fish",
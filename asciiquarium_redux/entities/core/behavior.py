@@ -27,12 +27,13 @@ class ClassicBehaviorEngine(BehaviorEngine):
 
     def step(self, fish: "Fish", dt: float, screen: "Screen", app: "AsciiQuariumProtocol") -> BehaviorResult:
         res = BehaviorResult()
+        rng = fish.rng or random
         # Fish tank edge awareness: turn before hitting edges if enabled
         if getattr(app.settings, "fish_tank", False) and not fish.turning and not fish.hooked:
             margin = max(0, int(getattr(app.settings, "fish_tank_margin", 3)))
             left_limit = 0 + margin
             right_limit = screen.width - fish.width - margin
-            vx = fish.vx if fish.vx != 0 else (fish.speed_min if random.random() < 0.5 else -fish.speed_min)
+            vx = fish.vx if fish.vx != 0 else (fish.speed_min if rng.random() < 0.5 else -fish.speed_min)
             # Trigger a turn exactly at the margin boundary
             if vx > 0 and fish.x >= right_limit:
                 res.request_turn = True
@@ -44,7 +45,7 @@ class ClassicBehaviorEngine(BehaviorEngine):
         if not fish.hooked and fish.turn_enabled:
             fish.next_turn_ok_in = max(0.0, float(fish.next_turn_ok_in) - dt)
             if not fish.turning and fish.next_turn_ok_in <= 0.0:
-                if random.random() < max(0.0, float(fish.turn_chance_per_second)) * dt:
+                if rng.random() < max(0.0, float(fish.turn_chance_per_second)) * dt:
                     res.request_turn = True
         # Horizontal speed target drift
         if not fish.hooked:
@@ -52,15 +53,15 @@ class ClassicBehaviorEngine(BehaviorEngine):
                 fish.speed_target = max(fish.speed_min, min(fish.speed_max, abs(fish.vx)))
             fish.speed_change_in -= dt
             if fish.speed_change_in <= 0.0:
-                fish.speed_target = random.uniform(fish.speed_min, fish.speed_max)
-                fish.speed_change_in = random.uniform(fish.speed_change_interval_min, fish.speed_change_interval_max)
+                fish.speed_target = rng.uniform(fish.speed_min, fish.speed_max)
+                fish.speed_change_in = rng.uniform(fish.speed_change_interval_min, fish.speed_change_interval_max)
             sign = 1.0 if fish.vx >= 0.0 else -1.0
             res.desired_vx = sign * float(fish.speed_target)
         # Vertical drift
         v_max = max(0.0, float(getattr(app.settings, "fish_vertical_speed_max", 0.3)))
         if not fish.hooked and v_max > 0.0:
-            if random.random() < 0.8 * dt:
-                new_vy = random.uniform(-v_max, v_max)
+            if rng.random() < 0.8 * dt:
+                new_vy = rng.uniform(-v_max, v_max)
                 min_mag = min(0.3, v_max * 0.5)
                 if abs(new_vy) < min_mag:
                     new_vy = min_mag if new_vy >= 0 else -min_mag
@@ -86,47 +87,14 @@ class AIBehaviorEngine(BehaviorEngine):
             except Exception:
                 pass
         try:
-            from ...ai.brain import FishBrain  # local import to avoid cycles at import time
+            from ...ai.brain import brain_params, build_brain  # local import to avoid cycles at import time
             from ...ai.vector import Vec2
-            try:
-                from ...ai.steering import SteeringConfig as _SteeringCfg
-            except Exception:
-                _SteeringCfg = None  # type: ignore
 
-            if fish._brain is None and FishBrain is not None:
+            if fish._brain is None:
+                # Seeded from the fish's own stream so brains do not depend on update order
+                rng = random.Random((fish.rng or random).getrandbits(30))
                 max_speed = max(fish.speed_min, fish.speed_max)
-                cfg = (
-                    _SteeringCfg(
-                        max_speed=max_speed,
-                        max_force=max_speed,
-                        separation_radius=float(getattr(app.settings, "ai_separation_radius", 3.0)),
-                        obstacle_radius=float(getattr(app.settings, "ai_obstacle_radius", 3.0)),
-                        align_weight=float(getattr(app.settings, "ai_flock_alignment", 0.8)),
-                        cohere_weight=float(getattr(app.settings, "ai_flock_cohesion", 0.5)),
-                        separate_weight=float(getattr(app.settings, "ai_flock_separation", 1.2)),
-                        avoid_weight=float(getattr(app.settings, "ai_baseline_avoid", 0.9)),
-                        wander_weight=float(getattr(app.settings, "ai_explore_gain", 0.6)),
-                    )
-                    if _SteeringCfg is not None
-                    else None
-                )
-                import random as _rand
-                rng = _rand.Random(_rand.randrange(1 << 30))
-                fish._brain = FishBrain(
-                    fish_id=id(fish),
-                    rng=rng,
-                    sense=app,  # type: ignore[arg-type]
-                    config=cfg,  # type: ignore[arg-type]
-                    util_temp=float(getattr(app.settings, "ai_action_temperature", 0.6)),
-                    wander_tau=float(getattr(app.settings, "ai_wander_tau", 1.2)),
-                    eat_gain=float(getattr(app.settings, "ai_eat_gain", 1.2)),
-                    hide_gain=float(getattr(app.settings, "ai_hide_gain", 1.5)),
-                    flock_alignment=float(getattr(app.settings, "ai_flock_alignment", 0.8)),
-                    flock_cohesion=float(getattr(app.settings, "ai_flock_cohesion", 0.5)),
-                    flock_separation=float(getattr(app.settings, "ai_flock_separation", 1.2)),
-                    baseline_separation=float(getattr(app.settings, "ai_baseline_separation", 0.6)),
-                    baseline_avoid=float(getattr(app.settings, "ai_baseline_avoid", 0.9)),
-                )
+                fish._brain = build_brain(id(fish), rng, app, max_speed, brain_params(app.settings))  # type: ignore[arg-type]
 
             if fish._brain is not None:
                 pos = Vec2(float(fish.x), float(fish.y))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from ...protocols import AsciiQuariumProtocol
@@ -12,6 +12,7 @@ else:
 
 # Maximum bubble lifetime to prevent memory leaks
 MAX_BUBBLE_LIFETIME = 10.0
+BUBBLE_GLYPHS = (".", "o", "O")
 
 
 @dataclass
@@ -91,7 +92,7 @@ class Bubble:
         self.lifetime += dt
         self.y -= max(1, int(10 * dt))
 
-    def draw(self, screen: Screen):
+    def draw(self, screen: Screen, rng: Optional[random.Random] = None):
         if 0 <= self.y < screen.height:
-            bubble_char = random.choice([".", "o", "O"])
+            bubble_char = (rng or random).choice(BUBBLE_GLYPHS)
             screen.print_at(bubble_char, self.x, self.y, colour=Screen.COLOUR_CYAN)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import random
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...protocols import AsciiQuariumProtocol
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
 else:
     from ...screen_compat import Screen
 
-from ...util import draw_sprite, draw_sprite_masked, draw_sprite_masked_with_bg, randomize_colour_mask
+from ...util import View, draw_sprite, draw_sprite_masked, draw_sprite_masked_with_bg, randomize_colour_mask
 from .behavior import BehaviorEngine, ClassicBehaviorEngine, AIBehaviorEngine
 from .fish_assets import (
     FISH_RIGHT,
@@ -20,6 +21,7 @@ from .fish_assets import (
 )
 from .bubble import Bubble
 from .splat import Splat
+from ..collision import collisions_for
 from ...constants import (
     MOVEMENT_MULTIPLIER,
     FISH_DEFAULT_SPEED_MIN,
@@ -32,6 +34,7 @@ from ...constants import (
     FISH_TURN_EXPAND_DURATION,
     FISH_TURN_COOLDOWN_MIN,
     FISH_TURN_COOLDOWN_MAX,
+    FISH_TURN_FRAME_CACHE_SIZE,
 )
 
 # Optional AI imports are local to avoid import cycles at module import
@@ -45,6 +48,69 @@ except Exception:  # pragma: no cover - AI optional
     SteeringConfig = None  # type: ignore[assignment]
 
 
+# Precomputed accordion frames used while a fish turns. Keyed by the exact
+# (sprite, mask) content; each entry maps an odd visible width to the
+# compressed (lines, mask) pair. Least-recently-used pairs are evicted.
+_TurnFrames = Dict[int, Tuple[List[str], Optional[List[str]]]]
+_TURN_FRAME_CACHE: "OrderedDict[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]], _TurnFrames]" = OrderedDict()
+
+
+def _compress_turn_frames(lines: Tuple[str, ...], mask: Optional[Tuple[str, ...]]) -> _TurnFrames:
+    """Build the compressed frames for every odd visible width of a sprite.
+
+    Each row keeps its glyphs (spaces dropped) and a centered slice of at most
+    ``vis`` of them is centered again within ``vis`` columns, so every non-empty
+    row retains at least one glyph until ``vis`` reaches 1. Mask rows follow the
+    same selection so colours stay aligned with the kept glyphs.
+    """
+    w = max((len(r) for r in lines), default=1)
+    # Per-row (glyph, mask char) pairs; computed once for all widths
+    rows: List[List[Tuple[str, str]]] = []
+    for dy, row in enumerate(lines):
+        mrow = (mask[dy] if dy < len(mask) else '') if mask is not None else ''
+        rows.append([(ch, (mrow[i] if i < len(mrow) else ' ')) for i, ch in enumerate(row) if ch != ' '])
+    out: _TurnFrames = {}
+    for vis in range(1, max(1, w) + 1, 2):
+        new_lines: List[str] = []
+        new_mask: Optional[List[str]] = [] if mask is not None else None
+        for pairs in rows:
+            if not pairs:
+                new_lines.append(' ' * vis)
+                if new_mask is not None:
+                    new_mask.append(' ' * vis)
+                continue
+            k = min(len(pairs), vis)
+            start = (len(pairs) - k) // 2
+            sel = pairs[start:start + k]
+            pad = vis - len(sel)
+            left = pad // 2
+            right = pad - left
+            new_lines.append((' ' * left) + ''.join(ch for ch, _ in sel) + (' ' * right))
+            if new_mask is not None:
+                new_mask.append((' ' * left) + ''.join(mc for _, mc in sel) + (' ' * right))
+        out[vis] = (new_lines, new_mask)
+    return out
+
+
+def _turn_frame(lines: List[str], mask: Optional[List[str]], vis: int) -> Tuple[List[str], Optional[List[str]]]:
+    """Return the cached compressed frame of ``lines``/``mask`` at width ``vis``."""
+    key = (tuple(lines), tuple(mask) if mask is not None else None)
+    frames = _TURN_FRAME_CACHE.get(key)
+    if frames is None:
+        frames = _compress_turn_frames(key[0], key[1])
+        _TURN_FRAME_CACHE[key] = frames
+        while len(_TURN_FRAME_CACHE) > FISH_TURN_FRAME_CACHE_SIZE:
+            _TURN_FRAME_CACHE.popitem(last=False)
+    else:
+        _TURN_FRAME_CACHE.move_to_end(key)
+    frame = frames.get(vis)
+    if frame is None:
+        # Even or out-of-range widths snap to the nearest precomputed odd width
+        odd = [v for v in frames if v <= vis] or [min(frames)]
+        frame = frames[max(odd)]
+    return frame
+
+
 @dataclass
 class Fish:
     """Main fish entity representing the core population of the aquarium.
@@ -192,6 +258,8 @@ class Fish:
     turn_min_interval: float = 6.0
     # Optional AI brain (constructed by first update if enabled)
     _brain: Any = None
+    # Own random stream for per-frame rolls (set by the app); None falls back to the global module
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
     # Species/type info
     species_id: int = -1
     # Logical size bucket; by default set from sprite height at creation
@@ -242,6 +310,7 @@ class Fish:
             screen: Screen interface for boundary checking
             app: Main application instance for spawning bubbles
         """
+        rng = self.rng or random
         # Select behavior engine once per update
         use_ai = bool(getattr(app.settings, "ai_enabled", False))
         engine: BehaviorEngine = AIBehaviorEngine() if use_ai else ClassicBehaviorEngine()
@@ -277,7 +346,7 @@ class Fish:
                     not self.turning and
                     not self.hooked and
                     self.next_turn_ok_in <= 0):
-                if random.random() < (self.turn_chance_per_second * dt):
+                if rng.random() < (self.turn_chance_per_second * dt):
                     self.start_turn()
 
         # Apply acceleration-limited change toward desired_vx (if set)
@@ -371,28 +440,35 @@ class Fish:
 
         # Mouth collision with fish food flakes
         try:
-            from ..specials import FishFoodFlake  # type: ignore
             mx = int(self.scene_x + (self.width - 1 if self.vx > 0 else 0))
             my = int(self.scene_y + self.height // 2)
             # Prefer fish food: if any active flakes are present and intersect, consume them
             ate_food = False
-            for s in list(app.specials):
-                if isinstance(s, FishFoodFlake) and getattr(s, "active", True):
-                    sx, sy = int(getattr(s, "x", 0)), int(getattr(s, "y", 0))
-                    if abs(sx - mx) <= 1 and abs(sy - my) <= 0:
-                        setattr(s, "_active", False)
-                        if getattr(self, "_brain", None) is not None:
-                            try:
-                                self._brain.hunger = max(0.0, float(self._brain.hunger) - 0.5)
-                            except Exception:
-                                pass
-                        ate_food = True
-                        break
+            snap = getattr(app, "world_sense", None)
+            if snap is not None:
+                flake = snap.flake_at(mx, my)
+            else:
+                from ..specials import FishFoodFlake  # type: ignore
+                flake = None
+                for s in list(app.specials):
+                    if isinstance(s, FishFoodFlake) and getattr(s, "active", True):
+                        if abs(int(getattr(s, "x", 0)) - mx) <= 1 and int(getattr(s, "y", 0)) == my:
+                            flake = s
+                            break
+            if flake is not None:
+                setattr(flake, "_active", False)
+                if getattr(self, "_brain", None) is not None:
+                    try:
+                        self._brain.hunger = max(0.0, float(self._brain.hunger) - 0.5)
+                    except Exception:
+                        pass
+                ate_food = True
             # If very hungry and didn't find fish food to eat, allow predation on smaller fish
             if not ate_food and getattr(self, "_brain", None) is not None:
                 try:
                     if float(self._brain.hunger) >= float(getattr(self._brain, "hunt_threshold", 0.8)):
-                        for other in list(app.fish):
+                        # Broadphase: only fish bucketed near the mouth row can be prey
+                        for other in collisions_for(app).candidates(mx - 1, my, mx + 1, my):
                             if other is self:
                                 continue
                             # Only eat strictly smaller fish by height
@@ -429,7 +505,7 @@ class Fish:
             view_off = int(getattr(app.settings, "scene_offset", 0))
             bubble_x = int(self.scene_x - view_off + (self.width if self.vx > 0 else -1))
             app.bubbles.append(Bubble(x=bubble_x, y=bubble_y))
-            self.next_bubble = random.uniform(self.bubble_min, self.bubble_max)
+            self.next_bubble = rng.uniform(self.bubble_min, self.bubble_max)
 
         # Respawn when leaving scene bounds (scene mode): reappear off current view
         if not bool(getattr(app.settings, "fish_tank", False)):
@@ -451,7 +527,7 @@ class Fish:
                 self.turn_t = 0.0
                 self.next_turn_ok_in = max(
                     self.turn_min_interval,
-                    random.uniform(
+                    rng.uniform(
                         self.turn_min_interval,
                         self.turn_min_interval + (FISH_TURN_COOLDOWN_MAX - FISH_TURN_COOLDOWN_MIN),
                     ),
@@ -470,31 +546,33 @@ class Fish:
 
     def _handle_vertical_bound(self, at_top: bool, v_max: float, top_bound: float, bottom_bound: float) -> None:
         """Resolve vertical collision at top/bottom by stopping or reflecting vy."""
-        if random.random() < 0.5:
+        rng = self.rng or random
+        if rng.random() < 0.5:
             self.vy = 0.0
         else:
             if self.vy != 0:
                 self.vy = abs(self.vy) if at_top else -abs(self.vy)
             else:
-                val = random.uniform(0.05, v_max)
+                val = rng.uniform(0.05, v_max)
                 self.vy = val if at_top else -val
         self.scene_y = float(top_bound if at_top else bottom_bound)
 
     def respawn(self, screen: Screen, direction: int):
+        rng = self.rng or random
         # choose new frames and matching mask
         if direction > 0:
             frame_choices = list(zip(FISH_RIGHT, FISH_RIGHT_MASKS))
         else:
             frame_choices = list(zip(FISH_LEFT, FISH_LEFT_MASKS))
-        frames, colour_mask = random.choice(frame_choices)
+        frames, colour_mask = rng.choice(frame_choices)
         self.frames = frames
-        self.colour_mask = randomize_colour_mask(colour_mask)
+        self.colour_mask = randomize_colour_mask(colour_mask, rng)
         # Pick a new horizontal speed within bounds and set direction
-        self.vx = random.uniform(self.speed_min, self.speed_max) * direction
+        self.vx = rng.uniform(self.speed_min, self.speed_max) * direction
         # Reset speed modulation targets
         self.speed_target = abs(self.vx)
         self.desired_vx = self.vx
-        self.speed_change_in = random.uniform(self.speed_change_interval_min, self.speed_change_interval_max)
+        self.speed_change_in = rng.uniform(self.speed_change_interval_min, self.speed_change_interval_max)
 
         # compute y-band respecting waterline and screen size
         default_low_y = max(self.waterline_top + self.water_rows + 1, 1)
@@ -510,7 +588,7 @@ class Fish:
             self.y = max(1, min(screen.height - self.height - 1, screen.height // 2))
             self.scene_y = self.y
         else:
-            self.y = random.randint(min_y, max(min_y, max_y))
+            self.y = rng.randint(min_y, max(min_y, max_y))
             self.scene_y = self.y
         self.x = -self.width if direction > 0 else screen.width
         self.scene_x = self.x
@@ -525,6 +603,7 @@ class Fish:
         In scene mode: fish reappear somewhere in the wider scene but never popping into the visible window.
         In fish-tank mode: fallback to classic edge respawn.
         """
+        rng = self.rng or random
         try:
             if bool(getattr(app.settings, "fish_tank", False)):
                 # Classic behavior in tank mode
@@ -541,13 +620,13 @@ class Fish:
             frame_choices = list(zip(FISH_RIGHT, FISH_RIGHT_MASKS))
         else:
             frame_choices = list(zip(FISH_LEFT, FISH_LEFT_MASKS))
-        frames, colour_mask = random.choice(frame_choices)
+        frames, colour_mask = rng.choice(frame_choices)
         self.frames = frames
-        self.colour_mask = randomize_colour_mask(colour_mask)
-        self.vx = random.uniform(self.speed_min, self.speed_max) * direction
+        self.colour_mask = randomize_colour_mask(colour_mask, rng)
+        self.vx = rng.uniform(self.speed_min, self.speed_max) * direction
         self.speed_target = abs(self.vx)
         self.desired_vx = self.vx
-        self.speed_change_in = random.uniform(self.speed_change_interval_min, self.speed_change_interval_max)
+        self.speed_change_in = rng.uniform(self.speed_change_interval_min, self.speed_change_interval_max)
 
         # Vertical band
         default_low_y = max(self.waterline_top + self.water_rows + 1, 1)
@@ -560,7 +639,7 @@ class Fish:
             self.y = max(1, min(screen.height - self.height - 1, screen.height // 2))
             self.scene_y = self.y
         else:
-            self.y = random.randint(min_y, max(min_y, max_y))
+            self.y = rng.randint(min_y, max(min_y, max_y))
             self.scene_y = self.y
 
         # Pick a scene_x outside the current view
@@ -575,8 +654,8 @@ class Fish:
         if right_hi > right_lo:
             ranges.append((right_lo, right_hi))
         if ranges:
-            lo, hi = random.choice(ranges)
-            self.scene_x = float(random.randint(lo, max(lo, hi)))
+            lo, hi = rng.choice(ranges)
+            self.scene_x = float(rng.randint(lo, max(lo, hi)))
         else:
             # Fallback if the view covers the entire scene
             self.scene_x = float(-fish_w if direction > 0 else scene_w + 1)
@@ -586,7 +665,8 @@ class Fish:
         self.turn_phase = "idle"
         self.turn_t = 0.0
 
-    def draw(self, screen: Screen):
+    def draw(self, screen: Screen, view: Optional[View] = None):
+        # Position is in scene coordinates; ``view`` maps it to the screen
         lines = self.frames
         mask = self.colour_mask
         x_off = 0
@@ -606,46 +686,8 @@ class Fish:
                     vis -= 1
             else:
                 vis = 1
-            # Accordion compression: for each row, keep glyphs, drop spaces, and center a slice of length `vis`.
-            # This guarantees each non-empty row retains at least one glyph until vis=1.
-            def _compress_row(row: str, target: int) -> str:
-                # Collect glyphs (non-space)
-                glyphs = [ch for ch in row if ch != ' ']
-                if not glyphs:
-                    return ' ' * max(1, target)
-                # Choose centered slice of glyphs of length <= target
-                k = min(len(glyphs), max(1, target))
-                start = (len(glyphs) - k) // 2
-                sel = glyphs[start:start + k]
-                # Center within target width
-                pad = max(0, target - len(sel))
-                left = pad // 2
-                right = pad - left
-                return (' ' * left) + ''.join(sel) + (' ' * right)
-            def _compress_mask_row(row: str, mrow: str, target: int) -> str:
-                # Mirror the selection logic used in _compress_row to align colours with kept glyphs
-                pairs = [(ch, (mrow[i] if i < len(mrow) else ' ')) for i, ch in enumerate(row) if ch != ' ']
-                if not pairs:
-                    return ' ' * max(1, target)
-                k = min(len(pairs), max(1, target))
-                start = (len(pairs) - k) // 2
-                sel = pairs[start:start + k]
-                mchars = [mc for (_, mc) in sel]
-                pad = max(0, target - len(mchars))
-                left = pad // 2
-                right = pad - left
-                return (' ' * left) + ''.join(mchars) + (' ' * right)
-            # Apply compression per row
-            new_lines: List[str] = []
-            new_mask: Optional[List[str]] = [] if mask is not None else None
-            for dy, row in enumerate(lines):
-                new_lines.append(_compress_row(row, vis))
-                if new_mask is not None:
-                    mrow = mask[dy] if dy < len(mask) else ''  # type: ignore[index]
-                    new_mask.append(_compress_mask_row(row, mrow, vis))
-            lines = new_lines
-            if new_mask is not None:
-                mask = new_mask  # type: ignore[assignment]
+            # Accordion compression: frames for every odd width are precomputed per sprite
+            lines, mask = _turn_frame(lines, mask, vis)
             # Shift draw position so the center stays stable during shrink/expand
             left = (w - vis) // 2
             x_off = left
@@ -659,11 +701,11 @@ class Fish:
                     pass
             if solid_fish_setting:
                 # Fill the silhouette row span with the fish base colour first, then draw coloured glyphs
-                draw_sprite_masked_with_bg(screen, lines, mask, int(self.x) + x_off, int(self.y), self.colour, self.colour)
+                draw_sprite_masked_with_bg(screen, lines, mask, int(self.x) + x_off, int(self.y), self.colour, self.colour, view)
             else:
-                draw_sprite_masked(screen, lines, mask, int(self.x) + x_off, int(self.y), self.colour)
+                draw_sprite_masked(screen, lines, mask, int(self.x) + x_off, int(self.y), self.colour, view)
         else:
-            draw_sprite(screen, lines, int(self.x) + x_off, int(self.y), self.colour)
+            draw_sprite(screen, lines, int(self.x) + x_off, int(self.y), self.colour, view)
 
     # Hook API used by FishHook special
     def attach_to_hook(self, hook_x: int, hook_y: int):
@@ -745,7 +787,7 @@ class Fish:
         else:
             self.colour_mask = None
         # Reverse velocity sign, magnitude picked from base_speed magnitude
-        speed_mag = abs(self.base_speed) if self.base_speed != 0 else random.uniform(self.speed_min, self.speed_max)
+        speed_mag = abs(self.base_speed) if self.base_speed != 0 else (self.rng or random).uniform(self.speed_min, self.speed_max)
         self.vx = speed_mag * new_dir
         # Continue to expand phase
         self.turn_phase = "expand"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import List, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...protocols import AsciiQuariumProtocol
@@ -27,6 +27,62 @@ from ...constants import (
     SEAWEED_SWAY_SPEED_MIN,
 )
 
+# A strip is the non-blank rows of one sway frame as (row index from the top, text).
+_Strip = Tuple[Tuple[int, str], ...]
+# Keyed by (height, phase parity); the pair is indexed by sway step parity so the
+# phase offset is already folded in. Heights are bounded, so the cache stays small.
+_STRIP_CACHE: Dict[Tuple[int, int], Tuple[_Strip, _Strip]] = {}
+
+
+def _build_frames(height: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    left = tuple(("(" if row_index % 2 == 0 else "").ljust(2) for row_index in range(height))
+    right = tuple((" )" if row_index % 2 == 0 else "").ljust(2) for row_index in range(height))
+    return left, right
+
+
+def seaweed_strips(height: int, phase: int) -> Tuple[_Strip, _Strip]:
+    """Return the cached (even step, odd step) strips for a seaweed of this height and phase."""
+    key = (height, phase & 1)
+    strips = _STRIP_CACHE.get(key)
+    if strips is None:
+        left, right = _build_frames(height)
+        left_strip = tuple((i, row) for i, row in enumerate(left) if row.strip())
+        right_strip = tuple((i, row) for i, row in enumerate(right) if row.strip())
+        strips = (left_strip, right_strip) if key[1] == 0 else (right_strip, left_strip)
+        _STRIP_CACHE[key] = strips
+    return strips
+
+
+def draw_seaweed(screen: Screen, seaweed: Iterable["Seaweed"], offset: int = 0, mono: bool = False) -> None:
+    """Draw a batch of seaweed, shifted left by ``offset`` scene columns.
+
+    Entities stay in scene coordinates; anything outside the screen horizontally is
+    culled before its strip is looked up.
+    """
+    colour = Screen.COLOUR_WHITE if mono else Screen.COLOUR_GREEN
+    width = screen.width
+    height = screen.height
+    print_at = screen.print_at
+    for s in seaweed:
+        draw_x = int(s.x) - offset
+        # Seaweed is two columns wide
+        if draw_x + 2 < 0 or draw_x >= width:
+            continue
+        safe_height = max(1, s.height)
+        visible_rows = max(0, min(safe_height, int(s.visible_height)))
+        if visible_rows == 0:
+            continue
+        sway_step = int(s.sway_t / max(SEAWEED_SWAY_SPEED_MIN, s.sway_speed))
+        strip = seaweed_strips(safe_height, s.phase)[sway_step & 1]
+        start_row_index = safe_height - visible_rows
+        top_y = s.base_y - (safe_height - 1)
+        for row_index, row_content in strip:
+            if row_index < start_row_index:
+                continue
+            display_y = top_y + row_index
+            if 0 <= display_y < height:
+                print_at(row_content, draw_x, display_y, colour=colour)
+
 
 @dataclass
 class Seaweed:
@@ -55,8 +111,8 @@ class Seaweed:
     Architecture:
         The Seaweed class uses a finite state machine for lifecycle management
         (alive → dying → dormant → growing → alive) with smooth transitions
-        between states. Visual rendering is computed dynamically based on sway
-        timing and current lifecycle state.
+        between states. Sway frames are cached per (height, phase); drawing picks
+        one from the sway timer and clips it to the visible height.
 
     State Machine:
         - **alive**: Normal swaying animation with full visibility
@@ -151,6 +207,8 @@ class Seaweed:
     growth_rate_max_cfg: float = SEAWEED_GROWTH_RATE_MAX
     shrink_rate_min_cfg: float = SEAWEED_SHRINK_RATE_MIN
     shrink_rate_max_cfg: float = SEAWEED_SHRINK_RATE_MAX
+    # Own random stream (set by the app); None falls back to the global module
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         # Initialize visible height
@@ -160,11 +218,8 @@ class Seaweed:
         self.lifetime_t = random.uniform(0.0, self.lifetime_max * SEAWEED_LIFETIME_STAGGER_FRACTION)
 
     def frames(self) -> Tuple[List[str], List[str]]:
-        left_pattern = ["(" if row_index % 2 == 0 else "" for row_index in range(self.height)]
-        right_pattern = [" )" if row_index % 2 == 0 else "" for row_index in range(self.height)]
-        frame1 = [pattern.ljust(2) for pattern in left_pattern]
-        frame2 = [pattern.ljust(2) for pattern in right_pattern]
-        return frame1, frame2
+        frame1, frame2 = _build_frames(self.height)
+        return list(frame1), list(frame2)
 
     def update(self, dt: float, screen: "Screen", app: "AsciiQuariumProtocol") -> None:
         # advance sway timer
@@ -180,7 +235,7 @@ class Seaweed:
                 self.visible_height = float(self.height)
                 self.state = "alive"
                 self.lifetime_t = 0.0
-                self.lifetime_max = random.uniform(self.lifetime_min_cfg, self.lifetime_max_cfg)
+                self.lifetime_max = (self.rng or random).uniform(self.lifetime_min_cfg, self.lifetime_max_cfg)
         elif self.state == "dying":
             self.visible_height = max(0.0, self.visible_height - self.shrink_rate * dt)
             if self.visible_height <= 0.0:
@@ -190,29 +245,16 @@ class Seaweed:
             self.regrow_delay_t += dt
             if self.regrow_delay_t >= self.regrow_delay_max:
                 # Regrow with some variation
-                self.height = random.randint(SEAWEED_HEIGHT_MIN, SEAWEED_HEIGHT_MAX)
-                self.phase = random.randint(0, SEAWEED_PHASE_MAX)
-                self.sway_speed = random.uniform(self.sway_min, self.sway_max)
-                self.growth_rate = random.uniform(self.growth_rate_min_cfg, self.growth_rate_max_cfg)
-                self.shrink_rate = random.uniform(self.shrink_rate_min_cfg, self.shrink_rate_max_cfg)
+                rng = self.rng or random
+                self.height = rng.randint(SEAWEED_HEIGHT_MIN, SEAWEED_HEIGHT_MAX)
+                self.phase = rng.randint(0, SEAWEED_PHASE_MAX)
+                self.sway_speed = rng.uniform(self.sway_min, self.sway_max)
+                self.growth_rate = rng.uniform(self.growth_rate_min_cfg, self.growth_rate_max_cfg)
+                self.shrink_rate = rng.uniform(self.shrink_rate_min_cfg, self.shrink_rate_max_cfg)
                 self.visible_height = 0.0
                 self.state = "growing"
-                self.regrow_delay_max = random.uniform(self.regrow_delay_min_cfg, self.regrow_delay_max_cfg)
-
-    def draw(self, screen: Screen, tick: int, mono: bool = False):
-        frame_left, frame_right = self.frames()
-        # compute sway toggle based on per-entity timer and speed
-        # Prevent division by zero by ensuring sway_speed is positive
-        sway_step = int(self.sway_t / max(SEAWEED_SWAY_SPEED_MIN, self.sway_speed))
-        sway_direction = (sway_step + self.phase) % 2
-        current_frame = frame_left if sway_direction == 0 else frame_right
-        # How many rows to draw from the bottom
-        # Prevent negative height which could cause index errors
-        safe_height = max(1, self.height)
-        visible_rows = max(0, min(safe_height, int(self.visible_height)))
-        start_row_index = safe_height - visible_rows
-        for row_index in range(start_row_index, safe_height):
-            row_content = current_frame[row_index]
-            display_y = self.base_y - (safe_height - 1 - row_index)
-            if 0 <= display_y < screen.height:
-                screen.print_at(row_content, self.x, display_y, colour=Screen.COLOUR_WHITE if mono else Screen.COLOUR_GREEN)
+                self.regrow_delay_max = rng.uniform(self.regrow_delay_min_cfg, self.regrow_delay_max_cfg)
+
+    def draw(self, screen: Screen, tick: int, mono: bool = False, offset: int = 0):
+        # Blank padding rows are skipped; see draw_seaweed() for batches
+        draw_seaweed(screen, (self,), offset, mono)
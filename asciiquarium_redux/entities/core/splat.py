@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...protocols import AsciiQuariumProtocol
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
 else:
     from ...screen_compat import Screen
 
-from ...util import parse_sprite, draw_sprite
+from ...util import View, parse_sprite, draw_sprite
 
 
 @dataclass
@@ -69,7 +69,7 @@ class Splat:
     def active(self) -> bool:
         return self.age_frames < self.max_frames
 
-    def draw(self, screen: Screen, mono: bool = False):
+    def draw(self, screen: Screen, mono: bool = False, view: Optional[View] = None):
         idx = min(len(self.FRAMES) - 1, self.age_frames // 4)
         lines = self.FRAMES[idx]
-        draw_sprite(screen, lines, self.x - 4, self.y - 2, Screen.COLOUR_WHITE if mono else Screen.COLOUR_RED)
+        draw_sprite(screen, lines, self.x - 4, self.y - 2, Screen.COLOUR_WHITE if mono else Screen.COLOUR_RED, view)
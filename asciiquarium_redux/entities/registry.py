@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class EntityRegistry(list):
+    """Ordered entity collection with per-type indexes.
+
+    Behaves like the plain list it replaces (append/extend/remove/iteration all
+    keep their order, so rendering is unchanged), but also keeps a bucket per
+    concrete entity class that is updated whenever entities are added or
+    retired. Type questions such as "is a fishhook active?" then touch only the
+    handful of entities of that type instead of scanning the whole list with
+    ``isinstance`` on every frame or input event.
+    """
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        super().__init__()
+        self._by_type: Dict[type, List[Any]] = {}
+        self.extend(items)
+
+    # --- index maintenance ---
+    def _index(self, item: Any) -> None:
+        self._by_type.setdefault(type(item), []).append(item)
+
+    def _unindex(self, item: Any) -> None:
+        bucket = self._by_type.get(type(item))
+        if bucket is None:
+            return
+        for i, other in enumerate(bucket):
+            if other is item:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._by_type[type(item)]
+
+    def _reindex(self) -> None:
+        self._by_type = {}
+        for item in self:
+            self._index(item)
+
+    def __reduce__(self) -> Any:
+        # Rebuild through __init__ so the index exists before items are added back
+        return (type(self), (list(self),))
+
+    # --- list mutators kept in sync with the index ---
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._index(item)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items: Iterable[Any]) -> "EntityRegistry":  # type: ignore[override]
+        self.extend(items)
+        return self
+
+    def insert(self, index: Any, item: Any) -> None:
+        super().insert(index, item)
+        self._index(item)
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._unindex(item)
+
+    def pop(self, index: Any = -1) -> Any:
+        item = super().pop(index)
+        self._unindex(item)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_type.clear()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._reindex()
+
+    # --- retirement ---
+    def retire_where(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """Remove entities matching ``predicate`` in one pass, preserving order."""
+        kept: List[Any] = []
+        retired: List[Any] = []
+        for item in self:
+            (retired if predicate(item) else kept).append(item)
+        if retired:
+            super().clear()
+            super().extend(kept)
+            for item in retired:
+                self._unindex(item)
+        return retired
+
+    def retire_inactive(self) -> List[Any]:
+        """Drop entities whose ``active`` flag is False."""
+        return self.retire_where(lambda a: not getattr(a, "active", True))
+
+    # --- typed queries ---
+    def of_type(self, cls: Type[T]) -> List[T]:
+        """Entities that are instances of ``cls`` (including subclasses), in insertion order."""
+        exact = self._by_type.get(cls)
+        matches = [t for t in self._by_type if t is not cls and issubclass(t, cls)]
+        if not matches:
+            return list(exact) if exact else []
+        out: List[Any] = list(exact) if exact else []
+        for t in matches:
+            out.extend(self._by_type[t])
+        return out
+
+    def active_of_type(self, cls: Type[T]) -> List[T]:
+        return [a for a in self.of_type(cls) if getattr(a, "active", True)]
+
+    def has_active(self, cls: type) -> bool:
+        for t, bucket in self._by_type.items():
+            if issubclass(t, cls):
+                for a in bucket:
+                    if getattr(a, "active", True):
+                        return True
+        return False
+
+    def count_of_type(self, cls: type) -> int:
+        return sum(len(b) for t, b in self._by_type.items() if issubclass(t, cls))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ..base import Actor
 from ..environment import WATER_SEGMENTS
@@ -10,6 +10,7 @@ from ...util import parse_sprite, sprite_size, randomize_colour_mask
 
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 """Giant fish special.
 
@@ -137,7 +138,7 @@ class BigFish(Actor):
         if (self.dir > 0 and self.x > scene_w) or (self.dir < 0 and self.x + self.w < 0):
             self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         self.draw_sprite(
             self.app,
             screen,
@@ -145,7 +146,8 @@ class BigFish(Actor):
             self._rand_mask,
             int(self.x),
             int(self.y),
-            Screen.COLOUR_YELLOW
+            Screen.COLOUR_YELLOW,
+            view=view,
         )
 
 
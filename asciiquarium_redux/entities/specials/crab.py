@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ...screen_compat import Screen
 
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 from ...util import parse_sprite, sprite_size
 from ..base import Actor
@@ -102,7 +103,7 @@ r rrr     rrr r
         if (self.dir > 0 and self.x > scene_w) or (self.dir < 0 and self.x + self.w < 0):
             self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         self.draw_sprite(
             self.app,
             screen,
@@ -110,7 +111,8 @@ r rrr     rrr r
             self.mask_frames[self._frame_idx],
             int(self.x),
             int(self.y),
-            Screen.COLOUR_RED
+            Screen.COLOUR_RED,
+            view=view,
         )
 
 
@@ -3,9 +3,10 @@ from __future__ import annotations
 import random
 import math
 from ...screen_compat import Screen
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 from ...util import parse_sprite
 from ..base import Actor
@@ -106,7 +107,7 @@ class Dolphins(Actor):
         if (self.dir > 0 and self.x > scene_w + 30) or (self.dir < 0 and self.x < -30):
             self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         # Match Perl: body coloured mostly blue, with one cyan highlight dolphin
         colours = [Screen.COLOUR_BLUE, Screen.COLOUR_BLUE, Screen.COLOUR_CYAN]
         for i in range(3):
@@ -120,7 +121,8 @@ class Dolphins(Actor):
                 img_mask=self.mask,
                 px=px,
                 py=py,
-                primary_colour=colours[i]
+                primary_colour=colours[i],
+                view=view,
             )
 
 
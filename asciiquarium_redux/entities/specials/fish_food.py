@@ -3,10 +3,11 @@ from __future__ import annotations
 import random
 from typing import List
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from ..base import Actor
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 
 class FishFoodFlake(Actor):
@@ -92,7 +93,7 @@ class FishFoodFlake(Actor):
             if int(self.y) >= screen.height - 1:
                 self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         if not self._active:
             return
         ch = "_"
@@ -103,7 +104,13 @@ class FishFoodFlake(Actor):
             col = 7 if mono else 3  # fallback: white=7, yellow=3
         xi = int(self.x)
         yi = int(self.y)
-        if 0 <= yi < screen.height and 0 <= xi < screen.width:
+        if view is None:
+            min_x, min_y, max_x, max_y = 0, 0, screen.width - 1, screen.height - 1
+        else:
+            min_x, min_y, max_x, max_y = view.bounds(screen)
+            xi -= view.dx
+            yi -= view.dy
+        if min_y <= yi <= max_y and min_x <= xi <= max_x:
             screen.print_at(ch, xi, yi, colour=col)
 
 
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from ...screen_compat import Screen
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol
+    from ...util import View
 else:
     from ...screen_compat import Screen as ScreenProtocol
 
-from ...util import parse_sprite, draw_sprite, aabb_overlap
+from ...util import parse_sprite, draw_sprite
 from ..core import Splat
 from ..base import Actor
+from ..collision import collisions_for
 from ...constants import (
     FISHHOOK_SPEED,
     FISHHOOK_IMPACT_PAUSE_DURATION,
@@ -67,6 +69,21 @@ class FishHook(Actor):
     def active(self) -> bool:
         return True if self._active else False
 
+    def _try_catch(self, app, hx: int, hy: int) -> bool:
+        """Hook the first free fish touching the tip (hx, hy); returns True on a catch."""
+        hits = collisions_for(app).query_point(hx, hy, where=lambda f: not f.hooked)
+        if not hits:
+            return False
+        f = hits[0]
+        # Play splat animation at impact point and attach fish to hook
+        app.splats.append(Splat(x=hx, y=hy, coord_space="scene"))
+        self.caught = f
+        f.attach_to_hook(hx, hy)
+        # Pause briefly so the splat is visible
+        self.state = "impact_pause"
+        self.pause_timer = FISHHOOK_IMPACT_PAUSE_DURATION
+        return True
+
     def update(self, dt: float, screen: "ScreenProtocol", app) -> None:
         if self.state == "lowering":
             limit_reached = False
@@ -86,18 +103,7 @@ class FishHook(Actor):
             if not self.caught:
                 hx = int(self.x + FISHHOOK_TIP_OFFSET_X)
                 hy = int(self.y + FISHHOOK_TIP_OFFSET_Y)
-                for f in app.fish:
-                    if f.hooked:
-                        continue
-                    if aabb_overlap(hx, hy, 1, 1, int(f.x), int(f.y), f.width, f.height):
-                        # Play splat animation at impact point and attach fish to hook
-                        app.splats.append(Splat(x=hx, y=hy, coord_space="scene"))
-                        self.caught = f
-                        f.attach_to_hook(hx, hy)
-                        # Pause briefly so the splat is visible
-                        self.state = "impact_pause"
-                        self.pause_timer = FISHHOOK_IMPACT_PAUSE_DURATION
-                        break
+                self._try_catch(app, hx, hy)
             if not self.caught and limit_reached:
                 # Start dwelling at bottom instead of retracting immediately
                 self.state = "dwelling"
@@ -118,17 +124,7 @@ class FishHook(Actor):
                 self.caught.follow_hook(hx, hy)
             else:
                 # While dwelling, still check for fish contact at the hook tip
-                for f in app.fish:
-                    if f.hooked:
-                        continue
-                    if aabb_overlap(hx, hy, 1, 1, int(f.x), int(f.y), f.width, f.height):
-                        app.splats.append(Splat(x=hx, y=hy, coord_space="scene"))
-                        self.caught = f
-                        f.attach_to_hook(hx, hy)
-                        # Brief impact pause before retracting for visibility
-                        self.state = "impact_pause"
-                        self.pause_timer = FISHHOOK_IMPACT_PAUSE_DURATION
-                        break
+                self._try_catch(app, hx, hy)
             self.dwell_timer -= dt
             if self.dwell_timer <= 0:
                 self.state = "retracting"
@@ -140,33 +136,28 @@ class FishHook(Actor):
                 self.caught.follow_hook(hx, hy)
             else:
                 # While retracting without a catch, still allow catching a fish
-                for f in app.fish:
-                    if f.hooked:
-                        continue
-                    if aabb_overlap(hx, hy, 1, 1, int(f.x), int(f.y), f.width, f.height):
-                        app.splats.append(Splat(x=hx, y=hy, coord_space="scene"))
-                        self.caught = f
-                        f.attach_to_hook(hx, hy)
-                        # Brief pause to show the splat, then continue retracting
-                        self.state = "impact_pause"
-                        self.pause_timer = FISHHOOK_IMPACT_PAUSE_DURATION
-                        break
+                self._try_catch(app, hx, hy)
             if self.y <= 0:
                 # Remove the caught fish when hook returns to top
-                if self.caught and self.caught in app.fish:
-                    try:
-                        app.fish.remove(self.caught)
-                    except ValueError:
-                        pass
+                if self.caught:
+                    collisions_for(app).retire(self.caught)
                 self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         top = FISHHOOK_LINE_TOP
         line_len = int(self.y) - top
-        for i in range(line_len):
-            ly = top + i
-            if 0 <= ly < screen.height:
-                screen.print_at("|", self.x + FISHHOOK_LINE_OFFSET_X, ly, colour=Screen.COLOUR_WHITE if mono else Screen.COLOUR_GREEN)
+        if view is None:
+            min_x, min_y, max_x, max_y = 0, 0, screen.width - 1, screen.height - 1
+            vdx, vdy = 0, 0
+        else:
+            min_x, min_y, max_x, max_y = view.bounds(screen)
+            vdx, vdy = view.dx, view.dy
+        lx = int(self.x) + FISHHOOK_LINE_OFFSET_X - vdx
+        if min_x <= lx <= max_x:
+            for i in range(line_len):
+                ly = top + i - vdy
+                if min_y <= ly <= max_y:
+                    screen.print_at("|", lx, ly, colour=Screen.COLOUR_WHITE if mono else Screen.COLOUR_GREEN)
         hook = parse_sprite(
             r"""
        o
@@ -177,12 +168,19 @@ class FishHook(Actor):
   `--'  
 """
         )
-        draw_sprite(screen, hook, self.x, int(self.y), Screen.COLOUR_WHITE if mono else Screen.COLOUR_GREEN)
+        draw_sprite(screen, hook, int(self.x), int(self.y), Screen.COLOUR_WHITE if mono else Screen.COLOUR_GREEN, view)
+
+
+def _hook_active(app) -> bool:
+    specials = app.specials
+    if hasattr(specials, "has_active"):
+        return specials.has_active(FishHook)
+    return any(isinstance(a, FishHook) and a.active for a in specials)
 
 
 def spawn_fishhook(screen: "ScreenProtocol", app):
     # Enforce single fishhook: if one is active, do not spawn another
-    if any(isinstance(a, FishHook) and a.active for a in app.specials):
+    if _hook_active(app):
         return []
     # Spawn within current view in scene coordinates
     try:
@@ -201,7 +199,7 @@ def spawn_fishhook(screen: "ScreenProtocol", app):
 
 def spawn_fishhook_to(screen: "ScreenProtocol", app, target_x: int, target_y: int):
     # Enforce single fishhook for targeted spawns as well
-    if any(isinstance(a, FishHook) and a.active for a in app.specials):
+    if _hook_active(app):
         return []
     # Convert screen click x to scene x
     try:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ...screen_compat import Screen
 
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 from ...util import parse_sprite, sprite_size
 from ..base import Actor
@@ -158,7 +159,7 @@ class Monster(Actor):
         if (self.dir > 0 and self.x > scene_w) or (self.dir < 0 and self.x < -self._w_left):
             self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         if self.dir > 0:
             img = self.frames_right[self._frame_idx]
             msk = self.masks_right[self._frame_idx]
@@ -173,7 +174,8 @@ class Monster(Actor):
             msk,
             int(self.x),
             int(self.y),
-            Screen.COLOUR_GREEN
+            Screen.COLOUR_GREEN,
+            view=view,
         )
 
 
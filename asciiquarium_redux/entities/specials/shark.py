@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import random
 from ...screen_compat import Screen
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 from ...util import parse_sprite, sprite_size
 from ..core import Splat
 from ..base import Actor
+from ..collision import collisions_for
 from ...constants import (
     SHARK_SPEED,
     MOVEMENT_MULTIPLIER,
@@ -122,14 +124,11 @@ class Shark(Actor):
         else:
             tx = int(self.x) + self._teeth_dx_left
             ty = int(self.y) + self._teeth_dy_left
-        for f in list(app.fish):
-            if f.hooked:
-                continue
-            # point-in-rect test
-            if int(f.x) <= tx < int(f.x + f.width) and int(f.y) <= ty < int(f.y + f.height):
-                # Spawn splat at the teeth position so it appears in front/at mouth
-                app.splats.append(Splat(x=tx, y=ty, coord_space="scene"))
-                app.fish.remove(f)
+        collisions = collisions_for(app)
+        for f in collisions.query_point(tx, ty, where=lambda f: not f.hooked):
+            # Spawn splat at the teeth position so it appears in front/at mouth
+            app.splats.append(Splat(x=tx, y=ty, coord_space="scene"))
+            collisions.retire(f)
         # Off-screen deactivation so spawner can schedule the next special
         try:
             scene_w = int(getattr(getattr(app, "settings", None), "scene_width", screen.width))
@@ -138,7 +137,7 @@ class Shark(Actor):
         if (self.dir > 0 and self.x > scene_w) or (self.dir < 0 and self.x < -self._w_left):
             self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         if self.dir > 0:
             img = self.img_right
             msk = self.mask_right
@@ -154,6 +153,7 @@ class Shark(Actor):
             int(self.x),
             int(self.y),
             Screen.COLOUR_CYAN,
+            view=view,
         )
 
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import random
+from typing import Optional
 
 from ..base import Actor
 from ...screen_compat import Screen
-from ...util import parse_sprite, sprite_size
+from ...util import View, parse_sprite, sprite_size
 
 
 class Ship(Actor):
@@ -129,7 +130,7 @@ yywwwyyyyyyyyyyyyyyyyyyyy
         if (self.dir > 0 and self.x > scene_w) or (self.dir < 0 and self.x + self.w < 0):
             self._active = False
 
-    def draw(self, screen, mono: bool = False) -> None:
+    def draw(self, screen, mono: bool = False, view: Optional[View] = None) -> None:
         self.draw_sprite(
             self.app,
             screen,
@@ -137,7 +138,8 @@ yywwwyyyyyyyyyyyyyyyyyyyy
             self.mask_frames[self._frame_idx],
             int(self.x),
             int(self.y),
-            Screen.COLOUR_WHITE
+            Screen.COLOUR_WHITE,
+            view=view,
         )
 
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ...screen_compat import Screen
 
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 from ...util import parse_sprite
 from ..base import Actor
@@ -104,7 +105,7 @@ class Swan(Actor):
         if (self.dir > 0 and self.x > scene_w) or (self.dir < 0 and self.x + 10 < 0):
             self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         img = self.frames[self._frame_idx]
         self.draw_sprite(
             self.app,
@@ -114,6 +115,7 @@ class Swan(Actor):
             int(self.x),
             int(self.y),
             Screen.COLOUR_WHITE,
+            view=view,
         )
 
 
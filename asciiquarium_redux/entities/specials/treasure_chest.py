@@ -5,9 +5,10 @@ from dataclasses import dataclass
 from typing import List
 
 from ...screen_compat import Screen
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 from ..base import Actor
 from ..core import Bubble
@@ -101,7 +102,7 @@ class TreasureChest(Actor):
             if self._burst_time_left <= 0:
                 self._bursting = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         # Choose current sprite and anchor drawing by a fixed baseline (bottom)
         lines = CHEST_OPEN if self._bursting else CHEST_CLOSED
         w, h = sprite_size(lines)
@@ -115,11 +116,11 @@ class TreasureChest(Actor):
         y = baseline - h + 1
         # Clamp within top edge if needed
         y = max(0, min(screen.height - h, y))
-        # Use scene-mapped x directly; clipping is handled by drawing utilities
+        # Scene x; the view maps it to the screen and the drawing utilities clip
         x = int(self.x)
         fg = Screen.COLOUR_WHITE if mono else Screen.COLOUR_YELLOW
         # Opaque mask like castle to avoid see-through artifacts
-        draw_sprite_masked_with_bg(screen, lines, CHEST_MASK, x, y, fg, Screen.COLOUR_BLACK)
+        draw_sprite_masked_with_bg(screen, lines, CHEST_MASK, x, y, fg, Screen.COLOUR_BLACK, view)
 
     @property
     def active(self) -> bool:
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import random
 from typing import List
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ...screen_compat import Screen
 
 if TYPE_CHECKING:
     from ...protocols import ScreenProtocol, AsciiQuariumProtocol
+    from ...util import View
 
 from ...util import parse_sprite, sprite_size
 from ..base import Actor
@@ -219,7 +220,7 @@ class Whale(Actor):
         if (self.dir > 0 and self.x > scene_w) or (self.dir < 0 and self.x < -self._w_left):
             self._active = False
 
-    def draw(self, screen: "ScreenProtocol", mono: bool = False) -> None:
+    def draw(self, screen: "ScreenProtocol", mono: bool = False, view: Optional["View"] = None) -> None:
         if self.dir > 0:
             img = self.frames_right[self._frame_idx]
             msk = self.masks_right[self._frame_idx]
@@ -235,6 +236,7 @@ class Whale(Actor):
             int(self.x),
             int(self.y),
             Screen.COLOUR_BLUE,
+            view=view,
         )
 
 
@@ -29,6 +29,8 @@ Command-Line Interface:
         --fps, --density, --color, --seed: Animation and visual settings
         --config: Load settings from TOML configuration file
         --backend: Force specific backend (terminal/web/tkinter)
+        --wall coordinator|worker: Tile one scene across several displays (see wall.py)
+        --soak HOURS: Headless accelerated-time soak test with a report (see soak.py)
 
     Subcommands:
         web: Launch web interface with server options (--port, --no-open-browser)
@@ -83,21 +85,23 @@ import random
 import sys
 
 from .util.settings import load_settings_from_sources
-from .app import run as _run
+from .app import TerminalSession, run as _run
 
 
 def run_with_resize(settings) -> None:
     """Run the app, restarting the Screen on terminal resize.
 
     This wraps Screen.wrapper and catches ResizeScreenError to recreate
-    the screen, without changing application behavior.
+    the screen. The same TerminalSession is handed to each new Screen, so the
+    running tank is fitted to the new size rather than rebuilt.
     """
     # Import terminal dependencies lazily to avoid import-time costs in other backends
     from asciimatics.screen import Screen as _RealScreen  # type: ignore
     from asciimatics.exceptions import ResizeScreenError  # type: ignore
+    session = TerminalSession()
     while True:
         try:
-            _RealScreen.wrapper(lambda scr: _run(scr, settings))
+            _RealScreen.wrapper(lambda scr: _run(scr, settings, session))
             break
         except ResizeScreenError:
             continue
@@ -115,6 +119,21 @@ def main(argv: list[str] | None = None) -> None:
     if settings.seed is not None:
         random.seed(settings.seed)
     backend = getattr(settings, "ui_backend", "terminal")
+    if float(getattr(settings, "soak_hours", 0.0) or 0.0) > 0.0:
+        from .soak import run_soak
+        sys.exit(run_soak(settings))
+    wall_role = getattr(settings, "wall_role", None)
+    if wall_role == "coordinator":
+        from .wall import run_coordinator
+        run_coordinator(settings)
+        return
+    if wall_role == "worker":
+        from .wall import run_tk_worker, run_worker
+        if backend == "tk":
+            run_tk_worker(settings)
+        else:
+            run_worker(settings)
+        return
     if backend == "web":
         # Simple local server to host the web assets
         from .web_server import serve_web
@@ -133,4 +152,8 @@ def main(argv: list[str] | None = None) -> None:
         except Exception as e:
             print(f"Tk backend unavailable ({e}); falling back to terminal.", file=sys.stderr)
     # Default: terminal backend
+    if getattr(settings, "ui_asyncio", False):
+        from .aio import run_asyncio
+        run_asyncio(settings)
+        return
     run_with_resize(settings)
@@ -0,0 +1,353 @@
+"""Headless accelerated-time soak test.
+
+``asciiquarium --soak HOURS`` runs ``AsciiQuarium.update`` against an
+off-screen buffer with a virtual clock, as fast as the CPU allows, so a long
+stretch of aquarium time passes in a fraction of it. Frames use the normal
+``1 / fps`` step and go through ``DoubleBufferedScreen``, so the simulation
+and render paths are the ones a display runs.
+
+Synthetic input arrives at random on the simulated timeline: feeding, hook
+drops and retracts, scene pans (scene mode) and occasional terminal resizes.
+Input goes through the control-socket commands and the same spawners the
+mouse handler uses, so no terminal is needed.
+
+At each checkpoint the run checks invariants (populations within bounds of
+their targets, bubbles/specials/splats bounded, finite fish positions, valid
+seaweed lifecycle state, spawn cooldowns only for known kinds) and the RSS
+ceiling, and records RSS. The report gives throughput, peak entity counts and
+the memory slope (least-squares RSS growth per simulated hour, after the first
+checkpoint as warm-up). The exit status is 1 when any check failed.
+
+Runs are reproducible: the seed is printed in the report and taken from
+``--seed`` when given.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from .app import AsciiQuarium
+from .screen_compat import Screen
+from .util.buffer import DoubleBufferedScreen
+from .util.control import ControlError, execute
+from .util.meminfo import memory_stats
+from .util.replay import VirtualClock
+from .util.settings import Settings
+
+# Mean simulated seconds between synthetic inputs, and between resizes
+INPUT_EVERY = 20.0
+RESIZE_EVERY = 1800.0
+# Terminal sizes a resize picks from
+RESIZE_COLS = (60, 220)
+RESIZE_ROWS = (20, 60)
+# Checkpoint spacing: hourly, but at least this many over a run
+MIN_CHECKPOINTS = 10
+# Invariant bounds (multiples of the current population targets, plus slack)
+FISH_BOUND = 3.0
+SEAWEED_BOUND = 2.0
+BUBBLES_PER_FISH = 12
+BUBBLES_SLACK = 200
+SPECIALS_SLACK = 200
+MAX_SPLATS = 64
+# Failures kept in the report
+MAX_FAILURES = 50
+
+
+class _HeadlessScreen:
+    """Off-screen target for the double buffer; counts the runs it is sent."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = int(width)
+        self.height = int(height)
+        self.prints = 0
+
+    def clear(self) -> None:
+        pass
+
+    def print_at(self, text: str, x: int, y: int, colour: Optional[int] = None, *args: Any, **kwargs: Any) -> None:
+        self.prints += 1
+
+    def refresh(self) -> None:
+        pass
+
+    def get_event(self) -> Any:
+        return None
+
+    def has_resized(self) -> bool:
+        return False
+
+
+@dataclass
+class SoakReport:
+    seed: int
+    sim_hours: float
+    frames: int = 0
+    wall_seconds: float = 0.0
+    inputs: Dict[str, int] = field(default_factory=dict)
+    peaks: Dict[str, int] = field(default_factory=dict)
+    # (simulated hours, RSS in KiB) per checkpoint
+    rss: List[Tuple[float, int]] = field(default_factory=list)
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def memory_slope_kb_per_hour(self) -> Optional[float]:
+        # First checkpoint is warm-up (caches, interned sprites, allocator arenas)
+        pts = self.rss[1:]
+        if len(pts) < 2:
+            return None
+        n = len(pts)
+        mx = sum(p[0] for p in pts) / n
+        my = sum(p[1] for p in pts) / n
+        sxx = sum((p[0] - mx) ** 2 for p in pts)
+        if sxx <= 0.0:
+            return None
+        return sum((p[0] - mx) * (p[1] - my) for p in pts) / sxx
+
+    def as_dict(self) -> Dict[str, Any]:
+        wall = max(1e-9, self.wall_seconds)
+        slope = self.memory_slope_kb_per_hour()
+        return {
+            "ok": self.ok,
+            "seed": self.seed,
+            "sim_hours": round(self.sim_hours, 3),
+            "frames": self.frames,
+            "wall_seconds": round(self.wall_seconds, 1),
+            "frames_per_second": round(self.frames / wall, 1),
+            "speedup": round(self.sim_hours * 3600.0 / wall, 1),
+            "inputs": self.inputs,
+            "peaks": self.peaks,
+            "rss_kb": [[round(h, 3), kb] for h, kb in self.rss],
+            "memory_slope_kb_per_hour": None if slope is None else round(slope, 1),
+            "failures": self.failures,
+        }
+
+
+def _entity_counts(app: AsciiQuarium) -> Dict[str, int]:
+    return {
+        "fish": len(app.fish),
+        "seaweed": len(app.seaweed),
+        "bubbles": len(app.bubbles),
+        "splats": len(app.splats),
+        "specials": len(app.specials),
+        "decor": len(app.decor),
+    }
+
+
+def check_invariants(app: AsciiQuarium, screen: Any) -> List[str]:
+    """Return a description of each invariant the app currently violates."""
+    problems: List[str] = []
+    counts = _entity_counts(app)
+    target_fish, target_seaweed = app._compute_target_counts(screen)
+    if counts["fish"] > FISH_BOUND * target_fish + 2:
+        problems.append(f"fish {counts['fish']} > {FISH_BOUND:g} x target {target_fish}")
+    if counts["seaweed"] > SEAWEED_BOUND * target_seaweed + 2:
+        problems.append(f"seaweed {counts['seaweed']} > {SEAWEED_BOUND:g} x target {target_seaweed}")
+    bubble_cap = BUBBLES_PER_FISH * max(counts["fish"], target_fish) + BUBBLES_SLACK
+    if counts["bubbles"] > bubble_cap:
+        problems.append(f"bubbles {counts['bubbles']} > {bubble_cap}")
+    special_cap = int(getattr(app.settings, "spawn_max_concurrent", 1)) + SPECIALS_SLACK
+    if counts["specials"] > special_cap:
+        problems.append(f"specials {counts['specials']} > {special_cap}")
+    if counts["splats"] > MAX_SPLATS:
+        problems.append(f"splats {counts['splats']} > {MAX_SPLATS}")
+
+    scene_w = int(getattr(app.settings, "scene_width", screen.width))
+    for f in app.fish:
+        x, y = float(f.scene_x), float(f.scene_y)
+        if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(float(f.vx))):
+            problems.append(f"fish with non-finite state at ({x}, {y}) vx={f.vx}")
+            break
+        if not (-2 * scene_w <= x <= 3 * scene_w and -screen.height <= y <= 2 * screen.height):
+            problems.append(f"fish far outside the scene at ({x:.0f}, {y:.0f})")
+            break
+    for s in app.seaweed:
+        if s.state not in ("alive", "growing", "dying", "dormant"):
+            problems.append(f"seaweed in unknown state {s.state!r}")
+            break
+        if not (0.0 <= float(s.visible_height) <= float(s.height) + 1e-6):
+            problems.append(f"seaweed visible height {s.visible_height:.2f} outside 0..{s.height}")
+            break
+    unknown = set(app._last_spawn) - set(app.settings.specials_weights)
+    if unknown:
+        problems.append(f"spawn cooldowns for unknown kinds {sorted(unknown)}")
+    return problems
+
+
+class SoakRunner:
+    """Drive one app through simulated hours with synthetic input."""
+
+    def __init__(self, settings: Settings, hours: float, width: int = 120, height: int = 40, max_rss_mb: int = 0) -> None:
+        self.settings = settings
+        self.hours = max(1.0 / 3600.0, float(hours))
+        self.max_rss_kb = max(0, int(max_rss_mb)) * 1024
+        if settings.seed is None:
+            settings.seed = random.randrange(1 << 31)
+        random.seed(settings.seed)
+        # Input decisions get their own stream so they do not shift the simulation's draws
+        self.rng = random.Random(settings.seed ^ 0x5A5A)
+        self.report = SoakReport(seed=int(settings.seed), sim_hours=self.hours)
+        self.screen = _HeadlessScreen(width, height)
+        self.db = DoubleBufferedScreen(cast(Screen, self.screen))
+        self.clock = VirtualClock(0.0)
+        # Time-based UI (start overlay) would otherwise read the wall clock
+        self.app = AsciiQuarium(settings, clock=self.clock)
+        self.app.rebuild(cast(Screen, self.db))
+        self.fps = max(1, int(settings.fps))
+        self.dt = 1.0 / self.fps
+
+    # --- synthetic input ---
+    def _count(self, kind: str) -> None:
+        self.report.inputs[kind] = self.report.inputs.get(kind, 0) + 1
+
+    def _input(self) -> None:
+        app, db = self.app, cast(Screen, self.db)
+        kind = self.rng.choice(("feed", "hook", "pan", "spawn"))
+        try:
+            if kind == "feed":
+                execute(app, db, {"cmd": "feed", "x": self.rng.randrange(db.width)})
+            elif kind == "hook":
+                from .entities.specials import FishHook, spawn_fishhook_to
+
+                hooks = app.specials.active_of_type(FishHook)
+                if hooks:
+                    for h in hooks:
+                        if hasattr(h, "retract_now"):
+                            h.retract_now()
+                else:
+                    x = self.rng.randrange(db.width)
+                    y = self.rng.randrange(int(getattr(app.settings, "waterline_top", 5)) + 1, max(7, db.height - 2))
+                    app.specials.extend(spawn_fishhook_to(db, app, x, y))
+            elif kind == "pan":
+                if bool(getattr(app.settings, "fish_tank", True)):
+                    return
+                execute(app, db, {"cmd": "pan", "steps": self.rng.choice((-3, -1, 1, 3))})
+            else:
+                execute(app, db, {"cmd": "spawn"})
+        except ControlError:
+            return
+        self._count(kind)
+
+    def _resize(self) -> None:
+        old_w, old_h = self.db.width, self.db.height
+        self.screen = _HeadlessScreen(self.rng.randint(*RESIZE_COLS), self.rng.randint(*RESIZE_ROWS))
+        self.db.rebind(cast(Screen, self.screen))
+        self.app.resize(cast(Screen, self.screen), old_w, old_h)
+        self._count("resize")
+
+    # --- checks ---
+    def _fail(self, sim_s: float, problem: str) -> None:
+        if len(self.report.failures) < MAX_FAILURES:
+            self.report.failures.append(f"{sim_s / 3600.0:.2f}h: {problem}")
+
+    def _checkpoint(self, sim_s: float) -> None:
+        for problem in check_invariants(self.app, self.db):
+            self._fail(sim_s, problem)
+        # Collect first so the reading reflects live objects, not pending garbage
+        gc.collect()
+        rss = memory_stats().get("rss_kb")
+        if rss is not None:
+            self.report.rss.append((sim_s / 3600.0, int(rss)))
+            if self.max_rss_kb and rss > self.max_rss_kb:
+                self._fail(sim_s, f"RSS {rss // 1024} MiB over the {self.max_rss_kb // 1024} MiB ceiling")
+
+    def _track_peaks(self) -> None:
+        peaks = self.report.peaks
+        for k, v in _entity_counts(self.app).items():
+            if v > peaks.get(k, 0):
+                peaks[k] = v
+
+    # --- loop ---
+    def run(self, progress: Any = None) -> SoakReport:
+        total = self.hours * 3600.0
+        every = min(3600.0, total / MIN_CHECKPOINTS)
+        next_check = every
+        next_input = self.rng.expovariate(1.0 / INPUT_EVERY)
+        next_resize = self.rng.expovariate(1.0 / RESIZE_EVERY)
+        sim_s = 0.0
+        frame_no = 0
+        t0 = time.perf_counter()
+        self._checkpoint(0.0)
+        while sim_s < total:
+            if sim_s >= next_input:
+                self._input()
+                next_input = sim_s + self.rng.expovariate(1.0 / INPUT_EVERY)
+            if sim_s >= next_resize:
+                self._resize()
+                next_resize = sim_s + self.rng.expovariate(1.0 / RESIZE_EVERY)
+            self.clock.advance(self.dt)
+            self.db.clear()
+            self.app.update(self.dt, cast(Screen, self.db), frame_no)
+            self.db.flush()
+            frame_no += 1
+            sim_s += self.dt
+            # Peaks are cheap to track but not free; once a simulated second is enough
+            if frame_no % self.fps == 0:
+                self._track_peaks()
+            if sim_s >= next_check:
+                self._checkpoint(sim_s)
+                next_check += every
+                if progress is not None:
+                    progress(self, sim_s, time.perf_counter() - t0)
+        self.report.frames = frame_no
+        self.report.wall_seconds = time.perf_counter() - t0
+        self._track_peaks()
+        return self.report
+
+
+def _progress(runner: SoakRunner, sim_s: float, wall_s: float) -> None:
+    counts = _entity_counts(runner.app)
+    rss = runner.report.rss[-1][1] // 1024 if runner.report.rss else 0
+    print(
+        f"[soak] {sim_s / 3600.0:7.2f}h sim in {wall_s:7.1f}s  fish={counts['fish']} bubbles={counts['bubbles']} "
+        f"specials={counts['specials']} rss={rss}MiB failures={len(runner.report.failures)}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def format_report(report: SoakReport) -> str:
+    d = report.as_dict()
+    slope = d["memory_slope_kb_per_hour"]
+    lines = [
+        f"soak {'PASSED' if report.ok else 'FAILED'}: {d['sim_hours']}h simulated, seed {d['seed']}",
+        f"  throughput  {d['frames']} frames in {d['wall_seconds']}s = {d['frames_per_second']} fps ({d['speedup']}x real time)",
+        "  peaks       " + " ".join(f"{k}={v}" for k, v in sorted(d["peaks"].items())),
+        "  inputs      " + (" ".join(f"{k}={v}" for k, v in sorted(d["inputs"].items())) or "none"),
+    ]
+    if report.rss:
+        lines.append(
+            f"  memory      rss {report.rss[0][1] // 1024} -> {report.rss[-1][1] // 1024} MiB, slope "
+            + ("n/a" if slope is None else f"{slope:+.1f} KiB/h")
+        )
+    for problem in report.failures:
+        lines.append(f"  FAIL {problem}")
+    return "\n".join(lines)
+
+
+def run_soak(settings: Settings) -> int:
+    """Run the configured soak test, print the report and return the exit status."""
+    runner = SoakRunner(
+        settings,
+        float(getattr(settings, "soak_hours", 1.0)),
+        max_rss_mb=int(getattr(settings, "soak_max_rss_mb", 0) or 0),
+    )
+    report = runner.run(_progress)
+    print(format_report(report))
+    path = getattr(settings, "soak_report", None)
+    if path:
+        try:
+            with open(str(path), "w", encoding="utf-8") as fh:
+                json.dump(report.as_dict(), fh, indent=2)
+        except OSError as e:
+            print(f"Could not write soak report to {path}: {e}", file=sys.stderr)
+    return 0 if report.ok else 1
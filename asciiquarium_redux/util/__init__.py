@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict, TYPE_CHECKING
 from ..screen_compat import Screen
 
 if TYPE_CHECKING:
+    import random
+
     from ..protocols import ScreenProtocol
 
 
@@ -38,7 +41,51 @@ def sprite_size(lines: List[str]) -> Tuple[int, int]:
     return max(len(line) for line in lines), len(lines)
 
 
-def draw_sprite(screen: "ScreenProtocol", lines: List[str], x: int, y: int, colour: int) -> None:
+@dataclass(frozen=True)
+class View:
+    """Scene -> screen transform used while drawing.
+
+    Entities keep their scene coordinates; draw helpers subtract (dx, dy) and
+    clip to ``clip`` (x0, y0, x1, y1, exclusive end, screen cells), which is
+    further limited to the screen. ``clip=None`` means the whole screen.
+    """
+
+    dx: int = 0
+    dy: int = 0
+    clip: Optional[Tuple[int, int, int, int]] = None
+
+    def bounds(self, screen: "ScreenProtocol") -> Tuple[int, int, int, int]:
+        """Inclusive (min_x, min_y, max_x, max_y) drawable screen cells."""
+        if self.clip is None:
+            return 0, 0, screen.width - 1, screen.height - 1
+        x0, y0, x1, y1 = self.clip
+        return max(0, x0), max(0, y0), min(screen.width, x1) - 1, min(screen.height, y1) - 1
+
+    def visible(self, screen: "ScreenProtocol", x: int, y: int, w: int, h: int) -> bool:
+        """Bounding-box cull: does the scene rect at (x, y) of size w x h touch the clip?"""
+        min_x, min_y, max_x, max_y = self.bounds(screen)
+        sx = x - self.dx
+        sy = y - self.dy
+        return sx <= max_x and sx + w > min_x and sy <= max_y and sy + h > min_y
+
+
+def _view_bounds(screen: "ScreenProtocol", view: Optional[View]) -> Tuple[int, int, int, int, int, int]:
+    if view is None:
+        return 0, 0, 0, 0, screen.width - 1, screen.height - 1
+    if view.clip is None:
+        return view.dx, view.dy, 0, 0, screen.width - 1, screen.height - 1
+    min_x, min_y, max_x, max_y = view.bounds(screen)
+    return view.dx, view.dy, min_x, min_y, max_x, max_y
+
+
+def draw_sprite(
+    screen: "ScreenProtocol",
+    lines: List[str],
+    x: int,
+    y: int,
+    colour: int,
+    view: Optional[View] = None,
+) -> None:
     """Draw an unmasked sprite, treating spaces and '?' as transparent.
 
     Only non-space, non-'?' characters are printed so background/sprites behind are preserved.
@@ -49,16 +96,18 @@ def draw_sprite(screen: "ScreenProtocol", lines: List[str], x: int, y: int, colo
         x: X position to draw at
         y: Y position to draw at
         colour: Color to use for drawing
+        view: Optional transform; x/y are then scene coordinates
     """
-    max_y = screen.height - 1
-    max_x = screen.width - 1
+    dx, dy0, min_x, min_y, max_x, max_y = _view_bounds(screen, view)
+    x -= dx
+    y -= dy0
     for dy, row in enumerate(lines):
         sy = y + dy
-        if sy < 0 or sy > max_y:
+        if sy < min_y or sy > max_y:
             continue
-        if x > max_x or x + len(row) < 0:
+        if x > max_x or x + len(row) <= min_x:
             continue
-        start_idx = 0 if x >= 0 else -x
+        start_idx = max(0, min_x - x)
         end_idx = min(len(row), max_x - x + 1)
         if end_idx <= start_idx:
             continue
@@ -114,6 +163,7 @@ def draw_sprite_masked(
     x: int,
     y: int,
     default_colour: int,
+    view: Optional[View] = None,
 ) -> None:
     """Draw a sprite with a per-character colour mask.
 
@@ -128,22 +178,24 @@ def draw_sprite_masked(
         x: X position to draw at
         y: Y position to draw at
         default_colour: Default color for unmasked areas
+        view: Optional transform; x/y are then scene coordinates
     """
     if not lines:
         return
-    max_y = screen.height - 1
-    max_x = screen.width - 1
+    vdx, vdy, min_x, min_y, max_x, max_y = _view_bounds(screen, view)
+    x -= vdx
+    y -= vdy
     h = len(lines)
     for dy in range(h):
         row = lines[dy]
         mrow = mask[dy] if dy < len(mask) else ''
         sy = y + dy
-        if sy < 0 or sy > max_y:
+        if sy < min_y or sy > max_y:
             continue
-        if x > max_x or x + len(row) < 0:
+        if x > max_x or x + len(row) <= min_x:
             continue
         # Determine visible horizontal range
-        start_idx = 0 if x >= 0 else -x
+        start_idx = max(0, min_x - x)
         end_idx = min(len(row), max_x - x + 1)
         if end_idx <= start_idx:
             continue
@@ -170,7 +222,9 @@ def draw_sprite_masked(
                 run_start = cx if drawable else None
                 run_colour = col if drawable else None
 
-def fill_rect(screen: "ScreenProtocol", x: int, y: int, w: int, h: int, colour: int) -> None:
+def fill_rect(
+    screen: "ScreenProtocol", x: int, y: int, w: int, h: int, colour: int, view: Optional[View] = None
+) -> None:
     """Fill a rectangular area with spaces in the given colour (opaque erase).
 
     This mimics Perl's default (non-transparent) entity rendering where spaces
@@ -183,18 +237,20 @@ def fill_rect(screen: "ScreenProtocol", x: int, y: int, w: int, h: int, colour:
         w: Width of rectangle
         h: Height of rectangle
         colour: Color to fill with
+        view: Optional transform; x/y are then scene coordinates
     """
     if w <= 0 or h <= 0:
         return
-    max_y = screen.height - 1
-    max_x = screen.width - 1
+    vdx, vdy, min_x, min_y, max_x, max_y = _view_bounds(screen, view)
+    x -= vdx
+    y -= vdy
     # Clip vertical bounds
-    y0 = max(0, y)
+    y0 = max(min_y, y)
     y1 = min(max_y, y + h - 1)
     if y1 < y0:
         return
     # Determine horizontal clipping once per row
-    x0 = max(0, x)
+    x0 = max(min_x, x)
     x1 = min(max_x, x + w - 1)
     if x1 < x0:
         return
@@ -211,25 +267,30 @@ def draw_sprite_masked_with_bg(
     y: int,
     default_colour: int,
     bg_colour: int,
+    view: Optional[View] = None,
 ):
     """Draw a masked sprite with an opaque background per-row while honoring transparency.
 
     Spaces are opaque (they erase with bg_colour) only within the silhouette of
     visible glyphs on that row. Question marks ('?') are treated as transparent
     placeholders: they neither erase the background nor draw a glyph, letting
-    whatever was previously on the screen show through.
+    whatever was previously on the screen show through. With a ``view``, x/y
+    are scene coordinates.
     """
     if not lines:
         return
-    max_y = screen.height - 1
-    max_x = screen.width - 1
+    vdx, vdy, min_x, min_y, max_x, max_y = _view_bounds(screen, view)
+    x -= vdx
+    y -= vdy
+    # Rows below are already in screen space; only the clip still applies
+    clip_view = None if view is None or view.clip is None else View(0, 0, view.clip)
     h = len(lines)
     for dy in range(h):
         row = lines[dy]
         if not row:
             continue
         sy = y + dy
-        if sy < 0 or sy > max_y:
+        if sy < min_y or sy > max_y:
             continue
         # Determine silhouette span for this row (first..last non-transparent glyph)
         # Non-transparent glyphs are any characters except space and '?'
@@ -244,7 +305,7 @@ def draw_sprite_masked_with_bg(
             # Entire row is spaces and/or transparent '?'; nothing to fill or draw
             continue
         # Clip horizontally to screen
-        start_idx = max(first, 0 if x >= 0 else -x)
+        start_idx = max(first, min_x - x)
         end_idx = min(last + 1, max_x - x + 1, len(row))
         if end_idx <= start_idx:
             continue
@@ -262,17 +323,21 @@ def draw_sprite_masked_with_bg(
                     run_start = cx
         # Now draw the masked row on top; replace '?' with spaces to avoid drawing them
         safe_row = row.replace('?', ' ')
-        draw_sprite_masked(screen, [safe_row], [mask[dy] if dy < len(mask) else ''], x, sy, default_colour)
+        draw_sprite_masked(screen, [safe_row], [mask[dy] if dy < len(mask) else ''], x, sy, default_colour, clip_view)
 
 
-def randomize_colour_mask(mask: List[str]) -> List[str]:
+def randomize_colour_mask(mask: List[str], rng: Optional["random.Random"] = None) -> List[str]:
     """Randomize digit placeholders 1..9 in a mask to random colour letters.
 
     Mirrors Perl's rand_color: replace '4' with 'W' (white), then each digit 1..9
-    with a randomly chosen colour code from [c,C,r,R,y,Y,b,B,g,G,m,M].
+    with a randomly chosen colour code from [c,C,r,R,y,Y,b,B,g,G,m,M]. Draws
+    come from ``rng`` when given, else the global random module.
     """
     import random as _random
 
+    if rng is not None:
+        _random = rng  # type: ignore[assignment]
+
     COLOUR_CODES = ['c','C','r','R','y','Y','b','B','g','G','m','M']
 
     # Choose a colour per digit consistently across all lines
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+import threading
 from typing import List, Tuple, Optional, TYPE_CHECKING
 from ..screen_compat import Screen
 
@@ -30,6 +32,16 @@ class DoubleBufferedScreen:
         self._front = [list(blank_row) for _ in range(h)]
         self._back = [list(blank_row) for _ in range(h)]
 
+    def rebind(self, screen: Screen) -> None:
+        """Switch to a new underlying screen (e.g. re-opened after a resize).
+
+        Both buffers are reallocated blank, matching the freshly cleared screen.
+        """
+        self._s = screen
+        self._w = screen.width
+        self._h = screen.height
+        self._init_buffers(self._w, self._h)
+
     @property
     def width(self) -> int:
         return self._s.width
@@ -78,10 +90,14 @@ class DoubleBufferedScreen:
     def flush(self) -> None:
         """Compute diffs and emit print_at calls to the real screen, then refresh."""
         self._ensure_size()
-        w, h = self._w, self._h
+        self._write_diff(self._front, self._back, self._w, self._h)
+        self._s.refresh()
+
+    def _write_diff(self, front: List[List[Cell]], back: List[List[Cell]], w: int, h: int) -> None:
+        """Emit runs of cells that differ between ``back`` and ``front``, then copy back->front."""
         for y in range(h):
-            front_row = self._front[y]
-            back_row = self._back[y]
+            front_row = front[y]
+            back_row = back[y]
             run_colour: Optional[int] = None
             run_start: Optional[int] = None
             for x in range(w + 1):  # sentinel at end
@@ -104,8 +120,7 @@ class DoubleBufferedScreen:
                         run_colour = None
                         run_start = None
             # Copy back->front row
-            self._front[y] = list(back_row)
-        self._s.refresh()
+            front[y] = list(back_row)
 
     def refresh(self) -> None:
         """Update the physical display with current buffer contents."""
@@ -118,3 +133,116 @@ class DoubleBufferedScreen:
     def has_resized(self) -> bool:
         """Check if the screen has been resized since last check."""
         return self._s.has_resized()
+
+
+class PipelinedScreen(DoubleBufferedScreen):
+    """DoubleBufferedScreen whose diff and terminal writes run on an output thread.
+
+    ``flush`` hands the finished back buffer to the output thread and returns,
+    so the caller can simulate the next frame while this one is written. The
+    output thread diffs each frame against the last frame it actually wrote
+    (its own front buffer), so when it falls behind, a newer frame simply
+    replaces the pending one and nothing is left stale on screen.
+
+    Terminal libraries such as curses are not thread-safe, so every call into
+    the wrapped screen (the writes, ``get_event`` and ``has_resized``) holds one
+    lock; read input and resizes through this wrapper, not the raw screen.
+
+    If the output thread fails, the error is logged and later flushes are
+    written synchronously.
+    """
+
+    def __init__(self, screen: Screen) -> None:
+        super().__init__(screen)
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self._cond = threading.Condition()
+        # Serialises all calls into the wrapped screen between the two threads
+        self._io_lock = threading.Lock()
+        self._pending: Optional[Tuple[List[List[Cell]], int, int]] = None
+        self._busy = False
+        self._stop = False
+        self._failed = False
+        # Front buffer of what is on screen; owned by the output thread while it runs
+        self._out_front: List[List[Cell]] = self._front
+        self._thread = threading.Thread(target=self._run, name="aq-output", daemon=True)
+        self._thread.start()
+
+    def flush(self) -> None:
+        """Hand the back buffer to the output thread, replacing any unwritten frame."""
+        if self._failed:
+            super().flush()
+            return
+        self._ensure_size()
+        # The thread keeps the handed-off rows; the next frame is cleared and
+        # redrawn anyway, so drawing continues on fresh blank rows
+        frame = (self._back, self._w, self._h)
+        blank_row: List[Cell] = [(' ', Screen.COLOUR_WHITE)] * self._w
+        self._back = [list(blank_row) for _ in range(self._h)]
+        with self._cond:
+            if self._pending is not None:
+                self.frames_dropped += 1
+            self._pending = frame
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                frame = self._pending
+                self._pending = None
+                self._busy = True
+            assert frame is not None
+            back, w, h = frame
+            try:
+                front = self._out_front
+                if len(front) != h or (h and len(front[0]) != w):
+                    blank_row: List[Cell] = [(' ', Screen.COLOUR_WHITE)] * w
+                    front = self._out_front = [list(blank_row) for _ in range(h)]
+                with self._io_lock:
+                    self._write_diff(front, back, w, h)
+                    self._s.refresh()
+            except Exception as e:
+                logging.warning("Output thread failed, writing frames synchronously: %s", e)
+                with self._cond:
+                    self._front = self._out_front
+                    self._failed = True
+                    self._busy = False
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self.frames_written += 1
+                self._busy = False
+                self._cond.notify_all()
+
+    def sync(self, timeout: float = 2.0) -> None:
+        """Wait until the output thread has written everything handed to it."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._failed or (self._pending is None and not self._busy), timeout)
+
+    def get_event(self):
+        """Get the next input event, without racing a frame being written."""
+        with self._io_lock:
+            return self._s.get_event()
+
+    def has_resized(self) -> bool:
+        """Check for a resize, without racing a frame being written."""
+        with self._io_lock:
+            return self._s.has_resized()
+
+    def rebind(self, screen: Screen) -> None:
+        self.sync()
+        with self._io_lock, self._cond:
+            super().rebind(screen)
+            self._out_front = self._front
+
+    def close(self) -> None:
+        """Write the last pending frame and stop the output thread."""
+        self.sync()
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        self._thread.join(timeout=2.0)
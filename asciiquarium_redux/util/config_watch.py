@@ -0,0 +1,214 @@
+"""Hot-reload of the active config file.
+
+``ConfigWatcher`` polls the config file the settings were loaded from (see
+``Settings.config_path``) at most once per ``poll_interval`` seconds using its
+mtime and size. On a change it re-parses only the top-level TOML sections whose
+contents differ and diffs the result field by field, so an edit to ``[fish]``
+yields just the fish fields that actually changed. Both versions are applied on
+top of a copy of the live settings, so values given on the command line stay in
+effect until the same key is edited in the file, and deleting a key keeps its
+current value.
+
+``apply_settings_changes`` writes the changes into the live settings and
+applies them the way the web backend does: populations are adjusted in place,
+per-fish/per-seaweed copies of settings are updated, and a full rebuild is only
+requested for fields that determine the scene layout.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import random
+from dataclasses import fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .settings import Settings, _load_toml, apply_toml_data
+
+if TYPE_CHECKING:
+    from ..app import AsciiQuarium
+
+logger = logging.getLogger(__name__)
+
+# Fields that decide scene geometry, decor placement or colour assignment
+REBUILD_FIELDS = frozenset({
+    "seed",
+    "color",
+    "fish_tank",
+    "fish_tank_margin",
+    "scene_width_factor",
+    "scene_chunk_cols",
+    "chest_spacing_min",
+    "chest_spacing_max",
+    "chest_max_count",
+})
+# Fields that change target counts; fixed with adjust_populations
+POPULATION_FIELDS = frozenset({
+    "density",
+    "fish_scale",
+    "seaweed_scale",
+    "fish_count_base",
+    "fish_count_per_80_cols",
+    "seaweed_count_base",
+    "seaweed_count_per_80_cols",
+})
+# Settings copied onto each fish when it is created
+FISH_FIELDS = {
+    "fish_turn_enabled": ("turn_enabled", bool),
+    "fish_turn_chance_per_second": ("turn_chance_per_second", float),
+    "fish_turn_min_interval": ("turn_min_interval", float),
+    "fish_turn_shrink_seconds": ("turn_shrink_seconds", float),
+    "fish_turn_expand_seconds": ("turn_expand_seconds", float),
+    "fish_bubble_min": ("bubble_min", float),
+    "fish_bubble_max": ("bubble_max", float),
+    "waterline_top": ("waterline_top", int),
+    "solid_fish": ("solid_fish", bool),
+}
+# Settings copied onto each seaweed when it is created
+SEAWEED_FIELDS = {
+    "seaweed_sway_min": "sway_min",
+    "seaweed_sway_max": "sway_max",
+    "seaweed_lifetime_min": "lifetime_min_cfg",
+    "seaweed_lifetime_max": "lifetime_max_cfg",
+    "seaweed_regrow_delay_min": "regrow_delay_min_cfg",
+    "seaweed_regrow_delay_max": "regrow_delay_max_cfg",
+    "seaweed_growth_rate_min": "growth_rate_min_cfg",
+    "seaweed_growth_rate_max": "growth_rate_max_cfg",
+    "seaweed_shrink_rate_min": "shrink_rate_min_cfg",
+    "seaweed_shrink_rate_max": "shrink_rate_max_cfg",
+}
+# Window/server/wall options only read at startup
+RESTART_PREFIXES = ("ui_", "web_", "wall_")
+
+
+def _diff_settings(before: Settings, after: Settings) -> Dict[str, Any]:
+    changes: Dict[str, Any] = {}
+    for f in fields(Settings):
+        new_val = getattr(after, f.name)
+        if getattr(before, f.name) != new_val:
+            changes[f.name] = new_val
+    return changes
+
+
+class ConfigWatcher:
+    """Poll a TOML config file and report which settings fields changed."""
+
+    def __init__(self, path: str, poll_interval: float = 1.0) -> None:
+        self.path = Path(path)
+        self.poll_interval = max(0.1, float(poll_interval))
+        self._next_poll = 0.0
+        self._stamp = self._stat()
+        self._data = _load_toml(self.path)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def poll(self, now: float, live: Settings) -> Dict[str, Any]:
+        """Return {field: new value} for settings changed since the last poll."""
+        if now < self._next_poll:
+            return {}
+        self._next_poll = now + self.poll_interval
+        stamp = self._stat()
+        if stamp is None or stamp == self._stamp:
+            return {}
+        self._stamp = stamp
+        data = _load_toml(self.path)
+        if not data and self._data:
+            # Unreadable or half-written file; keep the last good contents and retry next change
+            logger.warning("Config %s could not be parsed; keeping current settings", self.path)
+            return {}
+        sections = {k for k in set(data) | set(self._data) if data.get(k) != self._data.get(k)}
+        old_data, self._data = self._data, data
+        if not sections:
+            return {}
+        before, after = copy.deepcopy(live), copy.deepcopy(live)
+        apply_toml_data(before, old_data, sections)
+        apply_toml_data(after, data, sections)
+        return _diff_settings(before, after)
+
+
+def apply_settings_changes(app: "AsciiQuarium", screen: Any, changes: Dict[str, Any]) -> bool:
+    """Write ``changes`` into ``app.settings`` and propagate them to live entities.
+
+    Returns True if a full rebuild is required to apply them.
+    """
+    settings = app.settings
+    needs_rebuild = False
+    needs_adjust = False
+    reset_brains = False
+    for name, value in changes.items():
+        if name.startswith(RESTART_PREFIXES):
+            logger.info("Config change to %s takes effect after a restart", name)
+            continue
+        setattr(settings, name, value)
+        if name in REBUILD_FIELDS:
+            needs_rebuild = True
+        elif name in POPULATION_FIELDS:
+            needs_adjust = True
+        elif name.startswith("ai_") and name != "ai_enabled":
+            reset_brains = True
+    if needs_rebuild:
+        if "seed" in changes:
+            # Reseed the global RNG and the per-entity streams the way startup does
+            from .rng import RandomStreams
+
+            seed = changes["seed"]
+            if seed is not None:
+                random.seed(int(seed))
+            app.rng = RandomStreams(seed)
+        return True
+
+    for name, (attr, typ) in FISH_FIELDS.items():
+        if name in changes:
+            for f in app.fish:
+                try:
+                    setattr(f, attr, typ(changes[name]))
+                except Exception:
+                    pass
+    for name, attr in SEAWEED_FIELDS.items():
+        if name in changes:
+            for sw in app.seaweed:
+                try:
+                    setattr(sw, attr, float(changes[name]))
+                except Exception:
+                    pass
+    if reset_brains:
+        # Brains are created lazily from settings on the next fish update
+        for f in app.fish:
+            if getattr(f, "_brain", None) is not None:
+                f._brain = None
+    if "chest_burst_seconds" in changes:
+        from ..entities.specials import TreasureChest
+
+        for d in app.decor.of_type(TreasureChest):
+            try:
+                d.burst_period = float(changes["chest_burst_seconds"])
+            except Exception:
+                pass
+    if "chest_enabled" in changes:
+        from ..entities.specials import TreasureChest, spawn_treasure_chest
+
+        if not changes["chest_enabled"]:
+            app.decor.retire_where(lambda d: isinstance(d, TreasureChest))
+        elif not app.decor.count_of_type(TreasureChest):
+            try:
+                app.decor.extend(spawn_treasure_chest(screen, app))
+            except Exception as e:
+                logger.warning("Failed to spawn treasure chest: %s", e)
+    if "scene_offset" in changes:
+        try:
+            max_off = max(0, int(getattr(settings, "scene_width", screen.width)) - screen.width)
+            settings.scene_offset = max(0, min(max_off, int(settings.scene_offset)))
+        except Exception:
+            pass
+    if needs_adjust:
+        try:
+            app.adjust_populations(screen)
+        except Exception:
+            return True
+    return False
@@ -0,0 +1,319 @@
+"""Local remote-control and introspection socket.
+
+``ControlServer`` listens on a UNIX-domain socket (any address without a
+``host:port`` shape) or a localhost TCP port, and accepts newline-delimited
+JSON commands such as::
+
+    {"cmd": "pause"}
+    {"cmd": "feed"}
+    {"cmd": "pan", "steps": -1}        or  {"cmd": "pan", "offset": 400}
+    {"cmd": "density", "value": 1.5}
+    {"cmd": "spawn"}                   or  {"cmd": "spawn", "kind": "shark"}
+    {"cmd": "stats"}
+
+Each request gets one JSON line back: ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": "..."}``.
+
+Connections are served on background threads, but commands are only queued
+there; the render loop calls ``process`` between frames to apply them to the
+app, so entities are never touched mid-frame and a slow client cannot stall
+rendering.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from .meminfo import memory_stats
+
+if TYPE_CHECKING:
+    from ..app import AsciiQuarium
+
+logger = logging.getLogger(__name__)
+
+# Commands applied per frame; the rest wait for the next frame
+MAX_COMMANDS_PER_FRAME = 16
+# How long a connection waits for the render loop to apply its command
+REPLY_TIMEOUT = 5.0
+
+
+class ControlError(Exception):
+    """Raised by command handlers for bad requests; reported back to the client."""
+
+
+class _Pending:
+    __slots__ = ("request", "done", "reply")
+
+    def __init__(self, request: Dict[str, Any]) -> None:
+        self.request = request
+        self.done = threading.Event()
+        self.reply: Dict[str, Any] = {}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_ServerMixin"  # type: ignore[assignment]
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                self._send({"ok": False, "error": f"bad request: {e}"})
+                continue
+            pending = _Pending(request)
+            self.server.pending.put(pending)
+            if pending.done.wait(REPLY_TIMEOUT):
+                self._send(pending.reply)
+            else:
+                self._send({"ok": False, "error": "timed out waiting for the render loop"})
+
+    def _send(self, reply: Dict[str, Any]) -> None:
+        self.wfile.write((json.dumps(reply, separators=(",", ":")) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+class _ServerMixin:
+    pending: "queue.Queue[_Pending]"
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _TCPServer(_ServerMixin, socketserver.ThreadingTCPServer):
+    pass
+
+
+class _TCP6Server(_TCPServer):
+    address_family = socket.AF_INET6
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(_ServerMixin, socketserver.ThreadingUnixStreamServer):  # type: ignore[name-defined]
+        pass
+else:  # pragma: no cover - Windows
+    _UnixServer = None  # type: ignore[assignment,misc]
+
+
+def parse_address(address: str, loopback_only: bool = False) -> Tuple[str, Any]:
+    """Return ("tcp", (host, port)) for "host:port" or ":port", else ("unix", path).
+
+    With ``loopback_only`` a TCP host other than localhost, 127.0.0.0/8 or ::1
+    raises ValueError.
+    """
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address:
+        host = host.strip("[]") or "127.0.0.1"
+        if loopback_only and not _is_loopback(host):
+            raise ValueError(f"refusing to listen on non-loopback host {host!r}; use 127.0.0.1 or a UNIX socket")
+        return "tcp", (host, int(port))
+    return "unix", os.path.expanduser(address)
+
+
+def _is_loopback(host: str) -> bool:
+    if host.lower() == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def remove_stale_socket(path: str) -> None:
+    """Unlink a leftover UNIX socket at ``path``; refuse to remove anything else."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    os.unlink(path)
+
+
+class ControlServer:
+    """Socket listener whose commands are applied by the render loop."""
+
+    def __init__(self, address: str) -> None:
+        self.address = address
+        self.kind, target = parse_address(address, loopback_only=True)
+        self._path: Optional[str] = None
+        if self.kind == "unix":
+            if _UnixServer is None:
+                raise OSError("UNIX sockets are not available on this platform; use host:port")
+            # Stale socket from a previous run
+            remove_stale_socket(target)
+            self._server: Any = _UnixServer(target, _Handler)
+            self._path = target
+        else:
+            self._server = (_TCP6Server if ":" in target[0] else _TCPServer)(target, _Handler)
+        self._server.pending = queue.Queue()
+        self._thread = threading.Thread(target=self._server.serve_forever, name="aq-control", daemon=True)
+        self._thread.start()
+
+    def process(self, app: "AsciiQuarium", screen: Any, limit: int = MAX_COMMANDS_PER_FRAME) -> int:
+        """Apply queued commands; call between frames. Returns how many were handled."""
+        handled = 0
+        while handled < limit:
+            try:
+                pending = self._server.pending.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+            try:
+                result = execute(app, screen, pending.request)
+                pending.reply = {"ok": True, "result": result}
+            except ControlError as e:
+                pending.reply = {"ok": False, "error": str(e)}
+            except Exception as e:
+                logger.warning("Control command %r failed: %s", pending.request, e)
+                pending.reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            pending.done.set()
+        return handled
+
+    def close(self) -> None:
+        try:
+            self._server.shutdown()
+            self._server.server_close()
+        finally:
+            if self._path and os.path.exists(self._path):
+                try:
+                    os.unlink(self._path)
+                except OSError:
+                    pass
+
+
+# --- commands ---
+
+def _cmd_pause(app: "AsciiQuarium", screen: Any, req: Dict[str, Any]) -> Any:
+    cmd = req.get("cmd")
+    if cmd == "pause":
+        app._paused = True
+    elif cmd == "resume":
+        app._paused = False
+    else:
+        app._paused = not app._paused
+    return {"paused": app._paused}
+
+
+def _cmd_feed(app: "AsciiQuarium", screen: Any, req: Dict[str, Any]) -> Any:
+    from ..entities.specials import spawn_fish_food, spawn_fish_food_at
+
+    if "x" in req:
+        flakes = spawn_fish_food_at(screen, app, int(req["x"]))
+    else:
+        flakes = spawn_fish_food(screen, app)
+    app.specials.extend(flakes)
+    return {"flakes": len(flakes)}
+
+
+def _cmd_pan(app: "AsciiQuarium", screen: Any, req: Dict[str, Any]) -> Any:
+    from ..app import _pan_scene
+
+    settings = app.settings
+    if bool(getattr(settings, "fish_tank", True)):
+        raise ControlError("panning needs scene mode (fish_tank = false)")
+    if "offset" in req:
+        max_off = max(0, int(getattr(settings, "scene_width", screen.width)) - screen.width)
+        settings.scene_offset = max(0, min(max_off, int(req["offset"])))
+    else:
+        _pan_scene(app, screen, int(req.get("steps", 1)))
+    return {"offset": int(getattr(settings, "scene_offset", 0))}
+
+
+def _cmd_density(app: "AsciiQuarium", screen: Any, req: Dict[str, Any]) -> Any:
+    if "value" not in req:
+        raise ControlError("density needs a value")
+    app.settings.density = max(0.1, min(5.0, float(req["value"])))
+    app.adjust_populations(screen)
+    return {"density": app.settings.density, "fish": len(app.fish), "seaweed": len(app.seaweed)}
+
+
+def _cmd_spawn(app: "AsciiQuarium", screen: Any, req: Dict[str, Any]) -> Any:
+    kind = req.get("kind")
+    before = len(app.specials)
+    if kind is None:
+        app.spawn_random(screen)
+    else:
+        from ..entities import specials as _specials
+
+        kind = str(kind)
+        spawner = getattr(_specials, f"spawn_{kind}", None)
+        if kind not in app.settings.specials_weights or spawner is None:
+            raise ControlError(f"unknown special {kind!r}")
+        app.specials.extend(spawner(screen, app))
+        app._last_spawn[kind] = app._time
+    return {"spawned": len(app.specials) - before}
+
+
+def collect_stats(app: "AsciiQuarium", memory: bool = True) -> Dict[str, Any]:
+    """Entity counts, frame timings and (unless ``memory`` is False) memory for the running app."""
+    specials: Dict[str, int] = {}
+    for s in app.specials:
+        name = type(s).__name__
+        specials[name] = specials.get(name, 0) + 1
+    stats: Dict[str, Any] = {
+        "paused": bool(app._paused),
+        "entities": {
+            "fish": len(app.fish),
+            "seaweed": len(app.seaweed),
+            "bubbles": len(app.bubbles),
+            "splats": len(app.splats),
+            "decor": len(app.decor),
+            "specials": specials,
+        },
+        "scene": {
+            "width": int(getattr(app.settings, "scene_width", 0) or 0),
+            "offset": int(getattr(app.settings, "scene_offset", 0) or 0),
+            "density": float(app.settings.density),
+        },
+    }
+    if memory:
+        stats["memory"] = memory_stats()
+    pacer = getattr(app, "pacer", None)
+    if pacer is not None:
+        stats["frames"] = pacer.stats()
+    pager = getattr(app, "scene_pager", None)
+    if pager is not None:
+        stats["paging"] = pager.stats()
+    return stats
+
+
+def _cmd_stats(app: "AsciiQuarium", screen: Any, req: Dict[str, Any]) -> Any:
+    return collect_stats(app)
+
+
+COMMANDS: Dict[str, Callable[["AsciiQuarium", Any, Dict[str, Any]], Any]] = {
+    "ping": lambda app, screen, req: "pong",
+    "pause": _cmd_pause,
+    "resume": _cmd_pause,
+    "toggle_pause": _cmd_pause,
+    "feed": _cmd_feed,
+    "pan": _cmd_pan,
+    "density": _cmd_density,
+    "spawn": _cmd_spawn,
+    "stats": _cmd_stats,
+}
+
+
+def execute(app: "AsciiQuarium", screen: Any, request: Dict[str, Any]) -> Any:
+    """Run one command against the app (render thread only)."""
+    cmd = request.get("cmd")
+    handler = COMMANDS.get(str(cmd))
+    if handler is None:
+        raise ControlError(f"unknown command {cmd!r}; expected one of {sorted(COMMANDS)}")
+    try:
+        return handler(app, screen, request)
+    except (TypeError, ValueError) as e:
+        raise ControlError(f"bad arguments for {cmd}: {e}")
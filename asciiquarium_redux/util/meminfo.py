@@ -0,0 +1,40 @@
+"""Process memory readings shared by the control socket, the soak test and the memory monitor."""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+from typing import Any, Dict
+
+
+def memory_stats() -> Dict[str, Any]:
+    """RSS, peak RSS and (when tracing) traced-heap sizes in KiB, plus ``gc`` generation counts.
+
+    Keys are left out when the platform cannot provide them (``rss_kb`` needs
+    ``/proc``; ``traced_kb`` needs ``tracemalloc`` to be running).
+    """
+    out: Dict[str, Any] = {"gc_counts": list(gc.get_count())}
+    try:
+        import resource
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes
+        out["max_rss_kb"] = max_rss // 1024 if sys.platform == "darwin" else max_rss
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm") as fh:
+            out["rss_kb"] = int(fh.read().split()[1]) * (os.sysconf("SC_PAGE_SIZE") // 1024)
+    except Exception:
+        pass
+    try:
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            cur, peak = tracemalloc.get_traced_memory()
+            out["traced_kb"] = cur // 1024
+            out["traced_peak_kb"] = peak // 1024
+    except Exception:
+        pass
+    return out
@@ -0,0 +1,231 @@
+"""Opt-in memory monitor for long unattended runs.
+
+``MemoryMonitor`` appends one JSON line to a log every ``interval`` seconds
+(``--memory-log``). A sample holds RSS and traced-heap sizes, ``gc``
+generation counts, entity counts per collection, the size of state that grows
+by accretion (spawn cooldowns, attributes set on settings and fish, backend
+caches passed in as ``extra``) and the top allocation sites from
+``tracemalloc``::
+
+    {"kind": "sample", "t": 3600.0, "entities": {...}, "state": {...}, "memory": {...},
+     "gc": {...}, "top": [{"site": "app.py:812", "kb": 410, "count": 5120}]}
+
+Leaks show up as growth rather than size, so the monitor also keeps a
+``tracemalloc`` snapshot as a mark. When the traced heap has grown by more than
+``growth_kb`` since the mark, it writes a ``"growth"`` record with the
+allocation sites that grew most (and logs a warning naming the worst), then
+moves the mark so each increment is reported once.
+
+``tracemalloc`` costs noticeable CPU and memory on every allocation, which is
+why the monitor is off unless asked for. Snapshots are taken and compared on a
+background thread along with the RSS and ``gc`` readings, so the render loop
+only pays for the entity counts.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .control import collect_stats
+from .meminfo import memory_stats
+
+if TYPE_CHECKING:
+    from ..app import AsciiQuarium
+
+logger = logging.getLogger(__name__)
+
+# Stack depth recorded per allocation; one frame keeps tracing overhead down
+TRACE_FRAMES = 1
+# Allocations by tracemalloc itself and by the import machinery are noise here
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _site(stat: Any) -> str:
+    frame = stat.traceback[0]
+    return f"{_short_path(frame.filename)}:{frame.lineno}"
+
+
+def _short_path(path: str) -> str:
+    # Package files relative to the package, everything else by base name
+    marker = os.sep + "asciiquarium_redux" + os.sep
+    i = path.rfind(marker)
+    if i >= 0:
+        return path[i + 1:]
+    return os.path.basename(path)
+
+
+def accreted_state(app: "AsciiQuarium") -> Dict[str, int]:
+    """Sizes of app state that only ever grows unless something prunes it."""
+    out: Dict[str, int] = {}
+    try:
+        out["last_spawn"] = len(app._last_spawn)
+    except Exception:
+        pass
+    try:
+        out["settings_attrs"] = len(vars(app.settings))
+    except Exception:
+        pass
+    try:
+        # Fish are dataclasses; anything beyond the declared fields was setattr'd
+        out["fish_attrs_max"] = max((len(vars(f)) for f in app.fish), default=0)
+    except Exception:
+        pass
+    try:
+        out["app_attrs"] = len(vars(app))
+    except Exception:
+        pass
+    return out
+
+
+class MemoryMonitor:
+    """Periodically sample memory into a JSON-lines log and report heap growth.
+
+    ``tick`` gathers the cheap counts on the render thread; memory and ``gc``
+    readings, the ``tracemalloc`` snapshot, its statistics and the write happen
+    on a background thread. If a
+    sample is still being processed when the next is due, the newer one wins.
+    """
+
+    def __init__(self, path: str, interval: float = 60.0, growth_kb: int = 16384, top: int = 10) -> None:
+        self.path = path
+        self.interval = max(1.0, float(interval))
+        self.growth_kb = max(1, int(growth_kb))
+        self.top = max(1, int(top))
+        self.samples = 0
+        self.growth_reports = 0
+        self._next_due: Optional[float] = None
+        self._started = time.monotonic()
+        # Only stop tracing on close if this monitor started it
+        self._owns_trace = not tracemalloc.is_tracing()
+        if self._owns_trace:
+            tracemalloc.start(TRACE_FRAMES)
+        self._mark = self._snapshot()
+        self._mark_kb = tracemalloc.get_traced_memory()[0] // 1024
+        self._fh = open(path, "a", encoding="utf-8")
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="aq-memwatch", daemon=True)
+        self._thread.start()
+
+    def _snapshot(self) -> "tracemalloc.Snapshot":
+        return tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._fh.flush()
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            try:
+                self._finish(record)
+            except Exception as e:
+                logger.warning("Memory sample failed: %s", e)
+
+    def _submit(self, record: Optional[Dict[str, Any]]) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def tick(self, app: "AsciiQuarium", now: float, extra: Optional[Dict[str, int]] = None) -> None:
+        """Sample when due; call once per frame from the render loop."""
+        if self._next_due is None:
+            self._next_due = now + self.interval
+            return
+        if now < self._next_due:
+            return
+        self._next_due = now + self.interval
+        try:
+            self._submit(self.counts(app, extra))
+        except Exception as e:
+            logger.warning("Memory sample failed: %s", e)
+
+    def counts(self, app: "AsciiQuarium", extra: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """The part of a sample that reads the app (render thread only)."""
+        stats = collect_stats(app, memory=False)
+        state = accreted_state(app)
+        if extra:
+            state.update(extra)
+        record: Dict[str, Any] = {
+            "kind": "sample",
+            "t": round(time.monotonic() - self._started, 1),
+            "entities": stats.get("entities", {}),
+            "state": state,
+        }
+        if "paging" in stats:
+            record["paging"] = stats["paging"]
+        return record
+
+    def _finish(self, record: Dict[str, Any]) -> None:
+        """Add memory readings and allocation sites to a sample, write it and check for growth."""
+        t0 = time.perf_counter()
+        record["memory"] = memory_stats()
+        record["gc"] = {"counts": list(gc.get_count()), "collections": [g.get("collections", 0) for g in gc.get_stats()]}
+        snap = self._snapshot()
+        record["top"] = [
+            {"site": _site(s), "kb": s.size // 1024, "count": s.count}
+            for s in snap.statistics("lineno")[: self.top]
+        ]
+        growth = self._check_growth(snap, record["t"])
+        record["sample_ms"] = round((time.perf_counter() - t0) * 1000.0, 1)
+        self.samples += 1
+        self._write(record)
+        if growth is not None:
+            self._write(growth)
+
+    def _check_growth(self, snap: "tracemalloc.Snapshot", t: float) -> Optional[Dict[str, Any]]:
+        traced_kb = tracemalloc.get_traced_memory()[0] // 1024
+        grown = traced_kb - self._mark_kb
+        if grown < self.growth_kb:
+            if grown < 0:
+                # Heap shrank: re-mark so a later rise is measured from the low point
+                self._mark, self._mark_kb = snap, traced_kb
+            return None
+        diff: List[Dict[str, Any]] = []
+        for s in snap.compare_to(self._mark, "lineno")[: self.top]:
+            if s.size_diff <= 0:
+                break
+            diff.append({"site": _site(s), "kb": s.size // 1024, "grown_kb": s.size_diff // 1024, "count_diff": s.count_diff})
+        self._mark, self._mark_kb = snap, traced_kb
+        self.growth_reports += 1
+        if diff:
+            logger.warning("Traced heap grew %d KiB; largest growth at %s (+%d KiB)", grown, diff[0]["site"], diff[0]["grown_kb"])
+        return {"kind": "growth", "t": t, "grown_kb": grown, "traced_kb": traced_kb, "diff": diff}
+
+    def close(self, app: Optional["AsciiQuarium"] = None) -> None:
+        """Write a final sample (when ``app`` is given) and stop tracing if we started it."""
+        try:
+            if app is not None:
+                self._submit(self.counts(app))
+            # Queue the stop behind the final sample instead of replacing it
+            self._queue.put(None, timeout=10.0)
+            self._thread.join(timeout=10.0)
+        except Exception as e:
+            logger.warning("Final memory sample failed: %s", e)
+        finally:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            if self._owns_trace and tracemalloc.is_tracing():
+                tracemalloc.stop()
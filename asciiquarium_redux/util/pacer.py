@@ -0,0 +1,193 @@
+"""Frame pacing against absolute deadlines, with timing statistics.
+
+Sleeping for ``target - elapsed`` each frame accumulates every oversleep into
+drift, so a 60 FPS setting typically lands in the mid 50s. ``FramePacer``
+instead keeps an absolute ``time.perf_counter`` deadline that advances by
+exactly one period per frame: a frame that wakes late is followed by a shorter
+wait, and the long-run rate matches the target. If the loop falls more than a
+few periods behind (a stall, a suspended terminal), the schedule is re-anchored
+instead of bursting frames to catch up.
+
+Two ways to drive it:
+
+* blocking loops call ``wait()`` at the end of each frame; it sleeps until
+  shortly before the deadline and optionally spins for the remainder;
+* event-loop hosts call ``frame_started()`` at the top of each tick and
+  schedule the next one with ``delay_ms()`` (Tk ``after``) or ``remaining()``
+  (``asyncio.sleep``).
+
+Achieved frame rate and wake-up jitter are recorded in fixed-bucket histograms
+plus a sliding window for percentiles; ``stats()`` returns them as a dict.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+# Histogram bucket upper edges
+JITTER_EDGES_MS: Sequence[float] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0)
+FPS_EDGES: Sequence[float] = (10.0, 15.0, 20.0, 24.0, 30.0, 45.0, 55.0, 59.0, 61.0, 75.0, 90.0, 120.0)
+# Re-anchor rather than catch up when this many periods behind
+_MAX_BEHIND_PERIODS = 4
+
+
+class Histogram:
+    """Counts of samples per bucket; the last bucket collects everything above the top edge."""
+
+    def __init__(self, edges: Sequence[float]) -> None:
+        self.edges: List[float] = list(edges)
+        self.counts: List[int] = [0] * (len(self.edges) + 1)
+        self.total = 0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.edges, value)] += 1
+        self.total += 1
+
+    def as_dict(self) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        lo = 0.0
+        for edge, n in zip(self.edges, self.counts):
+            out[f"{lo:g}-{edge:g}"] = n
+            lo = edge
+        out[f">{lo:g}"] = self.counts[-1]
+        return out
+
+
+def _percentile(sorted_vals: List[float], p: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    i = min(len(sorted_vals) - 1, max(0, int(round(p / 100.0 * (len(sorted_vals) - 1)))))
+    return sorted_vals[i]
+
+
+class FramePacer:
+    """Keep a loop on a fixed frame rate using absolute perf_counter deadlines."""
+
+    def __init__(
+        self,
+        fps: float,
+        spin: float = 0.0,
+        window: int = 600,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self.spin = max(0.0, float(spin))
+        self.period = 1.0 / max(1.0, float(fps))
+        self._deadline: Optional[float] = None
+        self._last_frame: Optional[float] = None
+        self.frames = 0
+        self.late_frames = 0
+        self.resyncs = 0
+        self.jitter_hist = Histogram(JITTER_EDGES_MS)
+        self.fps_hist = Histogram(FPS_EDGES)
+        self._jitter: Deque[float] = deque(maxlen=max(1, int(window)))
+        self._intervals: Deque[float] = deque(maxlen=max(1, int(window)))
+
+    @property
+    def fps(self) -> float:
+        return 1.0 / self.period
+
+    def set_fps(self, fps: float) -> None:
+        period = 1.0 / max(1.0, float(fps))
+        if abs(period - self.period) > 1e-9:
+            self.period = period
+            # New rate: schedule from now rather than from the old cadence
+            self._deadline = None
+
+    # --- recording ---
+    def _record(self, now: float) -> None:
+        if self._deadline is not None:
+            late = now - self._deadline
+            jitter_ms = abs(late) * 1000.0
+            self.jitter_hist.add(jitter_ms)
+            self._jitter.append(jitter_ms)
+            if late > self.period * 0.5:
+                self.late_frames += 1
+        if self._last_frame is not None:
+            interval = now - self._last_frame
+            if interval > 0:
+                self._intervals.append(interval)
+                self.fps_hist.add(1.0 / interval)
+        self._last_frame = now
+        self.frames += 1
+
+    def _advance(self, now: float) -> None:
+        if self._deadline is None:
+            self._deadline = now + self.period
+            return
+        self._deadline += self.period
+        if now - self._deadline > self.period * _MAX_BEHIND_PERIODS:
+            self._deadline = now + self.period
+            self.resyncs += 1
+
+    # --- blocking loops ---
+    def wait(self) -> float:
+        """Block until the next frame deadline; returns the wake-up time."""
+        now = self._clock()
+        if self._deadline is None:
+            # First frame (or after a rate change): nothing to wait for yet
+            self._record(now)
+            self._advance(now)
+            return now
+        deadline = self._deadline
+        remaining = deadline - now
+        if remaining > self.spin:
+            self._sleep(remaining - self.spin)
+        if self.spin > 0.0:
+            while self._clock() < deadline:
+                pass
+        now = self._clock()
+        self._record(now)
+        self._advance(now)
+        return now
+
+    # --- event-loop hosts ---
+    def frame_started(self) -> None:
+        """Record a frame that an event loop has just started."""
+        now = self._clock()
+        self._record(now)
+        self._advance(now)
+
+    def remaining(self) -> float:
+        """Seconds until the next deadline (0 when none is scheduled or it has passed)."""
+        if self._deadline is None:
+            return 0.0
+        return max(0.0, self._deadline - self._clock())
+
+    def delay_ms(self) -> int:
+        """Whole milliseconds until the next deadline (rounded down, so timers fire early rather than late)."""
+        if self._deadline is None:
+            return 0
+        return max(0, int((self._deadline - self._clock()) * 1000.0))
+
+    # --- reporting ---
+    def stats(self) -> Dict[str, object]:
+        jit = sorted(self._jitter)
+        intervals = list(self._intervals)
+        mean_interval = sum(intervals) / len(intervals) if intervals else 0.0
+        return {
+            "target_fps": round(self.fps, 3),
+            "fps": round(1.0 / mean_interval, 2) if mean_interval > 0 else 0.0,
+            "frames": self.frames,
+            "late_frames": self.late_frames,
+            "resyncs": self.resyncs,
+            "jitter_ms": {
+                "p50": round(_percentile(jit, 50), 3),
+                "p95": round(_percentile(jit, 95), 3),
+                "p99": round(_percentile(jit, 99), 3),
+                "max": round(jit[-1], 3) if jit else 0.0,
+            },
+            "jitter_hist_ms": self.jitter_hist.as_dict(),
+            "fps_hist": self.fps_hist.as_dict(),
+        }
+
+    def summary(self) -> str:
+        st = self.stats()
+        jit = st["jitter_ms"]
+        assert isinstance(jit, dict)
+        return f"{st['fps']:.1f}/{st['target_fps']:g} fps  jitter p50 {jit['p50']:.2f} ms  p99 {jit['p99']:.2f} ms"
@@ -0,0 +1,237 @@
+"""Chunked paging of very wide scenes.
+
+In scene mode (``fish_tank = false``) the world is ``scene_width_factor`` screens
+wide, but only the part around the view can be seen. With ``scene_chunk_cols``
+set, ``ScenePager`` splits the world into fixed-width chunks and keeps fish and
+seaweed live only in the chunks overlapping the view plus a margin of one
+chunk on each side (the *active window*):
+
+* a chunk is generated the first time it enters the active window, so startup
+  cost follows the view rather than the world;
+* a chunk that leaves the window is paged out: its fish and seaweed are removed
+  from the live lists and kept as a compressed pickle (the snapshot pickler,
+  so sprites and the app are stored by reference);
+* when it comes back it is unpickled and fast-forwarded by the time it spent
+  dormant: seaweed run their lifecycle in coarse steps and fish swim on,
+  wrapping inside their chunk.
+
+Fish that swim out of the active window are handed over to the dormant side
+and an equivalent fish enters from it, which keeps each region's population
+stable without simulating what nobody can see. The margin chunk keeps these
+hand-overs out of view. Specials, decor, bubbles and splats stay global; they
+are few and short-lived.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+import random
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Set, Tuple
+
+from ..constants import MOVEMENT_MULTIPLIER
+
+if TYPE_CHECKING:
+    from ..app import AsciiQuarium
+
+# Narrower chunks would let hand-overs at the window edge show up in view
+MIN_CHUNK_COLS = 40
+# Seaweed fast-forward: step size and the most dormant time worth replaying
+_SEAWEED_STEP = 1.0
+_SEAWEED_MAX_REPLAY = 120.0
+
+
+@dataclass
+class _DormantChunk:
+    blob: bytes
+    # app._time when the chunk was paged out
+    since: float
+    fish: int
+    seaweed: int
+
+
+class ScenePager:
+    """Track which scene chunks are live and page the rest in and out."""
+
+    def __init__(self, chunk_cols: int, scene_width: int, margin_chunks: int = 1) -> None:
+        self.chunk_cols = max(MIN_CHUNK_COLS, int(chunk_cols))
+        self.scene_width = max(1, int(scene_width))
+        self.margin = max(1, int(margin_chunks))
+        self.n_chunks = max(1, math.ceil(self.scene_width / self.chunk_cols))
+        self.active: Set[int] = set()
+        self.dormant: Dict[int, _DormantChunk] = {}
+        self.generated: Set[int] = set()
+        self.paged_out = 0
+        self.paged_in = 0
+        self.handovers = 0
+
+    # --- geometry ---
+    def chunk_of(self, x: float) -> int:
+        return max(0, min(self.n_chunks - 1, int(x) // self.chunk_cols))
+
+    def bounds(self, chunk: int) -> Tuple[int, int]:
+        x0 = chunk * self.chunk_cols
+        return x0, min(self.scene_width, x0 + self.chunk_cols)
+
+    def window(self, offset: int, view_width: int) -> Set[int]:
+        lo = self.chunk_of(offset) - self.margin
+        hi = self.chunk_of(offset + max(1, view_width) - 1) + self.margin
+        return set(range(max(0, lo), min(self.n_chunks - 1, hi) + 1))
+
+    def active_range(self) -> Tuple[int, int]:
+        """Scene columns [lo, hi) covered by the (contiguous) active window."""
+        if not self.active:
+            return 0, self.scene_width
+        return self.bounds(min(self.active))[0], self.bounds(max(self.active))[1]
+
+    def share(self, count: int, minimum: int = 1) -> int:
+        """Part of a whole-scene population ``count`` that belongs in the active window."""
+        lo, hi = self.active_range()
+        return max(minimum, int(round(count * (hi - lo) / self.scene_width)))
+
+    # --- paging ---
+    def update(self, app: "AsciiQuarium", screen: Any) -> None:
+        """Page chunks for the current view; call once per frame before entities update."""
+        want = self.window(int(getattr(app.settings, "scene_offset", 0)), int(screen.width))
+        if want != self.active:
+            for chunk in sorted(self.active - want):
+                self._page_out(app, chunk)
+            entering = sorted(want - self.active)
+            self.active = want
+            for chunk in entering:
+                self._page_in(app, screen, chunk)
+        self._hand_over(app, screen)
+
+    def rebase(self, scene_width: int, offset: int, view_width: int) -> None:
+        """Adopt a new scene width (resize): dormant chunks no longer fit and are dropped."""
+        self.scene_width = max(1, int(scene_width))
+        self.n_chunks = max(1, math.ceil(self.scene_width / self.chunk_cols))
+        self.dormant.clear()
+        self.active = self.window(offset, view_width)
+        # Live entities already cover the new window; chunks outside it start fresh
+        self.generated = set(self.active)
+
+    def _page_out(self, app: "AsciiQuarium", chunk: int) -> None:
+        x0, x1 = self.bounds(chunk)
+        fish = [f for f in app.fish if x0 <= _centre(f) < x1 and not getattr(f, "hooked", False)]
+        seaweed = [s for s in app.seaweed if x0 <= int(s.x) < x1]
+        if fish:
+            gone = {id(f) for f in fish}
+            app.fish[:] = [f for f in app.fish if id(f) not in gone]
+            for f in fish:
+                # Brains are rebuilt lazily and hold per-process ids
+                f._brain = None
+                # A random stream pickles to ~4 KiB of incompressible state; a fresh one is issued on page-in
+                f.rng = None
+        if seaweed:
+            gone = {id(s) for s in seaweed}
+            app.seaweed[:] = [s for s in app.seaweed if id(s) not in gone]
+            for s in seaweed:
+                s.rng = None
+        from .snapshot import _SnapshotPickler
+
+        buf = io.BytesIO()
+        _SnapshotPickler(buf, app).dump({"fish": fish, "seaweed": seaweed})
+        self.dormant[chunk] = _DormantChunk(zlib.compress(buf.getvalue(), 6), float(app._time), len(fish), len(seaweed))
+        self.paged_out += 1
+
+    def _page_in(self, app: "AsciiQuarium", screen: Any, chunk: int) -> None:
+        dormant = self.dormant.pop(chunk, None)
+        if dormant is None:
+            if chunk not in self.generated:
+                self._generate(app, screen, chunk)
+            return
+        from .snapshot import _SnapshotUnpickler
+
+        state = _SnapshotUnpickler(io.BytesIO(zlib.decompress(dormant.blob)), app).load()
+        elapsed = max(0.0, float(app._time) - dormant.since)
+        x0, x1 = self.bounds(chunk)
+        for s in state["seaweed"]:
+            s.rng = app.rng.spawn("seaweed")
+            _fast_forward_seaweed(s, elapsed, screen, app)
+        for f in state["fish"]:
+            f.rng = app.rng.spawn("fish")
+            _fast_forward_fish(f, elapsed, x0, x1)
+        app.seaweed.extend(state["seaweed"])
+        app.fish.extend(state["fish"])
+        self.paged_in += 1
+
+    def _generate(self, app: "AsciiQuarium", screen: Any, chunk: int) -> None:
+        """Populate a never-visited chunk with its share of the scene's fish and seaweed."""
+        self.generated.add(chunk)
+        x0, x1 = self.bounds(chunk)
+        total_fish, total_seaweed = app._scene_target_counts(screen)
+        frac = (x1 - x0) / self.scene_width
+        n_seaweed = _stochastic_round(total_seaweed * frac)
+        n_fish = _stochastic_round(total_fish * frac)
+        for _ in range(n_seaweed):
+            s = app._make_one_seaweed(screen)
+            s.x = random.randint(x0, max(x0, x1 - 3))
+            app.seaweed.append(s)
+        palette = app._palette(screen)
+        for _ in range(n_fish):
+            f = app._make_one_fish(screen, palette)
+            f.scene_x = float(random.randint(x0, max(x0, x1 - f.width)))
+            app.fish.append(f)
+
+    def _hand_over(self, app: "AsciiQuarium", screen: Any) -> None:
+        """Swap fish that left the active window for fish entering from the dormant side."""
+        lo, hi = self.active_range()
+        for f in app.fish:
+            if getattr(f, "hooked", False):
+                continue
+            c = _centre(f)
+            if lo > 0 and c < lo:
+                f.respawn(screen, 1)
+                f.scene_x = float(lo - f.width // 2 + 1)
+            elif hi < self.scene_width and c >= hi:
+                f.respawn(screen, -1)
+                f.scene_x = float(hi - f.width // 2 - 1)
+            else:
+                continue
+            self.handovers += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lo, hi = self.active_range()
+        return {
+            "chunks": self.n_chunks,
+            "chunk_cols": self.chunk_cols,
+            "active": [lo, hi],
+            "dormant": len(self.dormant),
+            "dormant_kb": sum(len(d.blob) for d in self.dormant.values()) // 1024,
+            "dormant_fish": sum(d.fish for d in self.dormant.values()),
+            "generated": len(self.generated),
+            "paged_in": self.paged_in,
+            "paged_out": self.paged_out,
+            "handovers": self.handovers,
+        }
+
+
+def _centre(f: Any) -> float:
+    return float(getattr(f, "scene_x", f.x)) + f.width / 2.0
+
+
+def _stochastic_round(v: float) -> int:
+    n = int(v)
+    return n + (1 if random.random() < v - n else 0)
+
+
+def _fast_forward_seaweed(s: Any, elapsed: float, screen: Any, app: Any) -> None:
+    # Only the lifecycle phase matters after a long absence, so cap the replay
+    remaining = min(elapsed, _SEAWEED_MAX_REPLAY)
+    while remaining > 0.0:
+        step = min(_SEAWEED_STEP, remaining)
+        s.update(step, screen, app)
+        remaining -= step
+
+
+def _fast_forward_fish(f: Any, elapsed: float, x0: int, x1: int) -> None:
+    # Keep swimming at the current speed, wrapping within the home chunk
+    span = max(1, x1 - x0)
+    x = float(getattr(f, "scene_x", f.x)) + float(f.vx) * elapsed * MOVEMENT_MULTIPLIER
+    f.scene_x = x0 + (x - x0) % span
+    f.turning = False
+    f.turn_phase = "idle"
+    f.turn_t = 0.0
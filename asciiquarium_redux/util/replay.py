@@ -0,0 +1,127 @@
+"""Deterministic input logs for reproducible runs.
+
+A recording captures everything that makes a terminal session non-deterministic
+besides the seeded RNG: the per-frame ``dt`` fed to ``AsciiQuarium.update`` and
+the input events handled on that frame. Replaying the log with the same seed
+re-feeds both, and drives the app's clock from the logged ``dt`` values so
+time-based logic (start overlay, mouse debounce) sees identical timestamps.
+
+Format: JSON lines, gzip-compressed when the path ends in ``.gz``. The first
+line is a header object; each following line is ``[frame, dt]`` or
+``[frame, dt, events]`` where events are ``["k", key_code]`` or
+``["m", x, y, buttons]``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from typing import IO, Any, List, Optional, Tuple
+
+LOG_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+class VirtualClock:
+    """Clock that only advances when told to; callable like ``time.time``."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = float(start)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, dt: float) -> float:
+        self.now += float(dt)
+        return self.now
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+def encode_event(event: Any) -> Optional[list]:
+    """Encode an asciimatics keyboard/mouse event (or a KeyEvent/MouseEvent lookalike)."""
+    if event is None:
+        return None
+    key = getattr(event, "key_code", None)
+    if key is not None:
+        return ["k", int(key)]
+    if hasattr(event, "buttons") and hasattr(event, "x") and hasattr(event, "y"):
+        return ["m", int(event.x), int(event.y), int(event.buttons)]
+    return None
+
+
+def decode_event(rec: list) -> Any:
+    """Rebuild an asciimatics event from its encoded form."""
+    from asciimatics.event import KeyboardEvent, MouseEvent  # type: ignore
+
+    if rec and rec[0] == "k":
+        return KeyboardEvent(int(rec[1]))
+    if rec and rec[0] == "m":
+        return MouseEvent(int(rec[1]), int(rec[2]), int(rec[3]))
+    return None
+
+
+class InputRecorder:
+    """Append (frame, dt, events) records to an input log."""
+
+    def __init__(self, path: str, header: dict) -> None:
+        self.path = path
+        self._fh: Optional[IO[str]] = _open(path, "w")
+        self._fh.write(json.dumps({"v": LOG_VERSION, **header}) + "\n")
+
+    def record(self, frame_no: int, dt: float, events: List[Any]) -> None:
+        if self._fh is None:
+            return
+        encoded = [e for e in (encode_event(ev) for ev in events) if e is not None]
+        rec: list = [int(frame_no), float(dt)]
+        if encoded:
+            rec.append(encoded)
+        self._fh.write(json.dumps(rec, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+
+
+class InputReplayer:
+    """Read back an input log frame by frame."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fh: Optional[IO[str]] = _open(path, "r")
+        first = self._fh.readline()
+        try:
+            self.header: dict = json.loads(first) if first else {}
+        except ValueError:
+            self.header = {}
+        if int(self.header.get("v", 0)) != LOG_VERSION:
+            logger.warning("Input log %s has unexpected version %r", path, self.header.get("v"))
+
+    def next_frame(self) -> Optional[Tuple[float, List[Any]]]:
+        """Return (dt, events) for the next frame, or None when the log is exhausted."""
+        if self._fh is None:
+            return None
+        line = self._fh.readline()
+        if not line:
+            self.close()
+            return None
+        rec = json.loads(line)
+        dt = float(rec[1])
+        events = [decode_event(e) for e in rec[2]] if len(rec) > 2 else []
+        return dt, [e for e in events if e is not None]
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
@@ -115,7 +115,7 @@ import argparse
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Set, Tuple
 import tomllib
 
 
@@ -222,6 +222,10 @@ class Settings:
     """
 
     fps: int = 20
+    # Busy-wait this many milliseconds before each frame deadline for tighter pacing (0 = sleep only)
+    spin_ms: float = 0.0
+    # Write each frame to the terminal on a background thread while the next is simulated
+    pipelined_output: bool = False
     density: float = 1.0
     color: str = "auto"
     seed: Optional[int] = None
@@ -304,6 +308,8 @@ class Settings:
     ui_font_auto: bool = True
     ui_font_min_size: int = 10
     ui_font_max_size: int = 22
+    # Terminal backend: drive frames from an asyncio loop (see aio.run_asyncio)
+    ui_asyncio: bool = False
     web_open: bool = False
     web_host: str = "127.0.0.1"
     web_port: int = 8000
@@ -321,6 +327,12 @@ class Settings:
     ai_explore_gain: float = 0.6
     ai_baseline_separation: float = 0.6
     ai_baseline_avoid: float = 0.9
+    # Re-plan each brain every N frames (staggered across fish); 1 = every frame
+    ai_replan_frames: int = 1
+    # Predators closer than this (cells) force an immediate re-plan
+    ai_urgent_radius: float = 8.0
+    # Worker processes that run fish brains in parallel; 0 = in-process
+    ai_workers: int = 0
     # When idling, allow very low speeds and add damping to calm motion
     ai_idle_min_speed: float = 0.0
     ai_idle_damping_per_sec: float = 0.8
@@ -340,6 +352,8 @@ class Settings:
     scene_offset: int = 0
     # Panning step size as a fraction of current screen width (e.g., 0.2 = 20% of screen width)
     scene_pan_step_fraction: float = 0.2
+    # Page the scene in chunks of this many columns, keeping only those near the view live (0 = off)
+    scene_chunk_cols: int = 0
     # Rendering options
     solid_fish: bool = True
     start_screen: bool = True
@@ -347,6 +361,31 @@ class Settings:
     start_overlay_after_frames: List[str] = field(default_factory=list)
     # Seconds to hold each post-start frame
     start_overlay_after_frame_seconds: float = 0.08
+    # Deterministic input log (terminal backend): write to / replay from this path
+    record_path: Optional[str] = None
+    replay_path: Optional[str] = None
+    # Snapshot file to resume from (if present) and save to periodically and on exit
+    resume_path: Optional[str] = None
+    snapshot_interval: float = 30.0
+    # Config file the settings were loaded from; watched for edits when config_reload is on
+    config_path: Optional[str] = None
+    config_reload: bool = True
+    # Remote control socket: UNIX socket path or localhost "host:port" (off when None)
+    control_socket: Optional[str] = None
+    # Memory monitor: append samples to this JSON-lines file (off when None)
+    memory_log: Optional[str] = None
+    memory_interval: float = 60.0
+    # Report allocation sites when the traced heap grows by this much since the last report
+    memory_growth_kb: int = 16384
+    # Headless soak test: simulate this many hours as fast as possible, then report (off when 0)
+    soak_hours: float = 0.0
+    soak_report: Optional[str] = None
+    soak_max_rss_mb: int = 0
+    # Video wall: "coordinator" runs the simulation for wall_tiles displays, "worker" renders tile wall_tile
+    wall_role: Optional[str] = None
+    wall_address: str = "127.0.0.1:7780"
+    wall_tiles: int = 2
+    wall_tile: int = 0
 
 
 def _find_config_paths(override: Optional[Path] = None) -> List[Path]:
@@ -445,25 +484,42 @@ def _load_toml_configurations(s: Settings, override_path: Optional[Path]) -> Non
 
     for p in candidates:
         data = _load_toml(p)
-        _parse_render_settings(s, data.get("render", {}))
-        _parse_scene_settings(s, data.get("scene", {}))
-        _parse_spawn_settings(s, data.get("spawn", {}))
-        _parse_fish_settings(s, data.get("fish", {}))
-        _parse_seaweed_settings(s, data.get("seaweed", {}))
-        _parse_fishhook_settings(s, data.get("fishhook", {}))
-        _parse_ui_settings(s, data.get("ui", {}))
-        _parse_ai_settings(s, data.get("ai", {}))
-        # Fallback: accept top-level fish tank keys if users placed them at root
-        try:
-            if "fish_tank" in data:
-                s.fish_tank = bool(data.get("fish_tank"))
-            if "fish_tank_margin" in data:
-                s.fish_tank_margin = max(0, int(data.get("fish_tank_margin") or 0))
-        except Exception:
-            pass
+        apply_toml_data(s, data)
+        s.config_path = str(p)
         break  # Only process first found config file
 
 
+def apply_toml_data(s: Settings, data: dict, sections: Optional[Set[str]] = None) -> None:
+    """Apply parsed TOML data to settings.
+
+    Args:
+        s: Settings object to modify
+        data: Whole TOML document
+        sections: Optional set of top-level keys to apply; all when None
+    """
+    for name, parser in (
+        ("render", _parse_render_settings),
+        ("scene", _parse_scene_settings),
+        ("spawn", _parse_spawn_settings),
+        ("fish", _parse_fish_settings),
+        ("seaweed", _parse_seaweed_settings),
+        ("fishhook", _parse_fishhook_settings),
+        ("ui", _parse_ui_settings),
+        ("ai", _parse_ai_settings),
+        ("wall", _parse_wall_settings),
+    ):
+        if sections is None or name in sections:
+            parser(s, data.get(name, {}))
+    # Fallback: accept top-level fish tank keys if users placed them at root
+    try:
+        if "fish_tank" in data and (sections is None or "fish_tank" in sections):
+            s.fish_tank = bool(data.get("fish_tank"))
+        if "fish_tank_margin" in data and (sections is None or "fish_tank_margin" in sections):
+            s.fish_tank_margin = max(0, int(data.get("fish_tank_margin") or 0))
+    except Exception:
+        pass
+
+
 def _parse_render_settings(s: Settings, render: dict) -> None:
     """Parse render section of TOML configuration.
 
@@ -475,6 +531,12 @@ def _parse_render_settings(s: Settings, render: dict) -> None:
         s.fps = int(render.get("fps", s.fps))
     if "color" in render:
         s.color = str(render.get("color", s.color))
+    if "spin_ms" in render:
+        try:
+            s.spin_ms = max(0.0, min(5.0, float(render.get("spin_ms", s.spin_ms))))
+        except Exception:
+            pass
+    _safe_set_bool(s, "pipelined_output", render)
 
 
 def _parse_scene_settings(s: Settings, scene: dict) -> None:
@@ -519,6 +581,14 @@ def _parse_scene_settings(s: Settings, scene: dict) -> None:
                     s.scene_width_factor = val
         except Exception:
             pass
+    # Chunked paging for wide scenes (0 disables)
+    if "scene_chunk_cols" in scene:
+        try:
+            raw = scene.get("scene_chunk_cols")
+            if raw is not None:
+                s.scene_chunk_cols = max(0, int(raw))
+        except Exception:
+            pass
     # Scene offset
     if "scene_offset" in scene:
         try:
@@ -803,6 +873,10 @@ def _parse_ui_settings(s: Settings, ui: dict) -> None:
     if isinstance(v, int):
         s.ui_font_max_size = max(8, min(72, v))
 
+    b = ui.get("asyncio")
+    if isinstance(b, bool):
+        s.ui_asyncio = b
+
     # Optional post-start overlay animation frames and timing
     try:
         frames = ui.get("start_overlay_after_frames")
@@ -819,6 +893,33 @@ def _parse_ui_settings(s: Settings, ui: dict) -> None:
         s.ui_font_max_size = s.ui_font_min_size
 
 
+def _parse_wall_settings(s: Settings, wall: dict) -> None:
+    """Parse wall section of TOML configuration.
+
+    Args:
+        s: Settings object to modify
+        wall: Wall section dictionary from TOML
+    """
+    if not isinstance(wall, dict):
+        return
+
+    role = wall.get("role")
+    if role in ("coordinator", "worker"):
+        s.wall_role = role
+
+    addr = wall.get("address")
+    if isinstance(addr, str) and addr.strip():
+        s.wall_address = addr.strip()
+
+    v = wall.get("tiles")
+    if isinstance(v, int):
+        s.wall_tiles = max(1, min(64, v))
+
+    v = wall.get("tile")
+    if isinstance(v, int):
+        s.wall_tile = max(0, v)
+
+
 def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
     """Apply command line argument overrides to settings.
 
@@ -829,11 +930,15 @@ def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
     parser = argparse.ArgumentParser(description="Asciiquarium Redux")
     parser.add_argument("--config", type=str, help="Path to a config TOML file")
     parser.add_argument("--fps", type=int)
+    parser.add_argument("--spin-ms", dest="spin_ms", type=float)
+    parser.add_argument("--pipelined-output", dest="pipelined_output", action="store_true", default=None)
+    parser.add_argument("--no-pipelined-output", dest="pipelined_output", action="store_false")
     parser.add_argument("--density", type=float)
     parser.add_argument("--color", choices=["auto", "mono", "16", "256"])
     parser.add_argument("--seed", type=int)
     parser.add_argument("--speed", type=float)
     parser.add_argument("--backend", choices=["terminal", "tk", "web"])
+    parser.add_argument("--asyncio", dest="ui_asyncio", action="store_true", default=None)
     parser.add_argument("--open", dest="web_open", action="store_true")
     parser.add_argument("--host", dest="web_host", type=str)
     parser.add_argument("--port", dest="web_port", type=int)
@@ -848,6 +953,7 @@ def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
     parser.add_argument("--font-max", dest="ui_font_max_size", type=int)
     parser.add_argument("--ai", dest="ai_enabled", action="store_true")
     parser.add_argument("--no-ai", dest="ai_enabled", action="store_false")
+    parser.add_argument("--ai-workers", dest="ai_workers", type=int, metavar="N")
     # Default paired booleans to None so absent flags don't override config
     parser.set_defaults(fullscreen=None, ai_enabled=None, fish_tank=None, solid_fish=None, start_screen=None)
     parser.add_argument("--fish-tank", dest="fish_tank", action="store_true")
@@ -857,15 +963,44 @@ def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
     parser.add_argument("--scene-width-factor", dest="scene_width_factor", type=int)
     parser.add_argument("--scene-offset", dest="scene_offset", type=int)
     parser.add_argument("--scene-pan-step", dest="scene_pan_step_fraction", type=float)
+    parser.add_argument("--scene-chunk-cols", dest="scene_chunk_cols", type=int)
     # Rendering flags
     parser.add_argument("--solid-fish", dest="solid_fish", action="store_true")
     parser.add_argument("--no-solid-fish", dest="solid_fish", action="store_false")
     parser.add_argument("--start-screen", dest="start_screen", action="store_true")
     parser.add_argument("--no-start-screen", dest="start_screen", action="store_false")
+    # Reproducible runs: log per-frame dt and input, or re-feed a previous log
+    parser.add_argument("--record", dest="record_path", type=str, metavar="LOG")
+    parser.add_argument("--replay", dest="replay_path", type=str, metavar="LOG")
+    # Fast resume: restore simulation state from a snapshot and keep it updated
+    parser.add_argument("--resume", dest="resume_path", type=str, metavar="PATH")
+    parser.add_argument("--snapshot-interval", dest="snapshot_interval", type=float, metavar="SECONDS")
+    # Apply edits to the config file while running
+    parser.add_argument("--config-reload", dest="config_reload", action="store_true", default=None)
+    parser.add_argument("--no-config-reload", dest="config_reload", action="store_false")
+    # Opt-in JSON control socket for headless displays
+    parser.add_argument("--control", dest="control_socket", type=str, metavar="ADDRESS")
+    # Opt-in memory sampling and leak reports for long-running displays
+    parser.add_argument("--memory-log", dest="memory_log", type=str, metavar="PATH")
+    parser.add_argument("--memory-interval", dest="memory_interval", type=float, metavar="SECONDS")
+    parser.add_argument("--memory-growth-kb", dest="memory_growth_kb", type=int, metavar="KB")
+    # Accelerated-time headless soak test
+    parser.add_argument("--soak", dest="soak_hours", type=float, metavar="HOURS")
+    parser.add_argument("--soak-report", dest="soak_report", type=str, metavar="PATH")
+    parser.add_argument("--soak-max-rss-mb", dest="soak_max_rss_mb", type=int, metavar="MB")
+    # Video wall: one coordinator simulates, one worker per display renders its tile
+    parser.add_argument("--wall", dest="wall_role", choices=["coordinator", "worker"])
+    parser.add_argument("--wall-address", dest="wall_address", type=str, metavar="ADDRESS")
+    parser.add_argument("--wall-tiles", dest="wall_tiles", type=int)
+    parser.add_argument("--wall-tile", dest="wall_tile", type=int)
     args = parser.parse_args(argv)
 
     if args.fps is not None:
         s.fps = max(5, min(120, args.fps))
+    if getattr(args, "spin_ms", None) is not None:
+        s.spin_ms = max(0.0, min(5.0, float(args.spin_ms)))
+    if getattr(args, "pipelined_output", None) is not None:
+        s.pipelined_output = bool(args.pipelined_output)
     if args.density is not None:
         s.density = max(0.1, min(5.0, args.density))
     if args.color is not None:
@@ -876,6 +1011,8 @@ def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
         s.speed = max(0.1, min(3.0, args.speed))
     if args.backend is not None:
         s.ui_backend = args.backend
+    if getattr(args, "ui_asyncio", None) is not None:
+        s.ui_asyncio = bool(args.ui_asyncio)
     if getattr(args, "fullscreen", None) is not None:
         s.ui_fullscreen = bool(args.fullscreen)
     if getattr(args, "castle_enabled", None) is not None:
@@ -888,6 +1025,8 @@ def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
         s.chest_max_count = max(1, int(args.chest_max_count))
     if getattr(args, "ai_enabled", None) is not None:
         s.ai_enabled = bool(args.ai_enabled)
+    if getattr(args, "ai_workers", None) is not None:
+        s.ai_workers = max(0, int(args.ai_workers))
     if getattr(args, "fish_tank", None) is not None:
         s.fish_tank = bool(args.fish_tank)
     if getattr(args, "fish_tank_margin", None) is not None:
@@ -900,6 +1039,8 @@ def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
             s.scene_width_factor = val
     if getattr(args, "scene_offset", None) is not None:
         s.scene_offset = max(0, int(args.scene_offset))
+    if getattr(args, "scene_chunk_cols", None) is not None:
+        s.scene_chunk_cols = max(0, int(args.scene_chunk_cols))
     if getattr(args, "scene_pan_step_fraction", None) is not None:
         try:
             s.scene_pan_step_fraction = max(0.01, min(1.0, float(args.scene_pan_step_fraction)))
@@ -919,6 +1060,38 @@ def _apply_cli_overrides(s: Settings, argv: Optional[List[str]]) -> None:
             s.start_screen = bool(args.start_screen)
     except Exception:
         pass
+    if getattr(args, "record_path", None):
+        s.record_path = str(args.record_path)
+    if getattr(args, "replay_path", None):
+        s.replay_path = str(args.replay_path)
+    if getattr(args, "resume_path", None):
+        s.resume_path = str(args.resume_path)
+    if getattr(args, "snapshot_interval", None) is not None:
+        s.snapshot_interval = max(1.0, float(args.snapshot_interval))
+    if getattr(args, "config_reload", None) is not None:
+        s.config_reload = bool(args.config_reload)
+    if getattr(args, "control_socket", None):
+        s.control_socket = str(args.control_socket)
+    if getattr(args, "memory_log", None):
+        s.memory_log = str(args.memory_log)
+    if getattr(args, "memory_interval", None) is not None:
+        s.memory_interval = max(1.0, float(args.memory_interval))
+    if getattr(args, "memory_growth_kb", None) is not None:
+        s.memory_growth_kb = max(1, int(args.memory_growth_kb))
+    if getattr(args, "soak_hours", None) is not None:
+        s.soak_hours = max(0.0, float(args.soak_hours))
+    if getattr(args, "soak_report", None):
+        s.soak_report = str(args.soak_report)
+    if getattr(args, "soak_max_rss_mb", None) is not None:
+        s.soak_max_rss_mb = max(0, int(args.soak_max_rss_mb))
+    if getattr(args, "wall_role", None):
+        s.wall_role = str(args.wall_role)
+    if getattr(args, "wall_address", None):
+        s.wall_address = str(args.wall_address)
+    if getattr(args, "wall_tiles", None) is not None:
+        s.wall_tiles = max(1, min(64, int(args.wall_tiles)))
+    if getattr(args, "wall_tile", None) is not None:
+        s.wall_tile = max(0, int(args.wall_tile))
 
     try:
         if getattr(args, "web_open", False):
@@ -990,7 +1163,8 @@ def _parse_ai_settings(s: Settings, ai: dict) -> None:
         separation_radius, obstacle_radius,
         flock_alignment, flock_cohesion, flock_separation,
         eat_gain, hide_gain, explore_gain,
-        baseline_separation, baseline_avoid
+        baseline_separation, baseline_avoid,
+        replan_frames (int), urgent_radius, workers (int)
     """
     if not isinstance(ai, dict):
         return
@@ -1008,6 +1182,7 @@ def _parse_ai_settings(s: Settings, ai: dict) -> None:
         ("explore_gain", "ai_explore_gain"),
         ("baseline_separation", "ai_baseline_separation"),
         ("baseline_avoid", "ai_baseline_avoid"),
+        ("urgent_radius", "ai_urgent_radius"),
     ]:
         if key in ai:
             try:
@@ -1016,3 +1191,17 @@ def _parse_ai_settings(s: Settings, ai: dict) -> None:
                     setattr(s, attr, float(val))
             except Exception:
                 pass
+    if "replan_frames" in ai:
+        try:
+            val = ai.get("replan_frames")
+            if val is not None:
+                s.ai_replan_frames = max(1, int(val))
+        except Exception:
+            pass
+    if "workers" in ai:
+        try:
+            val = ai.get("workers")
+            if val is not None:
+                s.ai_workers = max(0, int(val))
+        except Exception:
+            pass
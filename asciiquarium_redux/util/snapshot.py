@@ -0,0 +1,279 @@
+"""Snapshot and restore of the whole simulation for fast resume.
+
+A snapshot is a zlib-compressed pickle of every entity collection plus the
+app's timers, spawn cooldowns, scene geometry and the global RNG state. Two
+kinds of objects are written as references instead of being copied:
+
+* the app and its settings (entities and fish brains point back at them),
+  which resolve to the live app on restore; and
+* fish sprite frames and masks shared from ``fish_assets``, stored by table
+  and index so the file stays small and restored fish share the same lists.
+
+Per-entity random streams (``random.Random``, ~4.6 KB of state each) are saved
+as a 64-bit seed derived from their state rather than the state itself. Resume
+is therefore deterministic for a given file but not bit-exact with a run that
+was never interrupted. Scene paging uses the same picklers with full streams.
+
+Loading only resolves the package's entity, AI and paging classes plus a few
+harmless standard types, so a snapshot cannot name arbitrary callables. It is
+still a pickle: keep it somewhere only the user running the tank can write.
+
+Capturing runs on the render thread between frames (pickling only touches
+plain data and is fast); compression and the atomic file write happen on a
+background thread so periodic saves do not stall frames.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import pickle
+import queue
+import random
+import threading
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..app import AsciiQuarium
+
+SNAPSHOT_MAGIC = b"AQSNAP1\n"
+
+logger = logging.getLogger(__name__)
+
+# App attributes carried across a restart (timers, cooldowns, AI cues)
+_APP_FIELDS = (
+    "_paused",
+    "_special_timer",
+    "_seaweed_tick",
+    "_time",
+    "_last_spawn",
+    "_global_cooldown_until",
+    "_restock_timer",
+    "_ai_food_epoch",
+    "_ai_flake_count",
+    "scene_pager",
+    "rng",
+)
+# Settings written by rebuild() that describe the scene rather than user config
+_SCENE_SETTINGS = ("scene_width", "scene_offset", "castle_scene_x")
+_COLLECTIONS = ("fish", "seaweed", "bubbles", "splats", "specials", "decor")
+# Modules whose classes may appear in a snapshot (exact names or package prefixes)
+_SAFE_MODULES = (
+    "asciiquarium_redux.entities.",
+    "asciiquarium_redux.ai.brain",
+    "asciiquarium_redux.ai.noise",
+    "asciiquarium_redux.ai.steering",
+    "asciiquarium_redux.ai.utility",
+    "asciiquarium_redux.ai.vector",
+    "asciiquarium_redux.ai.world",
+    "asciiquarium_redux.util.paging",
+    "asciiquarium_redux.util.rng",
+)
+_SAFE_GLOBALS = {
+    ("asciiquarium_redux.ai.parallel", "RemoteBrain"),
+    ("random", "Random"),
+    ("collections", "deque"),
+    ("collections", "OrderedDict"),
+    ("collections", "defaultdict"),
+    ("builtins", "set"),
+    ("builtins", "frozenset"),
+    ("builtins", "bytearray"),
+    ("builtins", "complex"),
+    ("builtins", "range"),
+    ("builtins", "slice"),
+}
+
+
+def _sprite_tables() -> Dict[str, list]:
+    from ..entities.core.fish_assets import FISH_RIGHT, FISH_LEFT, FISH_RIGHT_MASKS, FISH_LEFT_MASKS
+
+    return {
+        "fish_right": FISH_RIGHT,
+        "fish_left": FISH_LEFT,
+        "fish_right_masks": FISH_RIGHT_MASKS,
+        "fish_left_masks": FISH_LEFT_MASKS,
+    }
+
+
+def _safe_module(module: str) -> bool:
+    return any(module == m.rstrip(".") or (m.endswith(".") and module.startswith(m)) for m in _SAFE_MODULES)
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, fh: io.BytesIO, app: "AsciiQuarium", compact_rng: bool = False) -> None:
+        super().__init__(fh, protocol=pickle.HIGHEST_PROTOCOL)
+        self._app = app
+        self._compact_rng = compact_rng
+        self._sprites: Dict[int, Tuple[str, str, int]] = {}
+        for name, table in _sprite_tables().items():
+            for i, spr in enumerate(table):
+                self._sprites[id(spr)] = ("sprite", name, i)
+
+    def persistent_id(self, obj: Any) -> Any:
+        if obj is self._app:
+            return "app"
+        if obj is self._app.settings:
+            return "settings"
+        if isinstance(obj, list):
+            return self._sprites.get(id(obj))
+        if self._compact_rng and type(obj) is random.Random:
+            # Hashing the state picks a seed without drawing from the live stream
+            return ("rng", hash(obj.getstate()) & 0xFFFFFFFFFFFFFFFF)
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, fh: io.BytesIO, app: "AsciiQuarium") -> None:
+        super().__init__(fh)
+        self._app = app
+        self._tables = _sprite_tables()
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "app":
+            return self._app
+        if pid == "settings":
+            return self._app.settings
+        if isinstance(pid, tuple) and len(pid) == 3 and pid[0] == "sprite":
+            return self._tables[pid[1]][int(pid[2])]
+        if isinstance(pid, tuple) and len(pid) == 2 and pid[0] == "rng":
+            return random.Random(int(pid[1]))
+        raise pickle.UnpicklingError(f"unknown persistent id {pid!r}")
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+        if _safe_module(module):
+            obj = super().find_class(module, name)
+            if isinstance(obj, type):
+                return obj
+        raise pickle.UnpicklingError(f"snapshot refers to disallowed global {module}.{name}")
+
+
+def capture(app: "AsciiQuarium", screen: Any) -> bytes:
+    """Pickle the simulation state (uncompressed); call between frames."""
+    state = {
+        "screen": (int(screen.width), int(screen.height)),
+        "collections": {name: list(getattr(app, name)) for name in _COLLECTIONS},
+        "app": {k: getattr(app, k) for k in _APP_FIELDS if hasattr(app, k)},
+        "scene": {k: getattr(app.settings, k) for k in _SCENE_SETTINGS if hasattr(app.settings, k)},
+        "rng": random.getstate(),
+    }
+    buf = io.BytesIO()
+    _SnapshotPickler(buf, app, compact_rng=True).dump(state)
+    return buf.getvalue()
+
+
+def encode(raw: bytes) -> bytes:
+    return SNAPSHOT_MAGIC + zlib.compress(raw, 6)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def save(app: "AsciiQuarium", screen: Any, path: str) -> None:
+    """Capture and write a snapshot synchronously."""
+    write_atomic(path, encode(capture(app, screen)))
+
+
+def restore(app: "AsciiQuarium", screen: Any, path: str) -> bool:
+    """Restore ``app`` from a snapshot file in place of ``rebuild``.
+
+    Returns False (leaving the app untouched) if the file is missing or unreadable.
+    If the screen size differs, the restored tank is fitted with ``app.resize``.
+    """
+    try:
+        with open(path, "rb") as fh:
+            blob = fh.read()
+        if not blob.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("not a snapshot file")
+        state = _SnapshotUnpickler(io.BytesIO(zlib.decompress(blob[len(SNAPSHOT_MAGIC):])), app).load()
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logger.warning("Ignoring unreadable snapshot %s: %s", path, e)
+        return False
+    for name, value in state["scene"].items():
+        setattr(app.settings, name, value)
+    for name, items in state["collections"].items():
+        coll = getattr(app, name)
+        coll.clear()
+        coll.extend(items)
+    for name, value in state["app"].items():
+        setattr(app, name, value)
+    # No start overlay on resume; the tank should simply carry on
+    app._start_overlay_until = 0.0
+    # Brains address their fish by id(), which changes across processes
+    for f in app.fish:
+        brain = getattr(f, "_brain", None)
+        if brain is not None:
+            brain.fish_id = id(f)
+    random.setstate(state["rng"])
+    old_w, old_h = state["screen"]
+    app.resize(screen, int(old_w), int(old_h))
+    return True
+
+
+class PeriodicSnapshotter:
+    """Save snapshots every ``interval`` seconds via a background writer thread.
+
+    ``tick`` is called from the render loop; it captures when due and hands the
+    bytes to the writer. If the writer is still busy, the pending snapshot is
+    replaced so only the newest state is written.
+    """
+
+    def __init__(self, path: str, interval: float) -> None:
+        self.path = path
+        self.interval = max(1.0, float(interval))
+        self._next_due: Optional[float] = None
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="aq-snapshot", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            raw = self._queue.get()
+            if raw is None:
+                return
+            try:
+                write_atomic(self.path, encode(raw))
+            except Exception as e:
+                logger.warning("Snapshot write to %s failed: %s", self.path, e)
+
+    def _submit(self, raw: Optional[bytes]) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(raw)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def tick(self, app: "AsciiQuarium", screen: Any, now: float) -> None:
+        if self._next_due is None:
+            self._next_due = now + self.interval
+            return
+        if now < self._next_due:
+            return
+        self._next_due = now + self.interval
+        try:
+            self._submit(capture(app, screen))
+        except Exception as e:
+            logger.warning("Snapshot capture failed: %s", e)
+
+    def close(self, app: Optional["AsciiQuarium"] = None, screen: Any = None) -> None:
+        """Optionally write a final snapshot, then stop the writer thread."""
+        if app is not None and screen is not None:
+            try:
+                self._submit(capture(app, screen))
+            except Exception as e:
+                logger.warning("Snapshot capture failed: %s", e)
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
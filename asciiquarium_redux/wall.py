@@ -0,0 +1,571 @@
+"""Video-wall mode: one simulation tiled across several displays.
+
+A coordinator process owns the only ``AsciiQuarium`` and runs the usual
+terminal frame loop against ``WallScreen``, a virtual screen as wide as all
+tiles side by side. The double buffer's per-frame diff runs are split at tile
+boundaries and streamed to each tile's worker, so the simulation runs once no
+matter how many displays there are and a fish crossing a tile edge simply
+continues on the neighbouring display.
+
+Workers are thin renderers (terminal or Tk) that connect to the coordinator,
+announce their tile index and size, and then just draw the runs they receive.
+Key presses and clicks are forwarded back (clicks translated to wall
+coordinates); ``q`` only closes the worker that pressed it.
+
+Wire protocol: newline-delimited JSON over TCP ("host:port") or a UNIX socket.
+
+* worker -> coordinator: ``{"hello": {"tile": i, "cols": w, "rows": h}}``, then
+  ``{"key": "p"}`` / ``{"key": "LEFT"}`` and ``{"mouse": [x, y, buttons]}``
+* coordinator -> worker: ``{"f": frame, "full": bool, "runs": [[y, x, colour, text], ...]}``
+
+Tiles are laid out left to right by index; the wall is as tall as the shortest
+tile. A worker that reconnects with the same size gets a full frame; one that
+comes back with a different size makes the coordinator re-fit the tank, the
+same way a terminal resize does. A worker that cannot keep up has its backlog
+dropped and is resynchronised with a full frame.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .app import TerminalSession, run as _run
+from .screen_compat import Screen
+from .util.control import parse_address, remove_stale_socket
+from .util.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Frames buffered per worker before it is considered behind and resynchronised
+MAX_QUEUED_FRAMES = 8
+# Seconds between worker attempts to reach the coordinator
+RECONNECT_DELAY = 1.0
+
+Run = List[Any]  # [y, x, colour, text]
+
+
+def _encode(msg: Dict[str, Any]) -> bytes:
+    return (json.dumps(msg, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _row_runs(y: int, cells: List[Tuple[str, int]]) -> List[Run]:
+    """Split one row of (char, colour) cells into same-colour runs."""
+    runs: List[Run] = []
+    start = 0
+    for x in range(1, len(cells) + 1):
+        if x == len(cells) or cells[x][1] != cells[start][1]:
+            runs.append([y, start, cells[start][1], "".join(c for c, _ in cells[start:x])])
+            start = x
+    return runs
+
+
+# --- coordinator ---
+
+class _TileLink(socketserver.StreamRequestHandler):
+    """One worker connection: reads hello/input, writes frames from its own queue."""
+
+    server: "_ServerMixin"  # type: ignore[assignment]
+
+    def setup(self) -> None:
+        super().setup()
+        self.tile = -1
+        self.size = (0, 0)
+        self.needs_full = True
+        self.outbox: "queue.Queue[Optional[bytes]]" = queue.Queue(MAX_QUEUED_FRAMES)
+        self.alive = True
+
+    def handle(self) -> None:
+        wall = self.server.wall
+        writer: Optional[threading.Thread] = None
+        try:
+            for raw in self.rfile:
+                try:
+                    msg = json.loads(raw)
+                except ValueError:
+                    continue
+                if not isinstance(msg, dict):
+                    continue
+                if "hello" in msg and writer is None:
+                    hello = msg["hello"]
+                    try:
+                        tile, cols, rows = int(hello["tile"]), int(hello["cols"]), int(hello["rows"])
+                    except (KeyError, TypeError, ValueError):
+                        return
+                    if not 0 <= tile < wall.tiles or cols < 1 or rows < 1:
+                        self.wfile.write(_encode({"error": f"tile must be 0..{wall.tiles - 1}"}))
+                        return
+                    self.tile, self.size = tile, (cols, rows)
+                    writer = threading.Thread(target=self._write_loop, name=f"aq-wall-{tile}", daemon=True)
+                    writer.start()
+                    wall._attach(self)
+                elif writer is not None:
+                    wall._input(self, msg)
+        finally:
+            self.alive = False
+            if writer is not None:
+                wall._detach(self)
+                try:
+                    self.outbox.put_nowait(None)
+                except queue.Full:
+                    pass
+
+    def _write_loop(self) -> None:
+        while self.alive:
+            data = self.outbox.get()
+            if data is None:
+                return
+            try:
+                self.request.sendall(data)
+            except OSError:
+                self.alive = False
+                return
+
+    def send(self, data: bytes) -> None:
+        try:
+            self.outbox.put_nowait(data)
+        except queue.Full:
+            # Too far behind for diffs to be useful: drop the backlog and resync
+            while True:
+                try:
+                    self.outbox.get_nowait()
+                except queue.Empty:
+                    break
+            self.needs_full = True
+
+
+class _ServerMixin:
+    wall: "WallCoordinator"
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _TCPServer(_ServerMixin, socketserver.ThreadingTCPServer):
+    pass
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(_ServerMixin, socketserver.ThreadingUnixStreamServer):  # type: ignore[name-defined]
+        pass
+else:  # pragma: no cover - Windows
+    _UnixServer = None  # type: ignore[assignment,misc]
+
+
+class WallCoordinator:
+    """Accept tile workers and track the wall layout."""
+
+    def __init__(self, address: str, tiles: int) -> None:
+        self.address = address
+        self.tiles = max(1, int(tiles))
+        kind, target = parse_address(address)
+        self._path: Optional[str] = None
+        if kind == "unix":
+            if _UnixServer is None:
+                raise OSError("UNIX sockets are not available on this platform; use host:port")
+            remove_stale_socket(target)
+            self._server: Any = _UnixServer(target, _TileLink)
+            self._path = target
+        else:
+            self._server = _TCPServer(target, _TileLink)
+        self._server.wall = self
+        self._cond = threading.Condition()
+        self._links: Dict[int, _TileLink] = {}
+        self._sizes: Dict[int, Tuple[int, int]] = {}
+        self._events: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        # Bumped whenever a tile's size changes; screens built for an older layout report a resize
+        self.layout_version = 0
+        self._thread = threading.Thread(target=self._server.serve_forever, name="aq-wall", daemon=True)
+        self._thread.start()
+
+    # Called from connection threads
+    def _attach(self, link: _TileLink) -> None:
+        with self._cond:
+            old = self._links.get(link.tile)
+            if old is not None and old is not link:
+                old.alive = False
+                old.send(b"")  # wake its writer so it can exit
+            prev = self._sizes.get(link.tile)
+            if prev is not None and prev != link.size and len(self._sizes) == self.tiles:
+                self.layout_version += 1
+            self._sizes[link.tile] = link.size
+            self._links[link.tile] = link
+            self._cond.notify_all()
+        logger.info("Wall tile %d connected (%dx%d)", link.tile, *link.size)
+
+    def _detach(self, link: _TileLink) -> None:
+        with self._cond:
+            if self._links.get(link.tile) is link:
+                del self._links[link.tile]
+        logger.info("Wall tile %d disconnected", link.tile)
+
+    def _input(self, link: _TileLink, msg: Dict[str, Any]) -> None:
+        self._events.append((link.tile, msg))
+
+    # Called from the render loop
+    def wait_for_tiles(self, timeout: Optional[float] = None) -> bool:
+        """Block until every tile has connected at least once."""
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._sizes) == self.tiles, timeout)
+
+    def layout(self) -> Tuple[List[int], List[int], int]:
+        """Return (x offsets, widths, height) of the tiles in index order."""
+        with self._cond:
+            widths = [self._sizes[i][0] for i in range(self.tiles)]
+            height = min(self._sizes[i][1] for i in range(self.tiles))
+        offsets = [sum(widths[:i]) for i in range(self.tiles)]
+        return offsets, widths, height
+
+    def link(self, tile: int) -> Optional[_TileLink]:
+        link = self._links.get(tile)
+        return link if link is not None and link.alive else None
+
+    def pop_input(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        try:
+            return self._events.popleft()
+        except IndexError:
+            return None
+
+    def screen(self) -> "WallScreen":
+        return WallScreen(self)
+
+    def close(self) -> None:
+        try:
+            self._server.shutdown()
+            self._server.server_close()
+        finally:
+            if self._path and os.path.exists(self._path):
+                try:
+                    os.unlink(self._path)
+                except OSError:
+                    pass
+
+
+class WallScreen:
+    """Screen spanning all tiles; routes flushed runs to the workers.
+
+    ``DoubleBufferedScreen`` computes one diff for the whole wall and calls
+    ``print_at`` for each changed run; runs are cut at tile boundaries and sent
+    on ``refresh``. A mirror of what each worker should be showing is kept so a
+    (re)connecting worker can be sent a full frame.
+    """
+
+    def __init__(self, wall: WallCoordinator) -> None:
+        self._wall = wall
+        self._version = wall.layout_version
+        self.offsets, self.widths, self.height = wall.layout()
+        self.width = sum(self.widths)
+        self._cells: List[List[Tuple[str, int]]] = [[(" ", Screen.COLOUR_WHITE)] * self.width for _ in range(self.height)]
+        self._pending: List[List[Run]] = [[] for _ in self.widths]
+        self._frame = 0
+        # A new layout means new buffers on every worker
+        for i in range(wall.tiles):
+            link = wall.link(i)
+            if link is not None:
+                link.needs_full = True
+
+    def clear(self) -> None:
+        pass
+
+    def print_at(self, text: str, x: int, y: int, colour: Optional[int] = None, *args: Any, **kwargs: Any) -> None:
+        if not text or y < 0 or y >= self.height or x >= self.width:
+            return
+        if x < 0:
+            text, x = text[-x:], 0
+        text = text[: self.width - x]
+        col = Screen.COLOUR_WHITE if colour is None else int(colour)
+        row = self._cells[y]
+        for i, ch in enumerate(text):
+            row[x + i] = (ch, col)
+        end = x + len(text)
+        t = bisect.bisect_right(self.offsets, x) - 1
+        while t < len(self.offsets) and x < end:
+            x0 = self.offsets[t]
+            cut = min(end, x0 + self.widths[t])
+            self._pending[t].append([y, x - x0, col, text[: cut - x]])
+            text, x = text[cut - x:], cut
+            t += 1
+
+    def refresh(self) -> None:
+        self._frame += 1
+        for t, runs in enumerate(self._pending):
+            link = self._wall.link(t)
+            if link is None:
+                runs.clear()
+                continue
+            if link.needs_full:
+                link.needs_full = False
+                x0, w = self.offsets[t], self.widths[t]
+                full: List[Run] = []
+                for y, row in enumerate(self._cells):
+                    full.extend(_row_runs(y, row[x0:x0 + w]))
+                link.send(_encode({"f": self._frame, "full": True, "runs": full}))
+            elif runs:
+                link.send(_encode({"f": self._frame, "full": False, "runs": runs}))
+            self._pending[t] = []
+
+    def get_event(self) -> Any:
+        """Next forwarded worker input as an asciimatics event (wall coordinates)."""
+        from asciimatics.event import KeyboardEvent, MouseEvent  # type: ignore
+        from asciimatics.screen import Screen as _TermScreen  # type: ignore
+
+        while True:
+            item = self._wall.pop_input()
+            if item is None:
+                return None
+            tile, msg = item
+            if "key" in msg:
+                key = msg["key"]
+                if key in ("LEFT", "RIGHT"):
+                    return KeyboardEvent(_TermScreen.KEY_LEFT if key == "LEFT" else _TermScreen.KEY_RIGHT)
+                if isinstance(key, str) and len(key) == 1 and key not in "qQ":
+                    # Quitting is per worker; the wall keeps running
+                    return KeyboardEvent(ord(key))
+            elif "mouse" in msg:
+                try:
+                    x, y, buttons = (int(v) for v in msg["mouse"])
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= tile < len(self.offsets):
+                    return MouseEvent(self.offsets[tile] + x, y, buttons)
+
+    def has_resized(self) -> bool:
+        return self._wall.layout_version != self._version
+
+
+def run_coordinator(settings: Settings) -> None:
+    """Serve the wall: wait for all tiles, then run the simulation until Ctrl-C."""
+    from asciimatics.exceptions import ResizeScreenError  # type: ignore
+
+    wall = WallCoordinator(str(settings.wall_address), int(settings.wall_tiles))
+    print(f"[wall] Listening on {settings.wall_address}; waiting for {wall.tiles} tile(s)")
+    session = TerminalSession()
+    try:
+        wall.wait_for_tiles()
+        while True:
+            screen = wall.screen()
+            print(f"[wall] Layout {screen.width}x{screen.height}: widths {screen.widths}")
+            try:
+                _run(screen, settings, session)  # type: ignore[arg-type]
+                break
+            except ResizeScreenError:
+                continue
+    except KeyboardInterrupt:
+        pass
+    finally:
+        wall.close()
+
+
+# --- workers ---
+
+class WorkerLink:
+    """Connection from a tile worker to the coordinator."""
+
+    def __init__(self, address: str, tile: int, cols: int, rows: int) -> None:
+        kind, target = parse_address(address)
+        if kind == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(target)
+        else:
+            sock = socket.create_connection(target)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self.messages: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.connected = True
+        self.error: Optional[str] = None
+        self.send({"hello": {"tile": int(tile), "cols": int(cols), "rows": int(rows)}})
+        self._reader = threading.Thread(target=self._read_loop, name="aq-wall-reader", daemon=True)
+        self._reader.start()
+
+    def _read_loop(self) -> None:
+        try:
+            with self._sock.makefile("rb") as fh:
+                for raw in fh:
+                    try:
+                        msg = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if isinstance(msg, dict):
+                        if "error" in msg:
+                            self.error = str(msg["error"])
+                        self.messages.put(msg)
+        except OSError:
+            pass
+        finally:
+            self.connected = False
+
+    def send(self, msg: Dict[str, Any]) -> None:
+        try:
+            self._sock.sendall(_encode(msg))
+        except OSError:
+            self.connected = False
+
+    def drain(self, timeout: float) -> List[Dict[str, Any]]:
+        """Frames received so far, waiting up to ``timeout`` for the first one."""
+        out: List[Dict[str, Any]] = []
+        try:
+            out.append(self.messages.get(timeout=timeout))
+            while True:
+                out.append(self.messages.get_nowait())
+        except queue.Empty:
+            pass
+        return out
+
+    def close(self) -> None:
+        self.connected = False
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+
+def _connect(address: str, tile: int, cols: int, rows: int) -> Optional[WorkerLink]:
+    try:
+        return WorkerLink(address, tile, cols, rows)
+    except OSError:
+        return None
+
+
+def _worker_loop(screen: Any, settings: Settings) -> None:
+    from asciimatics.event import KeyboardEvent, MouseEvent  # type: ignore
+    from asciimatics.exceptions import ResizeScreenError  # type: ignore
+    from asciimatics.screen import Screen as _TermScreen  # type: ignore
+
+    address, tile = str(settings.wall_address), int(settings.wall_tile)
+    arrows = {_TermScreen.KEY_LEFT: "LEFT", _TermScreen.KEY_RIGHT: "RIGHT"}
+    link: Optional[WorkerLink] = None
+    buttons = 0
+    idle = 1.0 / max(1, settings.fps) / 2
+    try:
+        while True:
+            if link is None or not link.connected:
+                if link is not None and link.error:
+                    raise SystemExit(f"[wall] {link.error}")
+                link = _connect(address, tile, screen.width, screen.height)
+                if link is None:
+                    screen.clear()
+                    screen.print_at(f"Waiting for coordinator at {address} (tile {tile})...", 1, 1)
+                    screen.refresh()
+                    time.sleep(RECONNECT_DELAY)
+            while True:
+                event = screen.get_event()
+                if event is None:
+                    break
+                if isinstance(event, KeyboardEvent):
+                    if event.key_code in (ord("q"), ord("Q")):
+                        return
+                    if event.key_code in arrows:
+                        key = arrows[event.key_code]
+                    elif 0 <= event.key_code < 0x110000:
+                        key = chr(event.key_code)
+                    else:
+                        continue
+                    if link is not None:
+                        link.send({"key": key})
+                elif isinstance(event, MouseEvent) and event.buttons != buttons:
+                    buttons = event.buttons
+                    if link is not None:
+                        link.send({"mouse": [event.x, event.y, event.buttons]})
+            if screen.has_resized():
+                raise ResizeScreenError("Screen resized")
+            if link is None:
+                continue
+            messages = link.drain(idle)
+            for msg in messages:
+                if msg.get("full"):
+                    screen.clear()
+                for y, x, colour, text in msg.get("runs", ()):
+                    screen.print_at(text, x, y, colour=colour)
+            if messages:
+                screen.refresh()
+    finally:
+        if link is not None:
+            link.close()
+
+
+def run_worker(settings: Settings) -> None:
+    """Render one tile in the terminal, re-joining the wall after resizes."""
+    from asciimatics.screen import Screen as _RealScreen  # type: ignore
+    from asciimatics.exceptions import ResizeScreenError  # type: ignore
+
+    while True:
+        try:
+            _RealScreen.wrapper(lambda scr: _worker_loop(scr, settings))
+            break
+        except ResizeScreenError:
+            continue
+
+
+def run_tk_worker(settings: Settings) -> None:
+    """Render one tile in a Tk window of ``ui_cols`` x ``ui_rows`` cells."""
+    import tkinter as tk
+    from tkinter import font as tkfont
+    from .backend.term import KeyEvent, MouseEvent, TkEventStream, TkRenderContext
+
+    root = tk.Tk()
+    root.title(f"Asciiquarium Redux - wall tile {settings.wall_tile}")
+    fnt = tkfont.Font(family=str(getattr(settings, "ui_font_family", "Menlo")), size=int(getattr(settings, "ui_font_size", 14)))
+    cell_w = max(8, int(fnt.measure("W")))
+    cell_h = max(7, int(fnt.metrics("linespace")))
+    cols, rows = int(getattr(settings, "ui_cols", 120)), int(getattr(settings, "ui_rows", 40))
+    if getattr(settings, "ui_fullscreen", False):
+        root.attributes("-fullscreen", True)
+        cols = max(1, root.winfo_screenwidth() // cell_w)
+        rows = max(1, root.winfo_screenheight() // cell_h)
+    canvas = tk.Canvas(root, width=cols * cell_w, height=rows * cell_h, bg="black", highlightthickness=0)
+    canvas.pack()
+    root._cell_w = cell_w  # type: ignore[attr-defined]
+    root._cell_h = cell_h  # type: ignore[attr-defined]
+    ctx = TkRenderContext(root, canvas, cols, rows, cell_w, cell_h, font=fnt)
+    events = TkEventStream(root)
+    address, tile = str(settings.wall_address), int(settings.wall_tile)
+    link: Optional[WorkerLink] = None
+    next_connect = 0.0
+
+    def tick() -> None:
+        nonlocal link, next_connect
+        if link is None or not link.connected:
+            if link is not None and link.error:
+                print(f"[wall] {link.error}")
+                root.destroy()
+                return
+            if time.monotonic() >= next_connect:
+                link = _connect(address, tile, cols, rows)
+                next_connect = time.monotonic() + RECONNECT_DELAY
+        for ev in events.poll():
+            if isinstance(ev, KeyEvent):
+                if ev.key in ("q", "Q"):
+                    root.destroy()
+                    return
+                if link is not None:
+                    link.send({"key": ev.key})
+            elif isinstance(ev, MouseEvent) and link is not None:
+                # Tk reports clicks only; send press and release
+                link.send({"mouse": [ev.x, ev.y, 1]})
+                link.send({"mouse": [ev.x, ev.y, 0]})
+        if link is not None:
+            for msg in link.drain(0.0):
+                if msg.get("full"):
+                    ctx.clear()
+                for y, x, colour, text in msg.get("runs", ()):
+                    ctx.print_at(text, x, y, colour)
+            ctx.flush()
+        root.after(5, tick)
+
+    root.after(0, tick)
+    try:
+        root.mainloop()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if link is not None:
+            link.close()
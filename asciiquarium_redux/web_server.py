@@ -1,24 +1,269 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import http.server
-import os
 import json
-import socketserver
+import mimetypes
+import os
+import re
+import shutil
+import threading
 import webbrowser
+from dataclasses import dataclass, field
+from email.utils import formatdate
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Text-like assets worth precompressing; wheels, PNGs and wasm modules are already compressed
+_COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".json", ".webmanifest", ".svg", ".txt", ".map"}
+# Only names carrying a content hash never change under the same URL; local dev wheels are
+# rebuilt under the same version, so they are revalidated like everything else
+_IMMUTABLE_RE = re.compile(r"-[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+# ETag suffix per Content-Encoding, so caches never pair a compressed body with the identity tag
+_ETAG_SUFFIXES = {"gzip": "gz", "br": "br"}
+_COPY_CHUNK = 1 << 20
+
+
+def _guess_type(path: Any) -> str:
+    name = str(path)
+    if name.endswith('.wasm'):
+        return 'application/wasm'
+    if name.endswith('.whl'):
+        return 'application/octet-stream'
+    if name.endswith('.webmanifest'):
+        return 'application/manifest+json'
+    typ, _ = mimetypes.guess_type(name)
+    return typ or 'application/octet-stream'
+
+
+@dataclass
+class _Asset:
+    path: Path
+    size: int
+    mtime_ns: int
+    etag: str
+    content_type: str
+    immutable: bool
+    # Precompressed bodies by Content-Encoding ("br", "gzip")
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Strong ETag of the representation sent with the given Content-Encoding (None = identity)."""
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{_ETAG_SUFFIXES[encoding]}"'
+
 
+class _AssetCache:
+    """Stat-validated metadata, strong ETags and precompressed variants per file."""
 
-from typing import Any
+    def __init__(self) -> None:
+        self._assets: Dict[Path, _Asset] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> Optional[_Asset]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            asset = self._assets.get(path)
+            if asset is not None and asset.mtime_ns == st.st_mtime_ns and asset.size == st.st_size:
+                return asset
+        asset = self._build(path, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            self._assets[path] = asset
+        return asset
+
+    def warm(self, root: Path) -> int:
+        """Build entries (and compressed variants) for every file under root; returns the count."""
+        n = 0
+        for p in root.rglob("*"):
+            if p.is_file() and self.get(p) is not None:
+                n += 1
+        return n
+
+    def _build(self, path: Path, size: int, mtime_ns: int) -> _Asset:
+        h = hashlib.sha256()
+        compress = path.suffix.lower() in _COMPRESSIBLE_SUFFIXES
+        data = b""
+        with path.open("rb") as fh:
+            if compress:
+                data = fh.read()
+                h.update(data)
+            else:
+                for chunk in iter(lambda: fh.read(_COPY_CHUNK), b""):
+                    h.update(chunk)
+        asset = _Asset(
+            path=path,
+            size=size,
+            mtime_ns=mtime_ns,
+            etag=f'"{h.hexdigest()[:32]}"',
+            content_type=_guess_type(path),
+            immutable=bool(_IMMUTABLE_RE.search(path.name)),
+        )
+        if compress and size >= 256:
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gz) < size:
+                asset.variants["gzip"] = gz
+            try:
+                import brotli  # type: ignore
+
+                br = brotli.compress(data, quality=11)
+                if len(br) < size:
+                    asset.variants["br"] = br
+            except Exception:
+                pass  # brotli is optional
+        return asset
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single "bytes=" range into inclusive (start, end); None if unsupported or unsatisfiable."""
+    m = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header)
+    if not m or (not m.group(1) and not m.group(2)):
+        return None
+    if m.group(1):
+        start = int(m.group(1))
+        end = int(m.group(2)) if m.group(2) else size - 1
+    else:
+        # Suffix range: last N bytes
+        start = max(0, size - int(m.group(2)))
+        end = size - 1
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        return None
+    return start, end
 
 
 class _WasmHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive lets kiosks reuse connections for the handful of assets
+    protocol_version = "HTTP/1.1"
+    assets: _AssetCache
+
     def guess_type(self, path: Any):
-        typ = super().guess_type(path)
-        if str(path).endswith('.wasm'):
-            return 'application/wasm'
-        if str(path).endswith('.whl'):
-            return 'application/octet-stream'
-        return typ
+        return _guess_type(path)
+
+    def do_GET(self) -> None:
+        self._serve(head_only=False)
+
+    def do_HEAD(self) -> None:
+        self._serve(head_only=True)
+
+    def _serve(self, head_only: bool) -> None:
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            if not self.path.split("?", 1)[0].endswith("/"):
+                # Let the stock handler issue the trailing-slash redirect
+                f = self.send_head()
+                if f:
+                    f.close()
+                return
+            path = path / "index.html"
+        asset = self.assets.get(path) if path.is_file() else None
+        if asset is None:
+            self.send_error(404, "File not found")
+            return
+
+        cache_control = "public, max-age=31536000, immutable" if asset.immutable else "no-cache"
+        # Byte ranges are served from the identity body; If-Range falls back to a full response on mismatch
+        rng = self.headers.get("Range")
+        if rng and self.headers.get("If-Range") not in (None, asset.etag):
+            rng = None
+        encoding = None if rng else self._pick_encoding(asset)
+        etag = asset.etag_for(encoding)
+
+        inm = self.headers.get("If-None-Match")
+        if inm and (inm.strip() == "*" or etag in [t.strip() for t in inm.split(",")]):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            if asset.variants:
+                self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if rng:
+            span = _parse_range(rng, asset.size)
+            if span is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{asset.size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = span
+            self.send_response(206)
+            self._common_headers(asset, etag, cache_control)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{asset.size}")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            if not head_only:
+                self._copy_file(asset.path, start, end - start + 1)
+            return
+
+        self.send_response(200)
+        self._common_headers(asset, etag, cache_control)
+        if encoding is not None:
+            body = asset.variants[encoding]
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if not head_only:
+                self.wfile.write(body)
+            return
+        self.send_header("Content-Length", str(asset.size))
+        self.end_headers()
+        if not head_only:
+            self._copy_file(asset.path, 0, asset.size)
+
+    def _common_headers(self, asset: _Asset, etag: str, cache_control: str) -> None:
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(asset.mtime_ns / 1e9, usegmt=True))
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Accept-Ranges", "bytes")
+        if asset.variants:
+            self.send_header("Vary", "Accept-Encoding")
+
+    def _pick_encoding(self, asset: _Asset) -> Optional[str]:
+        if not asset.variants:
+            return None
+        accepted = {}
+        for part in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = part.strip().partition(";")
+            q = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    q = float(params.strip()[2:])
+                except ValueError:
+                    q = 0.0
+            if name:
+                accepted[name.lower()] = q
+        for enc in ("br", "gzip"):
+            if enc in asset.variants and accepted.get(enc, 0.0) > 0.0:
+                return enc
+        return None
+
+    def _copy_file(self, path: Path, offset: int, length: int) -> None:
+        with path.open("rb") as fh:
+            fh.seek(offset)
+            remaining = length
+            while remaining > 0:
+                chunk = fh.read(min(_COPY_CHUNK, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+def _copy_streamed(src: Path, dst: Path) -> None:
+    """Copy src to dst in chunks via a temp file, keeping src's timestamps."""
+    tmp = dst.with_name(dst.name + ".tmp")
+    with src.open("rb") as fin, tmp.open("wb") as fout:
+        shutil.copyfileobj(fin, fout, _COPY_CHUNK)
+    shutil.copystat(str(src), str(tmp))
+    os.replace(tmp, dst)
 
 
 def serve_web(host: str = "127.0.0.1", port: int = 8000, open_browser: bool = True) -> None:
@@ -39,12 +284,9 @@ def serve_web(host: str = "127.0.0.1", port: int = 8000, open_browser: bool = Tr
                 try:
                     need_copy = (not target_alias.exists()) or (latest.stat().st_mtime_ns != target_alias.stat().st_mtime_ns)
                     if need_copy:
-                        data = latest.read_bytes()
-                        target_alias.write_bytes(data)
-                        target_named.write_bytes(data)
-                        # Preserve mtime fingerprint for quick change checks
-                        os.utime(str(target_alias), (latest.stat().st_atime, latest.stat().st_mtime))
-                        os.utime(str(target_named), (latest.stat().st_atime, latest.stat().st_mtime))
+                        # Stream the copies (wheels can be large) and preserve the mtime fingerprint
+                        _copy_streamed(latest, target_named)
+                        _copy_streamed(latest, target_alias)
                         # Write a simple manifest with the exact filename
                         manifest = {"wheel": latest.name}
                         (wheels_dir / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
@@ -57,16 +299,25 @@ def serve_web(host: str = "127.0.0.1", port: int = 8000, open_browser: bool = Tr
                 print("[web] No dist wheel found; run 'uv build' to enable local install in browser")
     except Exception:
         print("[web] Warning: exception while preparing local wheel; will continue without it")
+
     class Handler(_WasmHandler):
         def __init__(self, *args, **kwargs):
             super().__init__(*args, directory=str(root), **kwargs)
 
+    # ETags and gzip/brotli variants are built once up front, then revalidated by stat per request
+    Handler.assets = _AssetCache()
+    try:
+        Handler.assets.warm(root)
+    except Exception:
+        print("[web] Warning: failed to precompute asset cache; building lazily")
+
     # NOTE: if binding to 0.0.0.0 / :: (all interfaces), open the browser via localhost.
     browser_host = host
     if host in {"0.0.0.0", "::", ""}:
         browser_host = "127.0.0.1"
 
-    with socketserver.TCPServer((host, port), Handler) as httpd:
+    # One (daemon) thread per connection so a slow client cannot block the others
+    with http.server.ThreadingHTTPServer((host, port), Handler) as httpd:
         url = f"http://{browser_host}:{port}/"
         if open_browser:
             webbrowser.open(url)